@@ -0,0 +1,111 @@
+"""Benchmark the `read_csv` parser engines, and the engine picked by `engine="auto"`, for
+combinations of `PD_Input_File_CSV` options.
+
+    e.g.
+        python benchmarks/csv_engine_benchmark.py --rows 1000000 --repeat 3
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
+from bspec.processors.pd_read_csv.engine_selection import (
+    ENGINES,
+    read_csv_auto,
+    unsupported_options,
+)
+
+
+def write_csv(path: str, rows: int) -> None:
+    rng = np.random.default_rng(0)
+    pd.DataFrame(
+        {
+            "date": pd.date_range("2020-01-01", periods=rows, freq="min").strftime(
+                "%Y-%m-%d %H:%M:%S"
+            ),
+            "store": rng.integers(0, 1000, rows),
+            "category": rng.choice(["a", "b", "c", "d"], rows),
+            "sales": rng.random(rows) * 1000,
+            "units": rng.integers(0, 100, rows),
+        }
+    ).to_csv(path, index=False)
+
+
+def option_combinations(path: str) -> Dict[str, Dict[str, Any]]:
+    component_defaults = vars(PD_Input_File_CSV(filepath_or_buffer=path))
+    return {
+        "component defaults": component_defaults,
+        "no date inference": {
+            **component_defaults,
+            "parse_dates": False,
+            "infer_datetime_format": False,
+        },
+        "read_csv defaults": {"filepath_or_buffer": path},
+        "parse_dates=['date']": {"filepath_or_buffer": path, "parse_dates": ["date"]},
+        "regex delimiter": {"filepath_or_buffer": path, "delimiter": r",\s*"},
+        "skipfooter=1": {"filepath_or_buffer": path, "skipfooter": 1},
+    }
+
+
+def best_time(read: Callable[[], Any], repeat: int) -> float:
+    times: List[float] = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        read()
+        times.append(time.perf_counter() - start_time)
+    return min(times)
+
+
+def benchmark(rows: int, repeat: int, path: Optional[str] = None) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = path or os.path.join(directory, "benchmark.csv")
+        if not os.path.isfile(path):
+            write_csv(path, rows)
+
+        print(
+            f"{'options':<22}" + "".join(f"{e:>10}" for e in ENGINES) + f"{'auto':>18}"
+        )
+        for name, kwargs in option_combinations(path).items():
+            cells: Dict[str, str] = {}
+            python_seconds: Optional[float] = None
+            for engine in ENGINES:
+                if engine != "python" and unsupported_options(engine, kwargs):
+                    cells[engine] = "n/a"
+                    continue
+                try:
+                    seconds = best_time(
+                        lambda: pd.read_csv(**{**kwargs, "engine": engine}), repeat
+                    )
+                except Exception:
+                    cells[engine] = "failed"
+                    continue
+                if engine == "python":
+                    python_seconds = seconds
+                cells[engine] = f"{seconds:.3f}s"
+            row = f"{name:<22}" + "".join(f"{cells[engine]:>10}" for engine in ENGINES)
+
+            selected: List[str] = []
+
+            def read_auto():
+                _, engine, _ = read_csv_auto(kwargs)
+                selected.append(engine)
+
+            seconds = best_time(read_auto, repeat)
+            speedup = f" x{python_seconds / seconds:.1f}" if python_seconds else ""
+            row += f"{selected[-1] + speedup:>18}"
+            print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--path", help="benchmark an existing CSV instead")
+    arguments = parser.parse_args()
+    benchmark(arguments.rows, arguments.repeat, arguments.path)
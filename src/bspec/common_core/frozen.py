@@ -0,0 +1,38 @@
+"""Freeze JSON like config into read only structures that can be shared safely, and thaw
+them back into mutable copies."""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dictionaries to read only `MappingProxyType` views and lists
+    to tuples.
+
+    Args:
+        value (Any): JSON like data
+
+    Returns:
+        Any: the read only equivalent of `value`
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively copy frozen, or mutable, data into new dictionaries and lists.
+
+    Args:
+        value (Any): JSON like data, frozen or not
+
+    Returns:
+        Any: a mutable deep copy of `value`
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
@@ -0,0 +1,178 @@
+"""A shared registry of module requirements, parsed once, with a preflight that installs
+every missing requirement of a set of plugins in a single pip call."""
+
+import importlib.util
+import os.path
+import subprocess
+import sys
+import threading
+from typing import Dict, Iterable, Optional, Set
+
+from bspec.common_core.read_module_requirements import read_module_requirements
+
+
+REQUIREMENTS_FILE = os.path.join("requirements", "module_requirements.txt")
+
+"""
+Import names of pip packages that can not be derived from the package name, by lower
+casing it and replacing `-` with `_`
+"""
+IMPORT_NAMES: Dict[str, str] = {
+    "beautifulsoup4": "bs4",
+    "pillow": "PIL",
+    "pyyaml": "yaml",
+    "scikit-learn": "sklearn",
+}
+
+
+def import_name(package_name: str) -> str:
+    """The top level module name a pip package is imported with.
+
+    Args:
+        package_name (str): the pip package name, e.g. `dash-bootstrap-components`
+
+    Returns:
+        str: the import name, e.g. `dash_bootstrap_components`
+    """
+    package_name = package_name.strip().lower()
+    return IMPORT_NAMES.get(package_name, package_name.replace("-", "_"))
+
+
+def plugin_requirements_path(plugin_name: str) -> Optional[str]:
+    """Find the `module_requirements.txt` of a plugin, without importing the plugin.
+
+    Args:
+        plugin_name (str): the dot notation name of the plugin module
+
+    Returns:
+        Optional[str]: the path of the requirements file, or `None` if there is not one
+    """
+    try:
+        spec = importlib.util.find_spec(plugin_name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None:
+        return None
+    path = os.path.join(os.path.dirname(spec.origin), REQUIREMENTS_FILE)
+    return path if os.path.isfile(path) else None
+
+
+class RequirementsRegistry:
+    """Parse every `module_requirements.txt` once, and resolve requirements with
+    `importlib.util.find_spec` so nothing is imported to check if it is installed.
+
+    Thread safe, so worlds can be created concurrently.
+    """
+
+    def __init__(self):
+        self._requirements: Dict[str, Dict[str, Optional[str]]] = {}
+        self._installed: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def read(self, requirements_path: str) -> Dict[str, Optional[str]]:
+        """`read_module_requirements`, parsing each file only on first use.
+
+        Args:
+            requirements_path (str): the path of a `module_requirements.txt`
+
+        Returns:
+            Dict[str, Optional[str]]: {package name: pinned version or `None`}
+        """
+        requirements_path = os.path.abspath(requirements_path)
+        with self._lock:
+            requirements = self._requirements.get(requirements_path)
+            if requirements is None:
+                requirements = self._requirements[
+                    requirements_path
+                ] = read_module_requirements(requirements_path)
+            return requirements
+
+    def plugin_requirements(self, plugins: Iterable[str]) -> Dict[str, Optional[str]]:
+        """The combined requirements of the plugins, without importing them.
+
+        Args:
+            plugins (Iterable[str]): the dot notation names of the plugin modules
+
+        Returns:
+            Dict[str, Optional[str]]: {package name: pinned version or `None`}
+        """
+        requirements: Dict[str, Optional[str]] = {}
+        for plugin_name in plugins:
+            requirements_path = plugin_requirements_path(plugin_name)
+            if requirements_path is None:
+                continue
+            for package_name, version in self.read(requirements_path).items():
+                if requirements.get(package_name) is None:
+                    requirements[package_name] = version
+        return requirements
+
+    def missing(
+        self, requirements: Dict[str, Optional[str]]
+    ) -> Dict[str, Optional[str]]:
+        """The requirements whose module can not be found.
+
+        Args:
+            requirements (Dict[str, Optional[str]]): {package name: version or `None`}
+
+        Returns:
+            Dict[str, Optional[str]]: the missing subset of `requirements`
+        """
+        missing: Dict[str, Optional[str]] = {}
+        with self._lock:
+            for package_name, version in requirements.items():
+                module_name = import_name(package_name)
+                if module_name in self._installed:
+                    continue
+                if importlib.util.find_spec(module_name) is None:
+                    missing[package_name] = version
+                else:
+                    self._installed.add(module_name)
+        return missing
+
+    def install(self, requirements: Dict[str, Optional[str]]) -> None:
+        """Install the requirements with a single pip call.
+
+        Args:
+            requirements (Dict[str, Optional[str]]): {package name: version or `None`}
+
+        Raises:
+            ImportError: the install failed, with the pip command to run manually
+        """
+        if not requirements:
+            return
+
+        packages = [
+            package_name if version is None else f"{package_name}=={version}"
+            for package_name, version in requirements.items()
+        ]
+        print(f"Missing modules: {packages}, attempting to install them dynamically")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+        except subprocess.CalledProcessError as e:
+            raise ImportError(
+                f"{e}: the modules `{packages}` are required to run this code. We could not automatically install the dependencies, please run: `pip install {' '.join(packages)}` on the terminal in your environment to install the dependencies."
+            )
+        importlib.invalidate_caches()
+        with self._lock:
+            self._installed.update(import_name(package) for package in requirements)
+
+    def preflight(self, plugins: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Install every missing requirement of the plugins in one batch, before the
+        plugins are imported.
+
+        Args:
+            plugins (Iterable[str]): the dot notation names of the plugin modules
+
+        Returns:
+            Dict[str, Optional[str]]: the requirements that were installed
+        """
+        with self._lock:
+            missing = self.missing(self.plugin_requirements(plugins))
+            self.install(missing)
+        return missing
+
+
+"""
+The registry shared by every plugin module and the `universe`
+"""
+requirements_registry = RequirementsRegistry()
@@ -4,6 +4,8 @@ from typing import Dict, Any, Callable
 
 from dataclasses import dataclass as component
 
+from bspec.common_core.frozen import thaw
+
 
 """
 Dictionary of functions defined by the key 'component_name' within a 
@@ -50,7 +52,9 @@ def create(arguments: Dict[str, Any]) -> component:
     """
     args_copy = arguments.copy()
     name = args_copy.pop("component_name")
-    args_copy = args_copy.get("component_properties", {})
+    # Thaw into a mutable deep copy, the config may be read only and shared between
+    # the worlds of the same pipeline, and components are free to mutate their properties
+    args_copy = thaw(args_copy.get("component_properties", {}))
 
     try:
         creator_func = component_creation_funcs[name]
@@ -0,0 +1,305 @@
+"""A lazy plan of the `PD_DataFrames` steps of a tick: lazy processors add logical steps
+instead of running them, and the plan is optimized and executed in one pass at the end
+of the tick, or as soon as a processor that is not lazy uses a slot it writes."""
+
+import sys
+import os.path
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames, release_slots
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+####################################
+#  Import Required System Modules: #
+####################################
+try:
+    import pandas as pd  # noqa: E402
+except ImportError:
+    module_name = "pandas"
+    dynamic_module_install(module_name, requirements_dict)
+    import pandas as pd  # noqa: E402
+
+
+@dataclass
+class PlanStep:
+    """A logical step of a `LazyPlan`
+
+    Params:
+        name (str): the processor that added the step, e.g. "pd_dropna"
+
+        target (str): the slot the step writes
+
+        run (Callable[..., Any]): a step with a `source` is called with the source
+                    dataframe and returns the target dataframe. A scan, without a
+                    `source`, is called with the columns to read, `None` for every
+                    column, and a function to apply to each chunk it reads, `None` to
+                    read the whole input at once
+
+        source (Optional[str]): the slot the step reads, `None` for a scan
+
+        reads (Optional[Sequence[str]]): the columns of the source the step reads,
+                    `None` if it reads every column
+
+        passes_columns (bool): the step keeps the columns of the source, e.g. a row
+                    filter, so the columns read downstream are read from the source
+                    too
+
+        row_wise (bool): each row of the target only depends on the same row of the
+                    source, so the step can run chunk by chunk inside a scan
+
+        consumes (Sequence[str]): the slots emptied after the step
+    """
+
+    name: str
+    target: str
+    run: Callable[..., Any]
+    source: Optional[str] = None
+    reads: Optional[Sequence[str]] = None
+    passes_columns: bool = False
+    row_wise: bool = False
+    consumes: Sequence[str] = field(default_factory=tuple)
+
+    def source_columns(self, target_columns: Optional[Set[str]]) -> Optional[Set[str]]:
+        """The columns of the source needed to write `target_columns` of the target,
+        `None` for every column."""
+        if self.reads is None:
+            return None
+        if not self.passes_columns:
+            return set(self.reads)
+        if target_columns is None:
+            return None
+        return target_columns | set(self.reads)
+
+
+class PendingFrame:
+    """Stands in for the dataframe a `LazyPlan` step writes to a slot, until the plan is
+    executed. Getting an attribute of it, indexing, `len` and iterating over it execute
+    the plan and act on the dataframe, so processors that only call dataframe methods
+    see the same dataframe they would without a plan.
+
+    Anything else, e.g. `isinstance`, operators or `pd.concat`, sees the stand-in, so
+    processors read slots a lazy step may write with `slot_frame`, which executes the
+    plan first, or call `materialize`.
+
+    Args:
+        pd_dataframes (PD_DataFrames): the component holding the plan
+
+        slot (str): the slot the step writes
+    """
+
+    def __init__(self, pd_dataframes: PD_DataFrames, slot: str):
+        self._pd_dataframes = pd_dataframes
+        self._slot = slot
+        self._frame: Optional[Any] = None
+
+    def materialize(self) -> Any:
+        """Execute the plan, if it is still pending, and return the dataframe."""
+        if self._frame is None:
+            execute_plan(self._pd_dataframes)
+            self._frame = getattr(self._pd_dataframes, self._slot)
+        return self._frame
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.materialize(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.materialize()[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.materialize()[key] = value
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __repr__(self) -> str:
+        return f"PendingFrame({self._slot})"
+
+
+class LazyPlan:
+    """The steps added by lazy processors to a `PD_DataFrames` during a tick.
+
+    Executing the plan:
+        * pushes the columns read downstream into the scan, so only those are parsed,
+          unless a step reads every column, e.g. `dropna` without a `subset`
+        * fuses the row wise steps that follow a scan into it, each chunk is filtered
+          as it is read so the unfiltered dataframe is never held in full, as long as
+          nothing else reads the slot the scan writes
+        * skips the intermediate dataframes overwritten or consumed within the plan
+
+    Params:
+        steps (List[PlanStep]): the steps, in the order they were added
+
+        inputs (Dict[str, Any]): {slot: dataframe} the slots read by the plan before a
+                    step writes them, as they were when the reading step was added
+    """
+
+    def __init__(self):
+        self.steps: List[PlanStep] = []
+        self.inputs: Dict[str, Any] = {}
+        self._placeholders: Dict[str, PendingFrame] = {}
+
+    def __repr__(self) -> str:
+        return f"LazyPlan({[step.name for step in self.steps]})"
+
+    def add(self, pd_dataframes: PD_DataFrames, step: PlanStep) -> None:
+        """Add a step, leaving a `PendingFrame` in its target slot and emptying the
+        slots it consumes, as the step would have done.
+
+        Args:
+            pd_dataframes (PD_DataFrames): the component the plan belongs to
+
+            step (PlanStep): the step
+        """
+        written = {planned.target for planned in self.steps}
+        if (
+            step.source is not None
+            and step.source not in written
+            and step.source not in self.inputs
+        ):
+            self.inputs[step.source] = getattr(pd_dataframes, step.source)
+        self.steps.append(step)
+
+        placeholder = PendingFrame(pd_dataframes, step.target)
+        setattr(pd_dataframes, step.target, placeholder)
+        pd_dataframes.fingerprints.pop(step.target, None)
+        self._placeholders[step.target] = placeholder
+        for slot in step.consumes:
+            self._placeholders.pop(slot, None)
+        release_slots(pd_dataframes, step.consumes)
+
+    def projections(self) -> List[Optional[Set[str]]]:
+        """The columns of its target each step needs to write, `None` for every
+        column, from the columns the steps after it read."""
+        # The slots a step does not write later are read by anyone, unless consumed
+        needed: Dict[str, Optional[Set[str]]] = {}
+        projections: List[Optional[Set[str]]] = [None] * len(self.steps)
+        for index in range(len(self.steps) - 1, -1, -1):
+            step = self.steps[index]
+            for slot in step.consumes:
+                needed[slot] = set()
+            projections[index] = needed.get(step.target)
+            # What the slot held before the step is overwritten
+            needed[step.target] = set()
+            if step.source is not None:
+                source_columns = step.source_columns(projections[index])
+                read_later = needed.get(step.source)
+                needed[step.source] = (
+                    None
+                    if source_columns is None or read_later is None
+                    else read_later | source_columns
+                )
+        return projections
+
+    def _fused(self, index: int) -> List[PlanStep]:
+        """The row wise steps that can run inside the scan at `index`, each reads the
+        slot the one before writes, and nothing else reads it."""
+        fused: List[PlanStep] = []
+        slot = self.steps[index].target
+        for step in self.steps[index + 1 :]:
+            if not step.row_wise or step.source != slot:
+                break
+            if step.target != slot and slot not in step.consumes:
+                break
+            fused.append(step)
+            slot = step.target
+        return fused
+
+    def explain(self) -> List[str]:
+        """The steps as they will be executed, for debugging."""
+        projections = self.projections()
+        lines: List[str] = []
+        index = 0
+        while index < len(self.steps):
+            step = self.steps[index]
+            line = f"{step.name}: {step.source or 'scan'} -> {step.target}"
+            if step.source is None:
+                columns = projections[index]
+                if columns:
+                    line += f" columns={sorted(columns)}"
+                fused = self._fused(index)
+                if fused:
+                    line += f" fused=[{', '.join(each.name for each in fused)}]"
+                    index += len(fused)
+            lines.append(line)
+            index += 1
+        return lines
+
+    def execute(self, pd_dataframes: PD_DataFrames) -> None:
+        """Run the steps, and write the slots that are left at the end of the plan.
+
+        Args:
+            pd_dataframes (PD_DataFrames): the component the plan belongs to
+        """
+        projections = self.projections()
+        values: Dict[str, Any] = dict(self.inputs)
+        index = 0
+        while index < len(self.steps):
+            step = self.steps[index]
+            if step.source is not None:
+                values[step.target] = step.run(values[step.source])
+                for slot in step.consumes:
+                    values.pop(slot, None)
+                index += 1
+                continue
+
+            fused = self._fused(index)
+            columns = projections[index]
+
+            def chunk(frame: Any, fused: List[PlanStep] = fused) -> Any:
+                for fused_step in fused:
+                    frame = fused_step.run(frame)
+                return frame
+
+            frame = step.run(
+                sorted(columns) if columns else None, chunk if fused else None
+            )
+            values[step.target] = frame
+            for fused_step in fused:
+                values[fused_step.target] = frame
+                for slot in fused_step.consumes:
+                    values.pop(slot, None)
+            index += len(fused) + 1
+
+        for slot, placeholder in self._placeholders.items():
+            # Unless a processor that is not lazy replaced it since
+            if getattr(pd_dataframes, slot) is placeholder:
+                setattr(pd_dataframes, slot, values.get(slot, pd.DataFrame()))
+
+
+def plan_of(pd_dataframes: PD_DataFrames) -> LazyPlan:
+    """The plan of the tick, started by the first lazy step."""
+    if pd_dataframes.plan is None:
+        pd_dataframes.plan = LazyPlan()
+    return pd_dataframes.plan
+
+
+def execute_plan(pd_dataframes: PD_DataFrames) -> None:
+    """Execute the plan of a `PD_DataFrames`, if it has one."""
+    plan, pd_dataframes.plan = pd_dataframes.plan, None
+    if plan is not None:
+        plan.execute(pd_dataframes)
+
+
+def execute_plans(world: Any) -> None:
+    """Execute the plans of every `PD_DataFrames` in a world, at the end of its tick."""
+    for _, pd_dataframes in world.get_component(PD_DataFrames):
+        execute_plan(pd_dataframes)
@@ -1,13 +1,24 @@
 import sys
 import os.path
+import contextlib
 from dataclasses import dataclass as component
 import dataclasses
-from typing import Dict, List, TypeVar
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from deprecated.sphinx import versionadded
 
 from bspec.components import component_factory
-from bspec.common_core.read_module_requirements import read_module_requirements
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.common_core.dynamic_module_install import dynamic_module_install
 
 ###########################################################################
@@ -21,7 +32,7 @@ else:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
-requirements_dict = read_module_requirements(requirements_path)
+requirements_dict = requirements_registry.read(requirements_path)
 
 ####################################
 #  Import Required System Modules: #
@@ -33,8 +44,82 @@ except ImportError:
     dynamic_module_install(module_name, requirements_dict)
     import pandas as pd  # noqa: E402
 
+import numpy as np  # noqa: E402
+
 PandasDataFrame = TypeVar("pandas.core.frame.DataFrame")
 
+
+def copy_on_write_available() -> bool:
+    """Whether pandas has copy-on-write, from pandas 1.5."""
+    try:
+        pd.get_option("mode.copy_on_write")
+    except KeyError:
+        # `OptionError`, the option does not exist before pandas 1.5
+        return False
+    return True
+
+
+def copy_on_write(enabled: bool = True) -> ContextManager:
+    """A scope in which pandas copy-on-write is on, so a dataframe derived from a slot
+    shares its buffers, and a column is only copied when one of them writes to it.
+
+    The option is only changed within the scope, not for the rest of the process.
+    Derived dataframes keep sharing buffers after the scope, so they should only be
+    written to by processors that run with `copy_on_write` as well.
+
+    Args:
+        enabled (bool, optional): turn copy-on-write on, otherwise leave the options
+                    as they are. Defaults to True.
+
+    Returns:
+        ContextManager: the scope
+    """
+    if not enabled or not copy_on_write_available():
+        return contextlib.nullcontext()
+    return pd.option_context("mode.copy_on_write", True)
+
+
+class DataFrameStream:
+    """Hand out the chunks of a chunked read (e.g. a `read_csv` `TextFileReader`) one at
+    a time, reading one chunk ahead so the stream knows when it is drained.
+
+    Args:
+        chunks (Iterator[PandasDataFrame]): the chunks to stream
+
+    Params:
+        chunks_read (int): the number of chunks handed out so far
+    """
+
+    def __init__(self, chunks: Iterator[PandasDataFrame]):
+        self._chunks = chunks
+        self._next_chunk: Optional[PandasDataFrame] = next(chunks, None)
+        self.chunks_read = 0
+        if self._next_chunk is None:
+            self.close()
+
+    @property
+    def drained(self) -> bool:
+        return self._next_chunk is None
+
+    def pull(self) -> PandasDataFrame:
+        """The next chunk, or an empty DataFrame if the stream is drained."""
+        chunk = self._next_chunk
+        if chunk is None:
+            return pd.DataFrame()
+        self.chunks_read += 1
+        self._next_chunk = next(self._chunks, None)
+        if self._next_chunk is None:
+            self.close()
+        return chunk
+
+    def close(self) -> None:
+        """Close the underlying reader, releasing its file handle."""
+        self._next_chunk = None
+        close = getattr(self._chunks, "close", None)
+        if callable(close):
+            close()
+
+
 #########################################
 #  Define some PD_DataFrames Component: #
 #########################################
@@ -62,13 +147,119 @@ class PD_DataFrames:
                                     this allows for the agg function to be used
                                     e.g.
                                         df1.groupby('Category').agg({'costs':['sum','mean','std']})
+
+        stream (DataFrameStream, optional): The chunks still to be read, while a chunked read is
+                                    streaming one chunk per tick into dataframe_1, `None` once
+                                    the stream is drained
+
+        fingerprints (Dict[str, Tuple]): {slot: (weak reference to the dataframe, step key)} the step
+                                    cache key of each slot written by a cached step, see
+                                    `step_cache.slot_fingerprint`
+
+        plan (LazyPlan, optional): The steps lazy processors added during this tick, executed at the
+                                    end of the tick, `None` when nothing is pending, see `lazy_plan`
+
+        backend (str): The dataframe library the `pd_*` processors run the steps of this entity on,
+                                    "pandas" or "polars", unless a processor sets its own `backend`.
+                                    The slots hold pandas dataframes either way, see `polars_backend`
     """
 
-    dataframe_1: PandasDataFrame = pd.DataFrame()
-    dataframe_2: PandasDataFrame = pd.DataFrame()
-    dataframe_3: PandasDataFrame = pd.DataFrame()
+    dataframe_1: PandasDataFrame = dataclasses.field(default_factory=pd.DataFrame)
+    dataframe_2: PandasDataFrame = dataclasses.field(default_factory=pd.DataFrame)
+    dataframe_3: PandasDataFrame = dataclasses.field(default_factory=pd.DataFrame)
     group_by_columns: List[str] = dataclasses.field(default_factory=list)
     agg_columns: Dict[str, List[str]] = dataclasses.field(default_factory=dict)
+    stream: Optional[DataFrameStream] = None
+    fingerprints: Dict[str, Tuple] = dataclasses.field(default_factory=dict)
+    plan: Optional[Any] = None
+    backend: str = "pandas"
+
+
+"""
+The dataframe slots of `PD_DataFrames`
+"""
+DATAFRAME_SLOTS = ("dataframe_1", "dataframe_2", "dataframe_3")
+
+
+def slot_frame(pd_dataframes: PD_DataFrames, slot: str) -> PandasDataFrame:
+    """The dataframe in a slot, executing the pending `LazyPlan` of the entity first
+    when a lazy step writes the slot, see `lazy_plan.PendingFrame`.
+
+    Args:
+        pd_dataframes (PD_DataFrames): the component
+
+        slot (str): e.g. "dataframe_1"
+
+    Returns:
+        PandasDataFrame: the dataframe in the slot
+    """
+    frame = getattr(pd_dataframes, slot)
+    # Looked up on the type, a dataframe column could be named `materialize`
+    materialize = getattr(type(frame), "materialize", None)
+    return frame if materialize is None else materialize(frame)
+
+
+def take_slot(pd_dataframes: PD_DataFrames, slot: str) -> PandasDataFrame:
+    """Move the dataframe out of a slot, leaving an empty dataframe, so the slot no
+    longer keeps it alive once the caller is done with it.
+
+    Args:
+        pd_dataframes (PD_DataFrames): the component
+
+        slot (str): e.g. "dataframe_1"
+
+    Returns:
+        PandasDataFrame: the dataframe that was in the slot
+    """
+    frame = getattr(pd_dataframes, slot)
+    setattr(pd_dataframes, slot, pd.DataFrame())
+    pd_dataframes.fingerprints.pop(slot, None)
+    return frame
+
+
+def release_slots(pd_dataframes: PD_DataFrames, slots: Sequence[str]) -> None:
+    """Empty the slots a processor consumes, see `take_slot`."""
+    for slot in slots:
+        take_slot(pd_dataframes, slot)
+
+
+def _root_buffer(values: Any) -> Any:
+    while isinstance(getattr(values, "base", None), np.ndarray):
+        values = values.base
+    return values
+
+
+def slot_memory(pd_dataframes: PD_DataFrames) -> Dict[str, int]:
+    """The bytes held by each dataframe slot, including object values, and in total.
+    A pending `LazyPlan` is executed first, see `slot_frame`.
+
+    Slots that share a buffer, e.g. under copy-on-write, each count it in their own
+    size, but `total` counts it once.
+
+    Args:
+        pd_dataframes (PD_DataFrames): the component
+
+    Returns:
+        Dict[str, int]: {slot: bytes, "total": bytes}
+    """
+    usage: Dict[str, int] = {}
+    buffers: Dict[int, Any] = {}
+    unshared = 0
+    for slot in DATAFRAME_SLOTS:
+        frame = slot_frame(pd_dataframes, slot)
+        if not isinstance(frame, pd.DataFrame):
+            usage[slot] = 0
+            continue
+        usage[slot] = int(frame.memory_usage(index=True, deep=True).sum())
+        unshared += int(frame.index.memory_usage(deep=True))
+        for _, column in frame.items():
+            if column.dtype.kind in "biufcmM":
+                root = _root_buffer(column.to_numpy(copy=False))
+                buffers[id(root)] = root
+            else:
+                unshared += int(column.memory_usage(index=False, deep=True))
+    usage["total"] = unshared + sum(int(root.nbytes) for root in buffers.values())
+    return usage
 
 
 def register() -> None:
@@ -0,0 +1,100 @@
+"""Run the steps of `PD_DataFrames` processors on Polars: the slots keep holding pandas
+dataframes, and columns cross to and from Polars through Arrow, sharing their buffers
+wherever Arrow can."""
+
+import sys
+import os.path
+from typing import Any, Optional, Sequence, Tuple
+
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+"""
+The dataframe libraries the `pd_*` processors can run their steps on
+"""
+BACKENDS = ("pandas", "polars")
+
+
+def import_polars():
+    """polars is only required once a processor runs on the "polars" backend."""
+    try:
+        import polars  # noqa: E402
+    except ImportError:
+        module_name = "polars"
+        dynamic_module_install(module_name, requirements_dict)
+        import polars  # noqa: E402
+    return polars
+
+
+def backend_of(backend: Optional[str], pd_dataframes: Any) -> str:
+    """The backend a processor runs a step of an entity on: its own `backend` argument,
+    or else the `backend` of the entity's `PD_DataFrames`.
+
+    Args:
+        backend (Optional[str]): the `backend` argument of the processor
+
+        pd_dataframes (PD_DataFrames): the component of the entity
+
+    Raises:
+        ValueError: an unknown backend
+
+    Returns:
+        str: "pandas" or "polars"
+    """
+    backend = backend or pd_dataframes.backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: '{backend!r}', expected one of {BACKENDS}")
+    return backend
+
+
+def polars_errors() -> Tuple[type, ...]:
+    """The errors of a step Polars can not run the way pandas does, e.g. object columns
+    Arrow can not convert, after which the step runs on pandas instead."""
+    pl = import_polars()
+    return (TypeError, ValueError, NotImplementedError, pl.exceptions.PolarsError)
+
+
+def to_polars(frame: Any, columns: Optional[Sequence[Any]] = None) -> Any:
+    """A pandas dataframe, or some of its columns, as a Polars dataframe, without the
+    index. Numeric columns share their buffers, and NaN is converted to null, as
+    pandas treats both as missing.
+
+    Args:
+        frame (Any): the pandas dataframe
+
+        columns (Optional[Sequence[Any]]): the columns to convert, `None` for every
+                    column
+
+    Returns:
+        Any: the Polars dataframe
+    """
+    pl = import_polars()
+    if columns is not None:
+        frame = frame[list(columns)]
+    return pl.from_pandas(frame, nan_to_null=True, include_index=False)
+
+
+def to_pandas(frame: Any) -> Any:
+    """A Polars dataframe as a pandas dataframe, through Arrow. Columns are not
+    consolidated into blocks, so numeric columns without nulls share their buffers.
+
+    Args:
+        frame (Any): the Polars dataframe
+
+    Returns:
+        Any: the pandas dataframe
+    """
+    return frame.to_arrow().to_pandas(split_blocks=True)
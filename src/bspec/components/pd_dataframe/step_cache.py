@@ -0,0 +1,383 @@
+"""A content addressed, on disk, cache of the `PD_DataFrames` slots a processor step
+writes, stored as Arrow IPC files that are memory mapped back on a hit."""
+
+import sys
+import os.path
+import os
+import hashlib
+import shutil
+import threading
+import weakref
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+####################################
+#  Import Required System Modules: #
+####################################
+try:
+    import pandas as pd  # noqa: E402
+except ImportError:
+    module_name = "pandas"
+    dynamic_module_install(module_name, requirements_dict)
+    import pandas as pd  # noqa: E402
+
+from bspec.components.pd_dataframe.pd_dataframes import slot_frame  # noqa: E402
+
+
+SLOT_EXTENSION = ".arrow"
+
+
+def _import_pyarrow():
+    """pyarrow is only required once a step cache is configured."""
+    try:
+        import pyarrow  # noqa: E402
+        import pyarrow.ipc  # noqa: E402
+    except ImportError:
+        module_name = "pyarrow"
+        dynamic_module_install(module_name, requirements_dict)
+        import pyarrow  # noqa: E402
+        import pyarrow.ipc  # noqa: E402
+    return pyarrow
+
+
+def step_key(processor_name: str, inputs: Any, settings: Mapping[str, Any]) -> str:
+    """The content address of a step: what it read, what it is, and how it is set.
+
+    Args:
+        processor_name (str): the name the processor is registered with
+
+        inputs (Any): the fingerprint of what the step reads, e.g. `files_fingerprint`
+                    or the `slot_fingerprint` of its input slot
+
+        settings (Mapping[str, Any]): the settings of the step, e.g.
+                    `vars(component)`
+
+    Returns:
+        str: a hex digest
+    """
+    settings_repr = repr(sorted((key, repr(value)) for key, value in settings.items()))
+    return hashlib.sha256(
+        repr((processor_name, inputs, settings_repr)).encode()
+    ).hexdigest()
+
+
+def files_fingerprint(filepaths: Sequence[Any]) -> Optional[Tuple]:
+    """Identify the contents of local files by their path, size and modification time.
+
+    Args:
+        filepaths (Sequence[Any]): the files
+
+    Returns:
+        Optional[Tuple]: ((path, size, mtime_ns), ...), or `None` if one is not a local
+                    file, e.g. a buffer or URL
+    """
+    fingerprint = []
+    for filepath in filepaths:
+        if not isinstance(filepath, (str, os.PathLike)):
+            return None
+        filepath = os.fspath(filepath)
+        if "://" in filepath or not os.path.isfile(filepath):
+            return None
+        stat = os.stat(filepath)
+        fingerprint.append((os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+def slot_fingerprint(pd_dataframes: Any, slot: str) -> Optional[str]:
+    """The step key of the dataframe in a `PD_DataFrames` slot, if the dataframe was
+    written by a cached step and has not been replaced since.
+
+    Args:
+        pd_dataframes (PD_DataFrames): the component
+
+        slot (str): e.g. "dataframe_1"
+
+    Returns:
+        Optional[str]: the step key, or `None` if it is not known
+    """
+    fingerprint = pd_dataframes.fingerprints.get(slot)
+    if fingerprint is None:
+        return None
+    frame_ref, key = fingerprint
+    if frame_ref() is not getattr(pd_dataframes, slot):
+        return None
+    return key
+
+
+def set_slot_fingerprint(pd_dataframes: Any, slot: str, key: Optional[str]) -> None:
+    """Record the step key of the dataframe now in a slot, `None` to forget it."""
+    frame = getattr(pd_dataframes, slot)
+    if key is None or frame is None:
+        pd_dataframes.fingerprints.pop(slot, None)
+    else:
+        pd_dataframes.fingerprints[slot] = (weakref.ref(frame), key)
+
+
+class StepCache:
+    """Slots of `PD_DataFrames` by step key, one directory per key holding an Arrow IPC
+    file per slot.
+
+    A hit memory maps the files and copies them into writable dataframes, unless the
+    cache is `zero_copy`. Entries are evicted, least recently used first, once the
+    cache grows over `max_bytes`.
+
+    Thread safe, so steps in parallel worlds can share a cache.
+
+    Args:
+        path (str): the cache directory
+
+        max_bytes (int, optional): the size the cache is kept under, unbounded if
+                    `None`
+
+        zero_copy (bool, optional): a hit leaves the columns without nulls as views
+                    of the mapped file, paged in on demand, rather than copies. The
+                    views are read only, so a step writing to a cached dataframe in
+                    place raises "assignment destination is read-only". Defaults to
+                    False.
+
+    Params:
+        hits (int): steps whose slots were read from the cache
+
+        misses (int): steps that ran, and were stored
+
+        evictions (int): entries removed to stay under `max_bytes`
+    """
+
+    def __init__(
+        self, path: str, max_bytes: Optional[int] = None, zero_copy: bool = False
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.zero_copy = zero_copy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._pa = _import_pyarrow()
+        os.makedirs(path, exist_ok=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key)
+
+    def get(
+        self, key: str, expected_slots: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """The slots stored for a step key.
+
+        Args:
+            key (str): see `step_key`
+
+            expected_slots (Optional[Sequence[str]]): the slots the step writes, an
+                        entry with other slots is stale, and removed as a miss
+
+        Returns:
+            Optional[Dict[str, Any]]: {slot: DataFrame}, or `None` on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            slot_files = {
+                file_name[: -len(SLOT_EXTENSION)]: file_name
+                for file_name in os.listdir(entry_path)
+                if file_name.endswith(SLOT_EXTENSION)
+            }
+            if expected_slots is not None and set(slot_files) != set(expected_slots):
+                # Stale, the step now writes other slots
+                shutil.rmtree(entry_path, ignore_errors=True)
+                return self._miss()
+
+            slots: Dict[str, Any] = {}
+            for slot, file_name in slot_files.items():
+                source = self._pa.memory_map(os.path.join(entry_path, file_name))
+                table = self._pa.ipc.open_file(source).read_all()
+                # Without `split_blocks` the columns are copied into writable blocks
+                slots[slot] = table.to_pandas(split_blocks=self.zero_copy)
+            # Most recently used
+            os.utime(entry_path)
+        except (FileNotFoundError, self._pa.ArrowInvalid):
+            return self._miss()
+        with self._lock:
+            self.hits += 1
+        return slots
+
+    def _miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, slots: Mapping[str, Any]) -> bool:
+        """Store the slots a step wrote.
+
+        Args:
+            key (str): see `step_key`
+
+            slots (Mapping[str, Any]): {slot: DataFrame}
+
+        Returns:
+            bool: stored, `False` if a slot is not a DataFrame, can not be converted to
+                        Arrow, or is larger than `max_bytes` on its own
+        """
+        temporary_path = os.path.join(
+            self.path, f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            os.makedirs(temporary_path, exist_ok=True)
+            for slot, frame in slots.items():
+                if not isinstance(frame, pd.DataFrame):
+                    return False
+                table = self._pa.Table.from_pandas(frame, preserve_index=True)
+                slot_path = os.path.join(temporary_path, slot + SLOT_EXTENSION)
+                with self._pa.OSFile(slot_path, "wb") as sink:
+                    with self._pa.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            if (
+                self.max_bytes is not None
+                and self._entry_size(temporary_path) > self.max_bytes
+            ):
+                return False
+            with self._lock:
+                if os.path.isdir(self._entry_path(key)):
+                    return True
+                os.replace(temporary_path, self._entry_path(key))
+                self._evict()
+            return True
+        except (self._pa.ArrowException, TypeError, ValueError):
+            return False
+        finally:
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+    def _entry_size(self, entry_path: str) -> int:
+        return sum(
+            os.path.getsize(os.path.join(entry_path, file_name))
+            for file_name in os.listdir(entry_path)
+        )
+
+    def size(self) -> int:
+        """The bytes stored, in every entry."""
+        return sum(
+            self._entry_size(entry.path)
+            for entry in os.scandir(self.path)
+            if entry.is_dir() and not entry.name.startswith(".")
+        )
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache is under
+        `max_bytes`."""
+        if self.max_bytes is None:
+            return
+        entries = sorted(
+            (entry.stat().st_mtime_ns, self._entry_size(entry.path), entry.path)
+            for entry in os.scandir(self.path)
+            if entry.is_dir() and not entry.name.startswith(".")
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """The hit, miss and eviction counters, and the bytes stored."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes": self.size(),
+        }
+
+
+def run_step(
+    cache: Optional[StepCache],
+    key: Optional[str],
+    pd_dataframes: Any,
+    slots: Sequence[str],
+    compute: Callable[[], None],
+) -> bool:
+    """Fill the slots a step writes from the cache, or run the step and store them.
+
+    Args:
+        cache (Optional[StepCache]): the cache, `None` to always run the step
+
+        key (Optional[str]): the step key, `None` when the input of the step is not
+                    known, which always runs the step
+
+        pd_dataframes (PD_DataFrames): the component the step writes
+
+        slots (Sequence[str]): the slots the step writes, e.g. ["dataframe_2"]
+
+        compute (Callable[[], None]): runs the step, writing the slots
+
+    Returns:
+        bool: the slots were read from the cache
+    """
+    if cache is None or key is None:
+        compute()
+        for slot in slots:
+            set_slot_fingerprint(pd_dataframes, slot, None)
+        return False
+
+    cached = cache.get(key, slots)
+    if cached is not None:
+        for slot in slots:
+            setattr(pd_dataframes, slot, cached[slot])
+            set_slot_fingerprint(pd_dataframes, slot, key)
+        return True
+
+    compute()
+    stored = cache.put(key, {slot: slot_frame(pd_dataframes, slot) for slot in slots})
+    for slot in slots:
+        set_slot_fingerprint(pd_dataframes, slot, key if stored else None)
+    return False
+
+
+_step_caches: Dict[str, StepCache] = {}
+_step_caches_lock = threading.Lock()
+
+
+def step_cache(config: Optional[Mapping[str, Any]]) -> Optional[StepCache]:
+    """The cache shared by every processor configured with the same cache directory.
+
+    Args:
+        config (Optional[Mapping[str, Any]]): the `step_cache` processor argument
+                    e.g.
+                        {"path": ".bspec_step_cache", "max_bytes": 1073741824}
+                    with an optional "zero_copy", see `StepCache`
+
+    Raises:
+        ValueError: the directory is already shared with a different "zero_copy"
+
+    Returns:
+        Optional[StepCache]: the cache, or `None` without a config
+    """
+    if not config:
+        return None
+    path = os.path.abspath(config["path"])
+    zero_copy = bool(config.get("zero_copy", False))
+    with _step_caches_lock:
+        cache = _step_caches.get(path)
+        if cache is None:
+            cache = _step_caches[path] = StepCache(
+                path, config.get("max_bytes"), zero_copy=zero_copy
+            )
+        elif cache.zero_copy != zero_copy:
+            raise ValueError(
+                f"The step cache `{path}` is shared with zero_copy={cache.zero_copy}, "
+                f"not zero_copy={zero_copy}"
+            )
+        return cache
@@ -11,7 +11,7 @@ from typing import (
 from deprecated.sphinx import versionadded
 
 from bspec.components import component_factory
-from bspec.common_core.read_module_requirements import read_module_requirements
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.common_core.dynamic_module_install import dynamic_module_install
 
 ###########################################################################
@@ -25,7 +25,7 @@ else:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
-requirements_dict = read_module_requirements(requirements_path)
+requirements_dict = requirements_registry.read(requirements_path)
 
 #######################################
 #  Import Required Component Modules: #
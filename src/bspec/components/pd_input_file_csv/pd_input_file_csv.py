@@ -8,17 +8,21 @@ from collections import (
 from typing import (
     Any,
     Callable,
+    Dict,
+    List,
     Literal,
+    Optional,
     Sequence,
     TypeVar,
     Union,
 )
 import csv
+import glob
 
 from deprecated.sphinx import versionadded
 
 from bspec.components import component_factory
-from bspec.common_core.read_module_requirements import read_module_requirements
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.common_core.dynamic_module_install import dynamic_module_install
 
 ###########################################################################
@@ -32,7 +36,7 @@ else:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
-requirements_dict = read_module_requirements(requirements_path)
+requirements_dict = requirements_registry.read(requirements_path)
 
 #######################################
 #  Import Required Component Modules: #
@@ -68,13 +72,15 @@ class PD_Input_File_CSV:
     """This allows for generic input parameters for CSV files to be imported using Pandas
 
     Params:
-        filepath_or_buffer (str, path object or file-like object):
+        filepath_or_buffer (str, path object, file-like object, or list of str):
                 Any valid string path is acceptable. The string could be a URL.
                 Valid URL schemes include http, ftp, s3, gs, and file. For file URLs, a host is expected.
                 A local file could be: file://localhost/path/to/table.csv.
                 If you want to pass in a path object, pandas accepts any os.PathLike.
                 By file-like object, we refer to objects with a read() method, such as a file handle
                 (e.g. via builtin open function) or StringIO.
+                A local glob pattern (e.g. "./data/2023-*/*.csv"), or a list of paths and patterns, reads
+                every matching file concurrently and concatenates them in sorted path (or list) order.
 
         delimiter (str, default ','):
                 Delimiter to use. If sep is None, the C engine cannot automatically detect the separator,
@@ -137,9 +143,11 @@ class PD_Input_File_CSV:
                 Use str or object together with suitable na_values settings to preserve and not interpret dtype.
                 If converters are specified, they will be applied INSTEAD of dtype conversion.
 
-        engine ({'c', 'python', 'pyarrow'}, optional):
+        engine ({'auto', 'c', 'python', 'pyarrow'}, default 'auto'):
                 Parser engine to use. The C and pyarrow engines are faster, while the python engine is currently
                 more feature-complete. Multithreading is currently only supported by the pyarrow engine.
+                'auto' picks the fastest engine that supports the other options, and falls back to the next
+                engine if one is rejected, e.g. a regex delimiter or `skipfooter` force the python engine.
 
         converters (dict, optional):
                 Dict of functions for converting values in certain columns. Keys can either be integers or column labels.
@@ -329,9 +337,37 @@ class PD_Input_File_CSV:
                 For HTTP(S) URLs the key-value pairs are forwarded to urllib.request.Request as header options.
                 For other URLs (e.g. starting with “s3://”, and “gcs://”) the key-value pairs are forwarded to
                 fsspec.open. Please see fsspec and urllib for more details, and for more examples on storage options refer here.
+
+        file_workers (int, optional):
+                Not passed to `read_csv`. The number of files read concurrently when `filepath_or_buffer` is a glob
+                pattern or a list, defaults to the `concurrent.futures` pool default. Unlike the `max_workers` of
+                `PD_Read_CSV`, the number of entities read at the same time, it only sizes the pool the files of this
+                entity are read on, and is not used when the universe shares its pools, see `PD_Read_CSV`.
+
+        executor ({'thread', 'process'}, default 'thread'):
+                Not passed to `read_csv`. Read multiple files on a thread pool, or on a process pool for parsers
+                that hold the GIL (e.g. the python engine). With the pools shared by the universe, the name of the
+                pool to read on, unless `PD_Read_CSV` has a `file_pool`.
+
+        show_progress (bool, default False):
+                Not passed to `read_csv`. Print each file, with its row count and read time, as it finishes.
+
+        schema_cache (bool or str, optional):
+                Not passed to `read_csv`. Cache the dtypes and date columns pandas infers for each local file, and
+                pass them as explicit `dtype` and `parse_dates` on later reads of the unchanged file, skipping
+                inference. A JSON file path persists the cache between runs, True keeps it in memory.
+
+        schema_categories (bool, default False):
+                Not passed to `read_csv`. With a `schema_cache`, read the object columns with few distinct values
+                as `category`.
+
+        incremental (bool, default False):
+                Not passed to `read_csv`. For a single local file that is appended to, parse only the lines appended
+                since the last tick, and append them to the rows read so far. The whole file is read again when
+                it is truncated, rotated or rewritten.
     """
 
-    filepath_or_buffer: Union[str, os.PathLike[str]]
+    filepath_or_buffer: Union[str, os.PathLike[str], List[str]]
     delimiter: Union[str, None] = None
     header: Union[int, Sequence[int], Literal["infer"], None] = "infer"
     names: Union[list[str], None] = None
@@ -346,7 +382,9 @@ class PD_Input_File_CSV:
         None,
     ] = None
     dtype: Union[DtypeArg, defaultdict, None] = None
-    engine: Union[Literal["c", "python", "pyarrow", "python-fwf"], None] = "python"
+    engine: Union[
+        Literal["auto", "c", "python", "pyarrow", "python-fwf"], None
+    ] = "auto"
     converters: dict[Union[int, str], Callable[[str], Any]] = None
     true_values: list[str] = None
     false_values: list[str] = None
@@ -392,6 +430,91 @@ class PD_Input_File_CSV:
     ] = "error"
     low_memory: bool = True
     memory_map: bool = False
+    file_workers: Union[int, None] = None
+    executor: Literal["thread", "process"] = "thread"
+    show_progress: bool = False
+    schema_cache: Union[bool, str, os.PathLike[str], None] = None
+    schema_categories: bool = False
+    incremental: bool = False
+
+
+"""
+Fields of `PD_Input_File_CSV` that configure how BSPEC reads, and are not passed to `read_csv`
+"""
+BSPEC_FIELDS = frozenset(
+    {
+        "file_workers",
+        "executor",
+        "show_progress",
+        "schema_cache",
+        "schema_categories",
+        "incremental",
+    }
+)
+
+
+"""
+`BSPEC_FIELDS` that only change how the files are read, not the dataframe that is read
+"""
+EXECUTION_FIELDS = frozenset({"file_workers", "executor", "show_progress"})
+
+
+def read_csv_kwargs(pd_input_file_csv: PD_Input_File_CSV) -> Dict[str, Any]:
+    """The `read_csv` keyword arguments of a `PD_Input_File_CSV` component.
+
+    Args:
+        pd_input_file_csv (PD_Input_File_CSV): the component
+
+    Returns:
+        Dict[str, Any]: every field, except the `BSPEC_FIELDS`
+    """
+    return {
+        key: value
+        for key, value in vars(pd_input_file_csv).items()
+        if key not in BSPEC_FIELDS
+    }
+
+
+def has_glob_magic(pattern: str) -> bool:
+    """Whether `pattern` has any of the wildcards `glob` expands: `*`, `?` or `[`."""
+    return any(character in pattern for character in "*?[")
+
+
+def expand_filepaths(filepath_or_buffer: Any) -> Optional[List[str]]:
+    """The files to read for a glob pattern, or a list of paths and patterns.
+
+    Args:
+        filepath_or_buffer (Any): the `filepath_or_buffer` of a `PD_Input_File_CSV`
+
+    Raises:
+        FileNotFoundError: a pattern matches no files
+
+    Returns:
+        Optional[List[str]]: the paths, patterns expanded in sorted order, or `None` for
+                    a single path, URL or buffer that is read as is
+    """
+    if isinstance(filepath_or_buffer, (list, tuple)):
+        patterns = list(filepath_or_buffer)
+    elif (
+        isinstance(filepath_or_buffer, str)
+        and "://" not in filepath_or_buffer
+        and has_glob_magic(filepath_or_buffer)
+    ):
+        patterns = [filepath_or_buffer]
+    else:
+        return None
+
+    filepaths: List[str] = []
+    for pattern in patterns:
+        pattern = os.fspath(pattern)
+        if "://" in pattern or not has_glob_magic(pattern):
+            filepaths.append(pattern)
+            continue
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if not matches:
+            raise FileNotFoundError(f"No files match the pattern: {pattern}")
+        filepaths.extend(matches)
+    return filepaths
 
 
 def register() -> None:
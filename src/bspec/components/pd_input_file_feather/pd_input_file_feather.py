@@ -0,0 +1,55 @@
+from dataclasses import dataclass as component
+from typing import Any, List, Optional, Union
+
+from deprecated.sphinx import versionadded
+
+from bspec.components import component_factory
+
+#################################################
+#  Define some PD_Input_File_Feather Component: #
+#################################################
+@versionadded(
+    version="0.1.11",
+    reason="This allows for generic input parameters for Feather (Arrow IPC) files to be imported using Pandas",
+)
+@component
+class PD_Input_File_Feather:
+    """This allows for generic input parameters for Feather (Arrow IPC) files to be imported using Pandas
+
+    Params:
+        path (str):
+                The path of a Feather (Arrow IPC) file, or a directory of Feather files (a dataset).
+                The string could be a URI supported by `pyarrow`, e.g. s3://bucket/path.
+
+        columns (list of str, optional):
+                Only read these columns (projection pushdown), the other column chunks are never read.
+
+        filters (list of lists, optional):
+                Only keep the rows matching these predicates (predicate pushdown), the record
+                batches are filtered while they are scanned, before a DataFrame is built.
+                Predicates are [column, op, value] with op one of
+                '==', '=', '>', '>=', '<', '<=', '!=', 'in', 'not in'.
+                A list of predicates is combined with AND, a list of lists of predicates is combined
+                with OR between the inner lists:
+                e.g.
+                    [["store", "==", 1], ["sales", ">", 100]]
+                    [[["store", "==", 1]], [["store", "==", 2]]]
+
+        memory_map (bool, default True):
+                Memory map a local file instead of reading it. Uncompressed Feather files are then
+                read without copying the file into memory.
+
+        use_threads (bool, default True):
+                Decode the columns on multiple threads.
+    """
+
+    path: str
+    columns: Optional[List[str]] = None
+    filters: Optional[List[Union[List[Any], List[List[Any]]]]] = None
+    memory_map: bool = True
+    use_threads: bool = True
+
+
+def register() -> None:
+    """use `component_factory` to register the `PD_Input_File_Feather` component as 'pd_input_file_feather'"""
+    component_factory.register("pd_input_file_feather", PD_Input_File_Feather)
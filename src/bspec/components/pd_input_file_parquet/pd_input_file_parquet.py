@@ -0,0 +1,60 @@
+from dataclasses import dataclass as component
+from typing import Any, Dict, List, Optional, Union
+
+from deprecated.sphinx import versionadded
+
+from bspec.components import component_factory
+
+#################################################
+#  Define some PD_Input_File_Parquet Component: #
+#################################################
+@versionadded(
+    version="0.1.11",
+    reason="This allows for generic input parameters for Parquet files to be imported using Pandas",
+)
+@component
+class PD_Input_File_Parquet:
+    """This allows for generic input parameters for Parquet files to be imported using Pandas
+
+    Params:
+        path (str):
+                The path of a Parquet file, or a directory of Parquet files (a dataset).
+                The string could be a URL, valid URL schemes include http, ftp, s3, gs, and file.
+
+        columns (list of str, optional):
+                Only read these columns (projection pushdown), the other column chunks are never read.
+
+        filters (list of lists, optional):
+                Only read the rows matching these predicates (predicate pushdown). Row groups whose
+                statistics can not match are skipped without being read.
+                Predicates are [column, op, value] with op one of
+                '==', '=', '>', '>=', '<', '<=', '!=', 'in', 'not in'.
+                A list of predicates is combined with AND, a list of lists of predicates is combined
+                with OR between the inner lists:
+                e.g.
+                    [["store", "==", 1], ["sales", ">", 100]]
+                    [[["store", "==", 1]], [["store", "==", 2]]]
+
+        memory_map (bool, default False):
+                Memory map a local file instead of reading it, which avoids a copy of the file in
+                memory when the data can be used as is.
+
+        use_threads (bool, default True):
+                Decode the columns on multiple threads.
+
+        storage_options (dict, optional):
+                Extra options for the storage connection, e.g. host, port, username and password,
+                for URLs.
+    """
+
+    path: str
+    columns: Optional[List[str]] = None
+    filters: Optional[List[Union[List[Any], List[List[Any]]]]] = None
+    memory_map: bool = False
+    use_threads: bool = True
+    storage_options: Optional[Dict[str, Any]] = None
+
+
+def register() -> None:
+    """use `component_factory` to register the `PD_Input_File_Parquet` component as 'pd_input_file_parquet'"""
+    component_factory.register("pd_input_file_parquet", PD_Input_File_Parquet)
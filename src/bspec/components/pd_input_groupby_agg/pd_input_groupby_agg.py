@@ -0,0 +1,59 @@
+from dataclasses import dataclass as component
+from typing import Literal, Optional
+
+from deprecated.sphinx import versionadded
+
+from bspec.components import component_factory
+
+################################################
+#  Define some PD_Input_GroupBy_Agg Component: #
+################################################
+@versionadded(
+    version="0.1.11",
+    reason="This allows for generic input parameters to group and aggregate Pandas dataframes",
+)
+@component
+class PD_Input_GroupBy_Agg:
+    """This allows for generic input parameters to group and aggregate Pandas dataframes,
+    by the `group_by_columns` and `agg_columns` of `PD_DataFrames`
+
+    Params:
+        source (str, default "dataframe_2"):
+                The `PD_DataFrames` slot to aggregate, by default the output of `pd_dropna` in a
+                read, dropna, groupby pipeline.
+
+        target ({'dataframe_2', 'dataframe_3'}, default 'dataframe_3'):
+                The `PD_DataFrames` slot the aggregation is written to, by default a slot no earlier
+                step of that pipeline writes.
+
+        sort (bool, default False):
+                Sort the groups. Unsorted groups are hashed, in the order they are first seen, which is faster.
+
+        observed (bool, default True):
+                Only the observed values of categorical group columns, instead of every combination of
+                categories.
+
+        dropna (bool, default True):
+                Drop groups whose key is missing.
+
+        as_index (bool, default True):
+                Index the aggregation by the group columns, otherwise keep them as columns.
+
+        chunksize (int, optional):
+                Aggregate the source in chunks of this many rows, merging partial results per group, so the
+                intermediate results of the whole source are never held at once. Streamed reads are always
+                aggregated a chunk per tick, and written to the target once the stream is drained.
+    """
+
+    source: str = "dataframe_2"
+    target: Literal["dataframe_2", "dataframe_3"] = "dataframe_3"
+    sort: bool = False
+    observed: bool = True
+    dropna: bool = True
+    as_index: bool = True
+    chunksize: Optional[int] = None
+
+
+def register() -> None:
+    """use `component_factory` to register the `PD_Input_GroupBy_Agg` component as 'pd_input_groupby_agg'"""
+    component_factory.register("pd_input_groupby_agg", PD_Input_GroupBy_Agg)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass as component
+import dataclasses
+from typing import List, Optional
+
+from deprecated.sphinx import versionadded
+
+from bspec.components import component_factory
+
+####################################################
+#  Define some PD_Input_Optimize_Dtypes Component: #
+####################################################
+@versionadded(
+    version="0.1.11",
+    reason="This allows for generic input parameters to shrink the dtypes of Pandas dataframes",
+)
+@component
+class PD_Input_Optimize_Dtypes:
+    """This allows for generic input parameters to shrink the dtypes of Pandas dataframes
+
+    Params:
+        slots (list of str, default ["dataframe_1"]):
+                The `PD_DataFrames` slots to optimize, in place.
+
+        exclude (list of str, default []):
+                Columns left as they are.
+
+        downcast_integers (bool, default True):
+                Downcast integer columns to the smallest integer type that holds their values.
+
+        unsigned (bool, default False):
+                Downcast integer columns without negative values to unsigned types. Off by default, as
+                subtracting unsigned values wraps around instead of going negative.
+
+        downcast_floats (bool, default True):
+                Downcast float64 columns to float32, only when every value round trips exactly.
+
+        categorical_ratio (float, default 0.5):
+                Convert object columns with at most this ratio of distinct values to rows to `category`.
+
+        max_categories (int, optional):
+                Only convert object columns with at most this many distinct values to `category`.
+
+        arrow_strings (bool, default False):
+                Convert the remaining object columns holding only strings to `string[pyarrow]`, requires
+                pyarrow.
+    """
+
+    slots: List[str] = dataclasses.field(default_factory=lambda: ["dataframe_1"])
+    exclude: List[str] = dataclasses.field(default_factory=list)
+    downcast_integers: bool = True
+    unsigned: bool = False
+    downcast_floats: bool = True
+    categorical_ratio: float = 0.5
+    max_categories: Optional[int] = None
+    arrow_strings: bool = False
+
+
+def register() -> None:
+    """use `component_factory` to register the `PD_Input_Optimize_Dtypes` component as 'pd_input_optimize_dtypes'"""
+    component_factory.register("pd_input_optimize_dtypes", PD_Input_Optimize_Dtypes)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass as component
+import dataclasses
+from typing import List, Optional
+
+from deprecated.sphinx import versionadded
+
+from bspec.components import component_factory
+
+####################################
+# Define PD_Stream_Sink Component: #
+####################################
+@versionadded(
+    version="0.1.11",
+    reason="This allows the chunks of a streamed Pandas read to be collected, or written out, once processed",
+)
+@component
+class PD_Stream_Sink:
+    """This allows the chunks of a streamed Pandas read to be collected, or written out, once processed
+
+    Params:
+        source (str, default 'dataframe_2'): The `PD_DataFrames` field holding the processed chunk
+
+        target (str, optional, default None): The `PD_DataFrames` field to store every chunk
+                                    concatenated into a single dataframe, once the stream is drained.
+                                    By default each chunk is dropped once it is written out, so the
+                                    memory used stays bounded by the chunk size, set a `target`,
+                                    e.g. 'dataframe_3', to keep every chunk in memory instead
+
+        to_csv_path (str, optional): Append every chunk to this CSV file, which is replaced when a
+                                    new stream starts
+
+        to_csv_index (bool, default False): Write the dataframe index to `to_csv_path`
+
+        chunks (List[PandasDataFrame]): The chunks collected for `target` so far
+
+        chunks_written (int): The chunks written to `to_csv_path` so far
+    """
+
+    source: str = "dataframe_2"
+    target: Optional[str] = None
+    to_csv_path: Optional[str] = None
+    to_csv_index: bool = False
+    chunks: List = dataclasses.field(default_factory=list)
+    chunks_written: int = 0
+
+
+def register() -> None:
+    """use `component_factory` to register the `PD_Stream_Sink` component as 'pd_stream_sink'"""
+    component_factory.register("pd_stream_sink", PD_Stream_Sink)
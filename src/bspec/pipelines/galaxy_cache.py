@@ -0,0 +1,189 @@
+"""Cache the compiled galaxy config on disk, so pipelines are only resolved when they change."""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from bspec.common_core.frozen import thaw
+from bspec.pipelines.pipeline_registry import read_pipeline_json
+from bspec.pipelines.recursive_pipeline_read import recursive_pipeline_read
+
+
+"""
+Bump when the layout of the compiled galaxy changes, so stale artifacts are not reused
+"""
+GALAXY_CACHE_VERSION = 2
+
+"""
+The number of compiled galaxies kept in a cache directory, the least recently used are
+removed first
+"""
+MAX_ENTRIES = 8
+
+
+def root_config_key(data: Dict[str, Union[str, list, int, float, dict]]) -> str:
+    """Hash the root config alone, naming the compiled galaxies of the same root config
+    so a new compiled galaxy replaces the previous one.
+
+    Args:
+        data (Dict[str, Union[str, list, int, float, dict]]): Config data dictionary
+
+    Returns:
+        str: the hex digest, shortened
+    """
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def evict(cache_dir: str, keep: str, root_key: str, max_entries: int) -> None:
+    """Remove the other compiled galaxies of the same root config, then the least
+    recently used ones until at most `max_entries` are left.
+
+    Args:
+        cache_dir (str): the directory the compiled galaxies are stored in
+
+        keep (str): the file name of the compiled galaxy that was just written
+
+        root_key (str): see `root_config_key`
+
+        max_entries (int): the number of compiled galaxies to keep
+    """
+    entries: List[Tuple[float, str]] = []
+    for file_name in os.listdir(cache_dir):
+        if file_name == keep or not (
+            file_name.startswith("galaxy-") and file_name.endswith(".json")
+        ):
+            continue
+        path = os.path.join(cache_dir, file_name)
+        try:
+            if file_name.startswith(f"galaxy-{root_key}-"):
+                os.remove(path)
+            else:
+                entries.append((os.path.getmtime(path), path))
+        except OSError:
+            pass
+
+    entries.sort(reverse=True)
+    for _, path in entries[max(max_entries - 1, 0) :]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def galaxy_cache_key(
+    data: Dict[str, Union[str, list, int, float, dict]]
+) -> Optional[str]:
+    """Hash the root config and the contents of every pipeline it uses, recursively.
+
+    Args:
+        data (Dict[str, Union[str, list, int, float, dict]]): Config data dictionary
+
+    Returns:
+        Optional[str]: the hex digest, or `None` if a pipeline has no `pipeline.json`
+                    (e.g. it is built in Python) so its contents can not be hashed
+    """
+    digest = hashlib.sha256()
+    digest.update(f"galaxy-cache-v{GALAXY_CACHE_VERSION}".encode("utf-8"))
+    digest.update(json.dumps(data, sort_keys=True, default=str).encode("utf-8"))
+
+    seen: Set[str] = set()
+    pending: List[Dict] = [data]
+    while pending:
+        config = pending.pop()
+        for pipeline in config.get("pipelines", []):
+            pipeline_module: str = pipeline["pipeline"]
+            if pipeline_module in seen:
+                continue
+            seen.add(pipeline_module)
+
+            contents = read_pipeline_json(pipeline_module)
+            if contents is None:
+                return None
+
+            digest.update(pipeline_module.encode("utf-8"))
+            digest.update(hashlib.sha256(contents).digest())
+            pending.append(json.loads(contents))
+
+    return digest.hexdigest()
+
+
+def cached_pipeline_read(
+    data: Dict[str, Union[str, list, int, float, dict]],
+    processor_plugins: Set[str],
+    galaxy_config: List,
+    cache_dir: str,
+    max_entries: int = MAX_ENTRIES,
+) -> Dict:
+    """`recursive_pipeline_read`, reusing the compiled galaxy from `cache_dir` when the
+    root config and every pipeline JSON are unchanged.
+
+    The compiled galaxy is stored as `galaxy-{root key}-{key}.json`, holding the
+    resolved `galaxy_config` and `all_processor_plugins`. Only the latest compiled
+    galaxy of a root config is kept, and at most `max_entries` in total, so the cache
+    directory does not grow as the pipelines change.
+
+    Args:
+        data (Dict[str, Union[str, list, int, float, dict]]): Config data dictionary
+
+        processor_plugins (Set[str]): the processor plugins of the root config
+
+        galaxy_config (List): the galaxy of the root config
+
+        cache_dir (str): the directory to store compiled galaxies in
+
+        max_entries (int, default 8): the number of compiled galaxies to keep
+
+    Returns:
+        Dict: {"all_processor_plugins": Set[str], "galaxy_config": List}
+    """
+    cache_key = galaxy_cache_key(data)
+    if cache_key is None:
+        return recursive_pipeline_read(
+            data=data,
+            processor_plugins=processor_plugins,
+            galaxy_config=galaxy_config,
+        )
+
+    root_key = root_config_key(data)
+    cache_file_name = f"galaxy-{root_key}-{cache_key}.json"
+    cache_path = os.path.join(cache_dir, cache_file_name)
+    try:
+        with open(cache_path) as file:
+            compiled = json.load(file)
+        processor_plugins.update(compiled["all_processor_plugins"])
+    except (OSError, ValueError, KeyError):
+        pass
+    else:
+        # a hit is a use, so it is the last compiled galaxy to be evicted
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return {
+            "all_processor_plugins": processor_plugins,
+            "galaxy_config": compiled["galaxy_config"],
+        }
+
+    returned_val = recursive_pipeline_read(
+        data=data,
+        processor_plugins=processor_plugins,
+        galaxy_config=galaxy_config,
+    )
+
+    os.makedirs(cache_dir, exist_ok=True)
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w") as file:
+        json.dump(
+            {
+                "all_processor_plugins": sorted(returned_val["all_processor_plugins"]),
+                "galaxy_config": thaw(returned_val["galaxy_config"]),
+            },
+            file,
+        )
+    os.replace(temporary_path, cache_path)
+    evict(cache_dir, cache_file_name, root_key, max_entries)
+
+    return returned_val
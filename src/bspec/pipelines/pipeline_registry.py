@@ -0,0 +1,89 @@
+"""Find pipeline definitions by path or package resource, without importing the pipeline
+modules, and cache each one as an immutable structure until it changes."""
+
+import hashlib
+import importlib.resources
+import json
+import os.path
+import threading
+from typing import Dict, Mapping, Optional, Tuple
+
+from bspec.common_core.frozen import freeze
+from bspec.plugin_core import loader as plugins_loader
+
+
+PIPELINE_FILE = "pipeline.json"
+
+
+def read_pipeline_json(pipeline: str) -> Optional[bytes]:
+    """Read the JSON definition of a pipeline, without importing the pipeline module.
+
+    Args:
+        pipeline (str): the path of a pipeline JSON file, or the dot notation name of a
+                    pipeline module, whose package holds a `pipeline.json` resource
+                    e.g.
+                        "bspec.pipelines.pd_read_and_clean_csv.pipeline"
+
+    Returns:
+        Optional[bytes]: the JSON, or `None` if the pipeline has no JSON definition
+    """
+    if pipeline.endswith(".json"):
+        if not os.path.isfile(pipeline):
+            return None
+        with open(pipeline, "rb") as file:
+            return file.read()
+
+    package_name = pipeline.rpartition(".")[0]
+    if not package_name:
+        return None
+    try:
+        resource = importlib.resources.files(package_name).joinpath(PIPELINE_FILE)
+        if not resource.is_file():
+            return None
+        return resource.read_bytes()
+    except (ImportError, TypeError, OSError):
+        return None
+
+
+class PipelineRegistry:
+    """Parse every pipeline definition once, into a read only structure (see `freeze`)
+    shared by every reference to the pipeline.
+
+    A JSON definition is read again on every `get`, and only parsed again when its
+    contents changed, so edits to a `pipeline.json` are picked up without restarting.
+    Pipelines without a JSON definition, built in Python, fall back to importing the
+    pipeline module and freezing its `pipeline` dictionary.
+    """
+
+    def __init__(self):
+        self._pipelines: Dict[str, Tuple[Optional[str], Mapping]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, pipeline: str) -> Mapping:
+        """The frozen definition of a pipeline.
+
+        Args:
+            pipeline (str): a pipeline path or module name, see `read_pipeline_json`
+
+        Returns:
+            Mapping: the read only pipeline definition
+        """
+        contents = read_pipeline_json(pipeline)
+        digest = None if contents is None else hashlib.sha256(contents).hexdigest()
+        with self._lock:
+            cached = self._pipelines.get(pipeline)
+            if cached is not None and cached[0] == digest:
+                return cached[1]
+            if contents is not None:
+                definition = freeze(json.loads(contents))
+            else:
+                pipeline_module = plugins_loader.import_module(pipeline)
+                definition = freeze(pipeline_module.pipeline)
+            self._pipelines[pipeline] = (digest, definition)
+            return definition
+
+
+"""
+The registry used to resolve every `pipeline` of a config
+"""
+pipeline_registry = PipelineRegistry()
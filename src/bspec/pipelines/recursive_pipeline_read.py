@@ -1,57 +1,185 @@
-from typing import Dict, List, Union, Set
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    Set,
+)
 
-from bspec.plugin_core import loader as plugins_loader
+from bspec.common_core.frozen import freeze
+from bspec.pipelines.pipeline_registry import pipeline_registry
+
+
+class CompiledPipeline(NamedTuple):
+    """A pipeline module expanded once, and shared by every instance of the pipeline
+
+    Params:
+        processor_plugins (FrozenSet[str]): the processor plugins of the pipeline and
+                    every pipeline it uses
+
+        worlds (Tuple[Mapping, ...]): the read only worlds of the pipelines the
+                    pipeline uses
+
+        world (Mapping): the read only world of the pipeline, before any instance
+                    overrides
+    """
+
+    processor_plugins: FrozenSet[str]
+    worlds: Tuple[Mapping, ...]
+    world: Mapping
+
+
+def compile_pipeline(
+    pipeline_module_name: str,
+    compiled_pipelines: Optional[Dict[str, CompiledPipeline]] = None,
+) -> CompiledPipeline:
+    """Expand a pipeline.
+
+    The definition is read from the `pipeline_registry`, so the pipeline module is not
+    imported when it has a `pipeline.json`, and every part of the compiled pipeline is
+    read only, so references to the same pipeline can not corrupt each other.
+
+    Args:
+        pipeline_module_name (str): the dot notation name of the pipeline module, or the
+                    path of a pipeline JSON file
+
+        compiled_pipelines (Dict[str, CompiledPipeline], optional): the pipelines
+                    compiled so far by the same expansion, reused by the pipelines
+                    this pipeline uses, see `recursive_pipeline_read`
+
+    Returns:
+        CompiledPipeline: the expanded pipeline
+    """
+    pipeline_config: Mapping = pipeline_registry.get(pipeline_module_name)
+
+    processor_plugins: Set[str] = set(pipeline_config["processor_plugins"])
+    worlds: List[Dict] = []
+
+    # Recursive Pipeline check
+    if pipeline_config.get("pipelines") is not None:
+        returned_val = recursive_pipeline_read(
+            data=pipeline_config,
+            processor_plugins=processor_plugins,
+            galaxy_config=[],
+            compiled_pipelines=compiled_pipelines,
+        )
+        processor_plugins.update(returned_val["all_processor_plugins"])
+        worlds = returned_val["galaxy_config"]
+
+    # Keep the pipeline plugins with the world, so only the plugins of the worlds
+    # that are used have to be loaded
+    world: Mapping = freeze(
+        {
+            **pipeline_config["world"],
+            "processor_plugins": sorted(pipeline_config["processor_plugins"]),
+        }
+    )
+
+    return CompiledPipeline(
+        processor_plugins=frozenset(processor_plugins),
+        worlds=tuple(freeze(world) for world in worlds),
+        world=world,
+    )
+
+
+def expand_pipeline(pipeline: Dict, compiled: CompiledPipeline) -> Dict:
+    """Apply the overrides of a pipeline instance in a config to its compiled world.
+
+    The world returned is a copy on write view: a new dictionary holding the
+    overridden values, that shares the read only processors and entities that are not
+    overridden with the compiled world.
+
+    Args:
+        pipeline (Dict): the pipeline instance, with optional `world_name` and
+                    `entities` overrides, matched to the pipeline entities by `id`
+
+        compiled (CompiledPipeline): the compiled pipeline module
+
+    Returns:
+        Dict: the world of the pipeline instance
+    """
+    world = compiled.world
+
+    # Index the overrides by entity id, the first override of an id wins
+    overrides: Dict = {}
+    for item in pipeline.get("entities", []):
+        overrides.setdefault(item["id"], item)
+
+    # Override Pipeline Entities details from parent config
+    entities: Union[List, Tuple] = world["entities"]
+    if overrides:
+        entities = [
+            freeze({**entity, **overrides[entity["id"]]})
+            if entity["id"] in overrides
+            else entity
+            for entity in entities
+        ]
+
+    # Override world name of pipeline with config world_name or default to pipeline name
+    return {
+        **world,
+        "entities": entities,
+        "world_name": pipeline.get("world_name", world["world_name"]),
+    }
 
 
 def recursive_pipeline_read(
     data: Dict[str, Union[str, list, int, float, dict]],
     processor_plugins: Set[str],
     galaxy_config: List,
+    compiled_pipelines: Optional[Dict[str, CompiledPipeline]] = None,
 ):
+    """Expand the `pipelines` of a config into worlds, after the worlds of
+    `galaxy_config`.
+
+    Each distinct pipeline is compiled once per expansion, with `compile_pipeline`, so
+    a config with many instances of the same pipeline expands in linear time. Nothing
+    is kept between expansions, so edits to a pipeline are picked up by the next one,
+    reusing a compiled galaxy across starts is left to the `galaxy_cache`.
+
+    Args:
+        data (Dict[str, Union[str, list, int, float, dict]]): Config data dictionary
+
+        processor_plugins (Set[str]): updated with the plugins of every pipeline
+
+        galaxy_config (List): the worlds of the config, left unchanged
+
+        compiled_pipelines (Dict[str, CompiledPipeline], optional): the pipelines
+                    compiled so far, by pipeline name, shared with the pipelines used
+                    by pipelines
+
+    Returns:
+        Dict: {"all_processor_plugins": Set[str], "galaxy_config": List} the galaxy
+                    config is a new list, of the worlds of `galaxy_config` followed by
+                    the world of every pipeline
+    """
+    if compiled_pipelines is None:
+        compiled_pipelines = {}
+
     all_processor_plugins = processor_plugins
+    expanded_galaxy_config: List = list(galaxy_config)
     pipelines: Dict = data.get("pipelines", {})
     for pipeline in pipelines:
-        processor_plugins: Set[str] = set([])
-
-        # Load Pipeline Module
-        pipline_module = plugins_loader.import_module(pipeline["pipeline"])
-
-        # Update Global plugins to import later
-        processor_plugins.update(pipline_module.pipeline["processor_plugins"])
-        all_processor_plugins.update(processor_plugins)
-
-        # Recursive Pipeline check
-        if pipline_module.pipeline.get("pipelines") is not None:
-            returned_val = recursive_pipeline_read(
-                data=pipline_module.pipeline,
-                processor_plugins=processor_plugins,
-                galaxy_config=galaxy_config,
+        pipeline_module_name: str = pipeline["pipeline"]
+        compiled = compiled_pipelines.get(pipeline_module_name)
+        if compiled is None:
+            compiled = compiled_pipelines[pipeline_module_name] = compile_pipeline(
+                pipeline_module_name, compiled_pipelines
             )
-            all_processor_plugins.update(returned_val["all_processor_plugins"])
-            galaxy_config = returned_val["galaxy_config"]
-
-        # Get world details from pipeline
-        world = pipline_module.pipeline["world"]
-
-        # Override Pipeline Entities details from parent config
-        world_entities: List = []
-        for entity in world["entities"]:
-            pipeline_entity = next(
-                (item for item in pipeline["entities"] if item["id"] == entity["id"]),
-                {},
-            )
-            pipeline_entity = {**entity, **pipeline_entity}
-            world_entities.append(pipeline_entity)
-        world["entities"] = world_entities
 
-        # Override world name of pipeline with config world_name or default to pipeline name
-        world["world_name"] = pipeline.get("world_name", world["world_name"])
+        # Update Global plugins to import later
+        all_processor_plugins.update(compiled.processor_plugins)
 
-        galaxy_config.append(world)
+        expanded_galaxy_config.extend(compiled.worlds)
+        expanded_galaxy_config.append(expand_pipeline(pipeline, compiled))
 
     return_var: Dict = {
         "all_processor_plugins": all_processor_plugins,
-        "galaxy_config": galaxy_config,
+        "galaxy_config": expanded_galaxy_config,
     }
 
     return return_var
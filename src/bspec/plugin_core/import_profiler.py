@@ -0,0 +1,132 @@
+"""Opt-in profiler for plugin imports and `register()` calls at startup."""
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class PluginProfile:
+    """The cost of importing, or registering, a single plugin
+
+    Params:
+        plugin_name (str): the dot notation name of the plugin module
+
+        stage (str): "import" for the module import, "register" for the `register()` call
+
+        wall_seconds (float): the wall time taken
+
+        memory_bytes (int): the change in traced memory, 0 if memory is not traced
+
+        peak_memory_bytes (int): the traced memory peak above the starting point
+
+        imported_modules (List[str]): modules first imported during this stage, which
+                    includes the transitive imports of the plugin
+
+        error (str, optional): the error raised, if the stage failed
+    """
+
+    plugin_name: str
+    stage: str
+    wall_seconds: float = 0.0
+    memory_bytes: int = 0
+    peak_memory_bytes: int = 0
+    imported_modules: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+class ImportProfiler:
+    """Record the wall time, memory and transitive imports of each plugin import and
+    `register()` call, and report them sorted by cost.
+
+    Args:
+        trace_memory (bool, default True): trace memory with `tracemalloc`, which slows
+                    imports down but measures how much memory each plugin allocates
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.records: List[PluginProfile] = []
+        self._started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def profile(self, plugin_name: str, stage: str) -> Iterator[PluginProfile]:
+        """Profile the code run inside the `with` block as a stage of a plugin.
+
+        Args:
+            plugin_name (str): the dot notation name of the plugin module
+
+            stage (str): "import" or "register"
+        """
+        record = PluginProfile(plugin_name=plugin_name, stage=stage)
+        modules_before = set(sys.modules)
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            memory_before, _ = tracemalloc.get_traced_memory()
+        start_time = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record.error = repr(e)
+            raise
+        finally:
+            record.wall_seconds = time.perf_counter() - start_time
+            if tracing:
+                memory_after, memory_peak = tracemalloc.get_traced_memory()
+                record.memory_bytes = memory_after - memory_before
+                record.peak_memory_bytes = memory_peak - memory_before
+            record.imported_modules = sorted(set(sys.modules) - modules_before)
+            self.records.append(record)
+
+    def stop(self) -> None:
+        """Stop tracing memory, if this profiler started it."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self, sort_by: str = "wall_seconds") -> List[Dict]:
+        """The records as dictionaries, most expensive first.
+
+        Args:
+            sort_by (str, default "wall_seconds"): the `PluginProfile` field to sort by
+        """
+        return [
+            asdict(record)
+            for record in sorted(
+                self.records, key=lambda record: getattr(record, sort_by), reverse=True
+            )
+        ]
+
+    def to_json(self, sort_by: str = "wall_seconds") -> str:
+        return json.dumps(self.report(sort_by=sort_by), indent=4)
+
+    def print_report(self, sort_by: str = "wall_seconds") -> None:
+        """Print a table of the records, most expensive first."""
+        print()
+        print("Startup Profile")
+        print("===============")
+        print()
+        print(
+            f"{'wall ms':>10} {'memory KiB':>11} {'peak KiB':>10} {'imports':>8}  {'stage':<9} plugin"
+        )
+        for record in self.report(sort_by=sort_by):
+            error = "" if record["error"] is None else f"  (failed: {record['error']})"
+            print(
+                f"{record['wall_seconds'] * 1000:>10.1f} "
+                f"{record['memory_bytes'] / 1024:>11.1f} "
+                f"{record['peak_memory_bytes'] / 1024:>10.1f} "
+                f"{len(record['imported_modules']):>8}  "
+                f"{record['stage']:<9} {record['plugin_name']}{error}"
+            )
+        total_seconds = sum(record.wall_seconds for record in self.records)
+        print()
+        print(f"Total: {total_seconds * 1000:.1f} ms over {len(self.records)} stages")
+        print()
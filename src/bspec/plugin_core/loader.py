@@ -1,7 +1,8 @@
 """import modules and load plugins, adapted from: https://youtu.be/iCE1bDoit9Q"""
 import importlib
-from typing import List
+from typing import Iterable, Optional
 
+from bspec.plugin_core.import_profiler import ImportProfiler
 from bspec.plugin_core.plugin_module_interface import ModuleInterface
 
 
@@ -24,7 +25,9 @@ def import_module(module_name: str) -> ModuleInterface:
     return importlib.import_module(module_name)  # type: ignore
 
 
-def load_plugins(plugins: List[str]) -> None:
+def load_plugins(
+    plugins: Iterable[str], profiler: Optional[ImportProfiler] = None
+) -> None:
     """Imports a list of plugins defined in the `plugins` parameter.
 
     Args:
@@ -37,11 +40,21 @@ def load_plugins(plugins: List[str]) -> None:
 
                                 import typing.List
 
+        profiler (ImportProfiler, optional): record the cost of each import and
+                             `register()` call to this profiler
+
     """
     for plugin_name in plugins:
         # Don't break program for bad config!
         try:
-            plugin = import_module(plugin_name)
-            plugin.register()
+            if profiler is None:
+                plugin = import_module(plugin_name)
+                plugin.register()
+                continue
+
+            with profiler.profile(plugin_name, "import"):
+                plugin = import_module(plugin_name)
+            with profiler.profile(plugin_name, "register"):
+                plugin.register()
         except Exception as e:
             print(f"failed to import module: {plugin_name} with error: {e}")
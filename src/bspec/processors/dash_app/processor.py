@@ -6,7 +6,7 @@ from typing import Dict, Sequence
 from esper import Processor
 
 from bspec.processors import processor_factory
-from bspec.common_core.read_module_requirements import read_module_requirements
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.common_core.dynamic_module_install import dynamic_module_install
 
 from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
@@ -24,7 +24,7 @@ else:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
-requirements_dict = read_module_requirements(requirements_path)
+requirements_dict = requirements_registry.read(requirements_path)
 
 #######################################
 #  Import Required Processor Modules: #
@@ -71,10 +71,18 @@ class Dash_App(Processor):
             or persist data. Components include:
                 * RuntimeDebugPrint
                 * Dash_Ui
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
     """
 
     default_theme: str = "FLATLY"
     components: Sequence = field(default_factory=list)
+    reads: Sequence = field(default_factory=list)
+    writes: Sequence = field(default_factory=list)
     themes: Dict = field(default_factory=dict)
 
     def __init__(self, default_theme: str = "FLATLY", **kwargs):
@@ -83,6 +91,12 @@ class Dash_App(Processor):
             RuntimeDebugPrint,
             Dash_Ui,
         ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+        ]
+        self.writes: Sequence = [
+            Dash_Ui,
+        ]
         self.themes: Dict = {
             "BOOTSTRAP": dbc.themes.BOOTSTRAP,
             "GRID": dbc.themes.GRID,
@@ -6,7 +6,7 @@ from typing import Sequence
 from esper import Processor
 
 from bspec.processors import processor_factory
-from bspec.common_core.read_module_requirements import read_module_requirements
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.common_core.dynamic_module_install import dynamic_module_install
 
 from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
@@ -23,7 +23,7 @@ else:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
-requirements_dict = read_module_requirements(requirements_path)
+requirements_dict = requirements_registry.read(requirements_path)
 
 #######################################
 #  Import Required Processor Modules: #
@@ -53,6 +53,12 @@ class Flask_App(Processor):
             or persist data. Components include:
                 * RuntimeDebugPrint
                 * Flask_Ui
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
     """
 
     def __init__(self, **kwargs):
@@ -60,6 +66,11 @@ class Flask_App(Processor):
             RuntimeDebugPrint,
             Flask_UI,
         ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+            Flask_UI,
+        ]
+        self.writes: Sequence = []
 
     def process(self):
         """Generic naming convention `process` to allow for every processor to run
@@ -1,17 +1,42 @@
 import sys
 import os.path
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Any, Dict, Optional, Sequence
 
 from esper import Processor
 
 from bspec.processors import processor_factory
-from bspec.common_core.read_module_requirements import read_module_requirements
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.common_core.dynamic_module_install import dynamic_module_install
 
 from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
 from bspec.components.pd_input_dropna.pd_input_dropna import PD_Input_DropNA
-from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_dataframe.pd_dataframes import (
+    DATAFRAME_SLOTS,
+    PD_DataFrames,
+    copy_on_write,
+    copy_on_write_available,
+    release_slots,
+    slot_frame,
+    slot_memory,
+)
+from bspec.components.pd_dataframe.polars_backend import (
+    backend_of,
+    import_polars,
+    polars_errors,
+    to_polars,
+)
+from bspec.components.pd_dataframe.lazy_plan import (
+    PlanStep,
+    execute_plans,
+    plan_of,
+)
+from bspec.components.pd_dataframe.step_cache import (
+    run_step,
+    slot_fingerprint,
+    step_cache,
+    step_key,
+)
 
 ###########################################################################
 #  Load System Modules module_requirements.txt to support dynamic import: #
@@ -24,7 +49,7 @@ else:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
-requirements_dict = read_module_requirements(requirements_path)
+requirements_dict = requirements_registry.read(requirements_path)
 
 #######################################
 #  Import Required Processor Modules: #
@@ -36,6 +61,54 @@ except ImportError:
     dynamic_module_install(module_name, requirements_dict)
     import pandas as pd  # noqa: E402
 
+
+def dropna_polars(frame: Any, pd_input_dropna_kwargs: Dict[str, Any]) -> Optional[Any]:
+    """`frame.dropna(**pd_input_dropna_kwargs)`, with the rows to keep found by Polars
+    across threads, from the columns checked for missing values handed over through
+    Arrow, and taken from `frame` by pandas so the index and dtypes are kept.
+
+    Args:
+        frame (Any): the pandas dataframe
+
+        pd_input_dropna_kwargs (Dict[str, Any]): the `dropna` keyword arguments
+
+    Returns:
+        Optional[Any]: the rows kept, or `None` when Polars can not find them as pandas
+                    does, e.g. `axis=1`, or object columns Arrow can not convert
+    """
+    if pd_input_dropna_kwargs.get("axis", 0) not in (0, "index", "rows"):
+        return None
+    subset = pd_input_dropna_kwargs.get("subset")
+    columns = (
+        list(frame.columns)
+        if subset is None
+        else [subset]
+        if isinstance(subset, str)
+        else list(subset)
+    )
+    if (
+        not columns
+        or frame.columns.has_duplicates
+        or any(column not in frame.columns for column in columns)
+    ):
+        return None
+
+    pl = import_polars()
+    thresh = pd_input_dropna_kwargs.get("thresh")
+    try:
+        checked = to_polars(frame, columns)
+        if thresh is not None:
+            keep = pl.sum_horizontal(pl.all().is_not_null()) >= thresh
+        elif pd_input_dropna_kwargs.get("how", "any") == "all":
+            keep = ~pl.all_horizontal(pl.all().is_null())
+        else:
+            keep = ~pl.any_horizontal(pl.all().is_null())
+        mask = checked.select(keep).to_series().to_numpy()
+    except polars_errors():
+        return None
+    return frame[mask]
+
+
 #########################
 #  Define some Systems: #
 #########################
@@ -43,7 +116,21 @@ except ImportError:
 
 @dataclass
 class PD_DropNA(Processor):
-    """Read a CSV using Pandas `read_csv`
+    """Drop missing values using Pandas `dropna`, from `dataframe_1` into `dataframe_2`
+
+    `dataframe_1` is copied before `dropna`, so `dataframe_2` never shares a buffer with
+    it, and `inplace` is not needed and is ignored. With `copy_on_write`, the copy is
+    skipped and `dropna` runs under pandas copy-on-write instead, sharing buffers with
+    `dataframe_1`, where pandas can, until one of them is written to. A processor that
+    `consumes` "dataframe_1" empties it once `dataframe_2` is written, so the input is
+    freed as soon as nothing else holds it.
+
+    On the "polars" `backend`, the rows to keep are found by Polars, see
+    `dropna_polars`, and by pandas when Polars can not find them the same way.
+
+    A `lazy` processor adds the dropna to the `LazyPlan` of an entity whose
+    `dataframe_1` is still pending, e.g. from a lazy `PD_Read_CSV`, where it only reads
+    the `subset` columns and, dropping rows, is applied to each chunk as it is read.
 
     Args:
         Processor (_type_): ECS framework `esper`'s Processor class
@@ -55,6 +142,33 @@ class PD_DropNA(Processor):
                 * RuntimeDebugPrint
                 * PD_Input_DropNA
                 * PD_DataFrames
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
+
+        step_cache (Optional[StepCache]): from the `step_cache` argument, e.g.
+            {"path": ".bspec_step_cache", "max_bytes": 1073741824}, reuse `dataframe_2`
+            while `dataframe_1` comes from an unchanged cached step, and
+            `PD_Input_DropNA` is unchanged
+
+        consumes (Sequence[str]): from the `consumes` argument, e.g. ["dataframe_1"],
+            the slots emptied after `dataframe_2` is written, for pipelines where no
+            later processor reads them
+
+        backend (Optional[str]): from the `backend` argument, "pandas" or "polars",
+            `None` to use the `backend` of each entity's `PD_DataFrames`
+
+        lazy (bool): from the `lazy` argument, add the dropna to a pending `LazyPlan`
+            of the entity, see `lazy_plan`, rather than running it straight away,
+            unless a `step_cache` is set
+
+        copy_on_write (bool): from the `copy_on_write` argument, or the
+            `copy_on_write` config of the universe, skip the copy of `dataframe_1`
+            and run `dropna` under pandas copy-on-write, see
+            `pd_dataframes.copy_on_write`
     """
 
     def __init__(self, **kwargs):
@@ -63,6 +177,74 @@ class PD_DropNA(Processor):
             PD_Input_DropNA,
             PD_DataFrames,
         ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_DropNA,
+        ]
+        self.writes: Sequence = [
+            PD_DataFrames,
+        ]
+        self.step_cache = step_cache(kwargs.get("step_cache"))
+        self.consumes: Sequence[str] = list(kwargs.get("consumes", []))
+        for slot in self.consumes:
+            if slot not in DATAFRAME_SLOTS:
+                raise ValueError(
+                    f"Unknown slot: '{slot!r}', expected one of {DATAFRAME_SLOTS}"
+                )
+        self.lazy: bool = bool(kwargs.get("lazy", False))
+        self.backend: Optional[str] = kwargs.get("backend")
+        self.copy_on_write: bool = bool(kwargs.get("copy_on_write", False))
+
+    def dropna_step_key(
+        self, pd_input_dropna: PD_Input_DropNA, pd_dataframes: PD_DataFrames
+    ) -> Optional[str]:
+        """The step cache key of the dropna, `None` if `dataframe_1` is not from a
+        cached step."""
+        if self.step_cache is None:
+            return None
+        fingerprint = slot_fingerprint(pd_dataframes, "dataframe_1")
+        if fingerprint is None:
+            return None
+        return step_key("pd_dropna", fingerprint, vars(pd_input_dropna))
+
+    def dropna(
+        self, frame: Any, pd_input_dropna_kwargs: Dict[str, Any], backend: str
+    ) -> Any:
+        """`dropna` on the backend, on pandas when Polars can not run it."""
+        if backend == "polars":
+            result = dropna_polars(frame, pd_input_dropna_kwargs)
+            if result is not None:
+                return result
+        if self.copy_on_write and copy_on_write_available():
+            with copy_on_write():
+                return frame.dropna(**pd_input_dropna_kwargs)
+        return frame.copy().dropna(**pd_input_dropna_kwargs)
+
+    def plan_step(
+        self,
+        pd_input_dropna: PD_Input_DropNA,
+        pd_input_dropna_kwargs: Dict[str, Any],
+        backend: str,
+    ) -> PlanStep:
+        """The dropna as a step of a `LazyPlan`."""
+        subset = pd_input_dropna.subset
+        rows = pd_input_dropna.axis in (0, "index", "rows")
+        return PlanStep(
+            name="pd_dropna",
+            source="dataframe_1",
+            target="dataframe_2",
+            run=lambda frame: self.dropna(frame, pd_input_dropna_kwargs, backend),
+            reads=(
+                None
+                if subset is None or not rows
+                else [subset]
+                if isinstance(subset, str)
+                else list(subset)
+            ),
+            passes_columns=rows,
+            row_wise=rows,
+            consumes=self.consumes,
+        )
 
     def process(self):
         """Generic naming convention `process` to allow for every processor to run
@@ -75,11 +257,41 @@ class PD_DropNA(Processor):
             pd_input_dropna,
             pd_dataframes,
         ) in self.world.get_components(*self.components):
-            pd_input_dropna_kwargs = vars(pd_input_dropna)
-            pd_dataframes.dataframe_2 = pd_dataframes.dataframe_1.copy()
-            pd_dataframes.dataframe_2 = pd_dataframes.dataframe_2.dropna(
-                **pd_input_dropna_kwargs
-            )
+            backend = backend_of(self.backend, pd_dataframes)
+            pd_input_dropna_kwargs = {
+                key: value
+                for key, value in vars(pd_input_dropna).items()
+                if key != "inplace"
+            }
+            # pandas >= 1.5 rejects `how` together with `thresh`, `thresh` wins as it
+            # did before
+            if pd_input_dropna_kwargs.get("thresh") is None:
+                pd_input_dropna_kwargs.pop("thresh", None)
+            else:
+                pd_input_dropna_kwargs.pop("how", None)
+
+            if self.lazy and self.step_cache is None and pd_dataframes.plan is not None:
+                plan_of(pd_dataframes).add(
+                    pd_dataframes,
+                    self.plan_step(pd_input_dropna, pd_input_dropna_kwargs, backend),
+                )
+            else:
+
+                def drop_na() -> None:
+                    pd_dataframes.dataframe_2 = self.dropna(
+                        slot_frame(pd_dataframes, "dataframe_1"),
+                        pd_input_dropna_kwargs,
+                        backend,
+                    )
+
+                run_step(
+                    self.step_cache,
+                    self.dropna_step_key(pd_input_dropna, pd_dataframes),
+                    pd_dataframes,
+                    ["dataframe_2"],
+                    drop_na,
+                )
+                release_slots(pd_dataframes, self.consumes)
 
             if runtime_debug_print.runtime_debug_flag is True:
                 print()
@@ -90,13 +302,26 @@ class PD_DropNA(Processor):
                 print()
                 print("pd_input_dropna:")
                 print(pd_input_dropna)
+                if self.step_cache is not None:
+                    print()
+                    print("step_cache: ", self.step_cache.stats())
+                if pd_dataframes.plan is not None:
+                    print()
+                    print("plan: ", pd_dataframes.plan.explain())
                 print()
                 print("pd_dataframes:")
                 print(pd_dataframes)
+                print()
+                print("slot_memory: ", slot_memory(pd_dataframes))
                 if runtime_debug_print.pause_execution is True:
                     print()
                     input("Enter to continue execution:")
 
+    def end_tick(self) -> None:
+        """Execute the `LazyPlan` of every entity once the tick is done."""
+        if self.lazy:
+            execute_plans(self.world)
+
 
 def register() -> None:
     """use `processor_factory` to register the `PD_DropNA` component as 'pd_dropna'"""
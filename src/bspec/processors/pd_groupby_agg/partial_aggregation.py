@@ -0,0 +1,240 @@
+"""Aggregate a dataframe one chunk at a time: each chunk is reduced to partial results
+per group, merged into the partial results so far, so only one row per group is kept
+between chunks, and the partial results are finished into the aggregation at the end."""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+"""
+{aggregation: the partial results it is finished from}
+"""
+AGGREGATION_PARTIALS: Dict[str, Tuple[str, ...]] = {
+    "sum": ("sum",),
+    "count": ("count",),
+    "size": ("size",),
+    "min": ("min",),
+    "max": ("max",),
+    "prod": ("prod",),
+    "any": ("any",),
+    "all": ("all",),
+    "first": ("first",),
+    "last": ("last",),
+    "mean": ("count", "shifted_sum"),
+    "var": ("count", "shifted_sum", "shifted_sum_squares"),
+    "std": ("count", "shifted_sum", "shifted_sum_squares"),
+}
+
+"""
+{partial result: how the partial results of two chunks are merged}
+"""
+PARTIAL_MERGES: Dict[str, str] = {
+    "sum": "sum",
+    "count": "sum",
+    "size": "sum",
+    "min": "min",
+    "max": "max",
+    "prod": "prod",
+    "any": "any",
+    "all": "all",
+    "first": "first",
+    "last": "last",
+    "shifted_sum": "sum",
+    "shifted_sum_squares": "sum",
+}
+
+
+def _aggregations(
+    agg_columns: Dict[str, Union[str, List[str]]]
+) -> Dict[str, List[str]]:
+    return {
+        column: [functions] if isinstance(functions, str) else list(functions)
+        for column, functions in agg_columns.items()
+    }
+
+
+class PartialAggregation:
+    """`df.groupby(group_by_columns).agg(agg_columns)`, one chunk at a time.
+
+    The aggregations are limited to those that can be merged from partial results, see
+    `AGGREGATION_PARTIALS`. Means and variances are merged from sums of the values
+    shifted by a value of the column, which keeps them accurate when the mean is large
+    compared to the spread.
+
+    Args:
+        group_by_columns (Sequence[str]): the columns to group by
+
+        agg_columns (Dict[str, Union[str, List[str]]]): {column: aggregations}
+
+        sort (bool, optional): sort the groups, otherwise they are in the order they
+                    are first seen. Defaults to False.
+
+        observed (bool, optional): only the observed values of categorical group
+                    columns. Defaults to True.
+
+        dropna (bool, optional): drop groups whose key is missing. Defaults to True.
+
+    Raises:
+        ValueError: an aggregation that can not be merged from partial results
+    """
+
+    def __init__(
+        self,
+        group_by_columns: Sequence[str],
+        agg_columns: Dict[str, Union[str, List[str]]],
+        sort: bool = False,
+        observed: bool = True,
+        dropna: bool = True,
+    ):
+        self.group_by_columns = list(group_by_columns)
+        self.agg_columns = agg_columns
+        self.aggregations = _aggregations(agg_columns)
+        self.sort = sort
+        self.observed = observed
+        self.dropna = dropna
+        self.chunks = 0
+
+        unsupported = sorted(
+            {
+                function
+                for functions in self.aggregations.values()
+                for function in functions
+                if function not in AGGREGATION_PARTIALS
+            }
+        )
+        if unsupported:
+            raise ValueError(
+                f"Aggregations that can not be merged from chunks: {unsupported}, use "
+                f"one of {sorted(AGGREGATION_PARTIALS)}"
+            )
+
+        # {column: the partial results it needs}
+        self.partials: Dict[str, List[str]] = {}
+        for column, functions in self.aggregations.items():
+            needed: List[str] = []
+            for function in functions:
+                for partial in AGGREGATION_PARTIALS[function]:
+                    if partial not in needed:
+                        needed.append(partial)
+            self.partials[column] = needed
+
+        self._shifts: Dict[str, Any] = {}
+        self._state: Optional[pd.DataFrame] = None
+
+    def _shift(self, column: str, values: Any) -> Any:
+        """The value the column is shifted by, the first value of the first chunk."""
+        if column not in self._shifts:
+            valid = values.dropna()
+            self._shifts[column] = valid.iloc[0] if len(valid) else 0
+        return self._shifts[column]
+
+    def _partial(self, chunk: Any) -> pd.DataFrame:
+        """The partial results of a chunk, a row per group, a column per (column,
+        partial result)."""
+        inputs: Dict[Tuple[str, str], Any] = {}
+        functions: Dict[Tuple[str, str], str] = {}
+        for column, partials in self.partials.items():
+            for partial in partials:
+                if partial in ("shifted_sum", "shifted_sum_squares"):
+                    shifted = chunk[column] - self._shift(column, chunk[column])
+                    inputs[(column, partial)] = (
+                        shifted if partial == "shifted_sum" else shifted * shifted
+                    )
+                    functions[(column, partial)] = "sum"
+                else:
+                    inputs[(column, partial)] = chunk[column]
+                    functions[(column, partial)] = partial
+
+        frame = pd.DataFrame(
+            {
+                **{column: chunk[column] for column in self.group_by_columns},
+                **{
+                    f"{column}\0{partial}": values
+                    for (column, partial), values in inputs.items()
+                },
+            }
+        )
+        grouped = frame.groupby(
+            self.group_by_columns,
+            sort=False,
+            observed=self.observed,
+            dropna=self.dropna,
+        )
+        partial_frame = grouped.agg(
+            {
+                f"{column}\0{partial}": function
+                for (column, partial), function in functions.items()
+            }
+        )
+        partial_frame.columns = pd.MultiIndex.from_tuples(
+            [tuple(name.split("\0")) for name in partial_frame.columns]
+        )
+        return partial_frame
+
+    def _merge(self, partials: Any) -> pd.DataFrame:
+        """Merge the partial results of the same groups."""
+        grouped = partials.groupby(
+            level=list(range(partials.index.nlevels)),
+            sort=False,
+            observed=self.observed,
+            dropna=self.dropna,
+        )
+        return grouped.agg(
+            {(column, partial): PARTIAL_MERGES[partial] for column, partial in partials}
+        )
+
+    def add(self, chunk: Any) -> None:
+        """Merge the partial results of a chunk into the partial results so far.
+
+        Args:
+            chunk (Any): a dataframe with the group by and aggregated columns
+        """
+        partial = self._partial(chunk)
+        self._state = (
+            partial
+            if self._state is None
+            else self._merge(pd.concat([self._state, partial]))
+        )
+        self.chunks += 1
+
+    def _finish(self, column: str, function: str) -> Any:
+        state = self._state
+        if function in ("mean", "var", "std"):
+            count = state[(column, "count")]
+            shifted_sum = state[(column, "shifted_sum")]
+            if function == "mean":
+                return shifted_sum / count.where(count > 0) + self._shifts.get(
+                    column, 0
+                )
+            squares = state[(column, "shifted_sum_squares")]
+            var = (squares - shifted_sum * shifted_sum / count) / (count - 1).where(
+                count > 1
+            )
+            return np.sqrt(var) if function == "std" else var
+        return state[(column, AGGREGATION_PARTIALS[function][0])]
+
+    def result(self) -> pd.DataFrame:
+        """The aggregation of every chunk added, as `agg` returns it: a column per
+        (column, aggregation), or per column when each column has a single aggregation
+        given as a string.
+
+        Returns:
+            pd.DataFrame: the aggregation, indexed by the group by columns
+        """
+        if self._state is None:
+            raise ValueError("No chunks have been added")
+
+        flat = all(
+            isinstance(functions, str) for functions in self.agg_columns.values()
+        )
+        result = pd.DataFrame(
+            {
+                column if flat else (column, function): self._finish(column, function)
+                for column, functions in self.aggregations.items()
+                for function in functions
+            },
+            index=self._state.index,
+        )
+        return result.sort_index() if self.sort else result
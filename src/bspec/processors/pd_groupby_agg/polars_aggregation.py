@@ -0,0 +1,163 @@
+"""Group and aggregate a pandas dataframe on Polars' multithreaded `group_by`, for the
+aggregations Polars computes the same way as pandas, returning the pandas result."""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from bspec.components.pd_dataframe.polars_backend import (
+    import_polars,
+    polars_errors,
+    to_pandas,
+    to_polars,
+)
+from bspec.processors.pd_groupby_agg.partial_aggregation import _aggregations
+
+
+"""
+Aggregations Polars computes as pandas does, skipping missing values
+"""
+POLARS_AGGREGATIONS = (
+    "sum",
+    "mean",
+    "median",
+    "min",
+    "max",
+    "std",
+    "var",
+    "count",
+    "size",
+    "first",
+    "last",
+)
+
+"""
+Aggregations only handed to Polars for numeric columns
+"""
+NUMERIC_AGGREGATIONS = ("sum", "mean", "median", "std", "var")
+
+"""
+Prefix of the aggregated columns of the Polars result, which can not clash with the
+string names of the group by columns
+"""
+AGGREGATION_PREFIX = "\x1f"
+
+
+def _expression(pl: Any, column: str, function: str) -> Any:
+    expression = pl.col(column)
+    if function == "size":
+        return expression.len().cast(pl.Int64)
+    if function == "count":
+        return expression.count().cast(pl.Int64)
+    if function in ("first", "last"):
+        # pandas takes the first and last value that is not missing
+        return getattr(expression.drop_nulls(), function)()
+    return getattr(expression, function)()
+
+
+def _unsupported(
+    frame: Any, group_by_columns: List[Any], aggregations: Dict[Any, List[str]]
+) -> str:
+    functions = sorted(
+        {
+            function
+            for functions in aggregations.values()
+            for function in functions
+            if function not in POLARS_AGGREGATIONS
+        }
+    )
+    if functions:
+        return f"unsupported aggregations {functions}"
+    columns = group_by_columns + list(aggregations)
+    if not all(isinstance(column, str) for column in columns):
+        return "column names that are not strings"
+    if frame.columns.has_duplicates:
+        return "duplicate column names"
+    if any(isinstance(frame[column].dtype, pd.CategoricalDtype) for column in columns):
+        # pandas keeps the categories of categorical columns in the result
+        return "categorical columns"
+    for column, functions in aggregations.items():
+        if set(functions) & set(NUMERIC_AGGREGATIONS) and not (
+            pd.api.types.is_numeric_dtype(frame[column].dtype)
+        ):
+            # e.g. pandas sums strings by concatenating them
+            return f"{sorted(set(functions) & set(NUMERIC_AGGREGATIONS))} of {column!r}"
+    return ""
+
+
+def aggregate_polars(
+    frame: Any,
+    group_by_columns: List[str],
+    agg_columns: Dict[str, Union[str, List[str]]],
+    sort: bool = False,
+    dropna: bool = True,
+) -> Tuple[Optional[Any], str]:
+    """`frame.groupby(group_by_columns).agg(agg_columns)` on Polars, with only the
+    grouped and aggregated columns handed over through Arrow.
+
+    Args:
+        frame (Any): the pandas dataframe
+
+        group_by_columns (List[str]): the columns to group by
+
+        agg_columns (Dict[str, Union[str, List[str]]]): {column: aggregations}
+
+        sort (bool, optional): sort the groups, otherwise they are in the order they
+                    are first seen. Defaults to False.
+
+        dropna (bool, optional): drop groups whose key is missing. Defaults to True.
+
+    Returns:
+        Tuple[Optional[Any], str]: the aggregation, as pandas `agg` returns it, or
+                    `None` and why Polars can not aggregate it as pandas does
+    """
+    group_by_columns = list(group_by_columns)
+    aggregations = _aggregations(agg_columns)
+    reason = _unsupported(frame, group_by_columns, aggregations)
+    if reason:
+        return None, reason
+    flat = all(isinstance(functions, str) for functions in agg_columns.values())
+
+    # The result columns, named by position, as Arrow truncates names at a "\0"
+    outputs = [
+        (column if flat else (column, function), column, function)
+        for column, functions in aggregations.items()
+        for function in functions
+    ]
+    pl = import_polars()
+    try:
+        polars_frame = to_polars(
+            frame, list(dict.fromkeys(group_by_columns + list(aggregations)))
+        )
+        if dropna:
+            polars_frame = polars_frame.filter(
+                pl.all_horizontal(pl.col(group_by_columns).is_not_null())
+            )
+        result = polars_frame.group_by(group_by_columns, maintain_order=not sort).agg(
+            [
+                _expression(pl, column, function).alias(f"{AGGREGATION_PREFIX}{index}")
+                for index, (_, column, function) in enumerate(outputs)
+            ]
+        )
+        if sort:
+            result = result.sort(group_by_columns, nulls_last=True)
+    except polars_errors() as error:
+        return None, f"{type(error).__name__}: {error}".splitlines()[0]
+
+    result = to_pandas(result)
+    keys = result[group_by_columns]
+    index = (
+        pd.Index(keys.iloc[:, 0], name=group_by_columns[0])
+        if len(group_by_columns) == 1
+        else pd.MultiIndex.from_frame(keys)
+    )
+    return (
+        pd.DataFrame(
+            {
+                name: result[f"{AGGREGATION_PREFIX}{position}"].to_numpy()
+                for position, (name, _, _) in enumerate(outputs)
+            },
+            index=index,
+        ),
+        "",
+    )
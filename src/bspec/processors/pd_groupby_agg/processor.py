@@ -0,0 +1,312 @@
+import sys
+import os.path
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+from esper import Processor
+
+from bspec.processors import processor_factory
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.components.pd_input_groupby_agg.pd_input_groupby_agg import (
+    PD_Input_GroupBy_Agg,
+)
+from bspec.components.pd_dataframe.pd_dataframes import (
+    DATAFRAME_SLOTS,
+    PD_DataFrames,
+    release_slots,
+    slot_frame,
+)
+from bspec.components.pd_dataframe.polars_backend import backend_of
+from bspec.components.pd_dataframe.lazy_plan import (
+    PlanStep,
+    execute_plans,
+    plan_of,
+)
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+#######################################
+#  Import Required Processor Modules: #
+#######################################
+try:
+    import pandas as pd  # noqa: E402
+except ImportError:
+    module_name = "pandas"
+    dynamic_module_install(module_name, requirements_dict)
+    import pandas as pd  # noqa: E402
+
+from bspec.processors.pd_groupby_agg.partial_aggregation import (  # noqa: E402
+    PartialAggregation,
+)
+from bspec.processors.pd_groupby_agg.polars_aggregation import (  # noqa: E402
+    aggregate_polars,
+)
+
+"""
+The slots an aggregation can be written to
+"""
+TARGET_SLOTS = ("dataframe_2", "dataframe_3")
+
+#########################
+#  Define some Systems: #
+#########################
+
+
+@dataclass
+class PD_GroupBy_Agg(Processor):
+    """Group and aggregate a dataframe with Pandas `groupby` and `agg`, by the
+    `group_by_columns` and `agg_columns` of `PD_DataFrames`
+    e.g.
+        df1.groupby('Category').agg({'costs':['sum','mean','std']})
+
+    Groups are hashed without sorting, and only the observed categories of categorical
+    group columns are kept, unless the `PD_Input_GroupBy_Agg` says otherwise. Named
+    aggregations run as Pandas' compiled reductions.
+
+    While `PD_Read_CSV` streams a CSV one chunk per tick, or with a `chunksize`, each
+    chunk is reduced to partial results per group and merged into the partial results
+    so far (see `PartialAggregation`), and the aggregation is written to the `target`
+    once the stream is drained.
+
+    On the "polars" `backend`, whole dataframes are aggregated by Polars' multithreaded
+    `group_by`, for the aggregations it computes as pandas does, and by pandas
+    otherwise. Chunks are always aggregated by pandas.
+
+    A `lazy` processor adds the aggregation to the `LazyPlan` of an entity with pending
+    steps, e.g. from a lazy `PD_Read_CSV`, so only the grouped and aggregated columns
+    are read, when nothing reads the `source` after the aggregation, i.e. it `consumes`
+    it.
+
+    Args:
+        Processor (_type_): ECS framework `esper`'s Processor class
+
+    Params:
+        components (Sequence): Sequence of components that the system
+            will use to function. This includes generic entity settings
+            or persist data. Components include:
+                * RuntimeDebugPrint
+                * PD_Input_GroupBy_Agg
+                * PD_DataFrames
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
+
+        partials (Dict[int, PartialAggregation]): {entity: PartialAggregation} the
+            aggregations of streams that are not drained yet
+
+        lazy (bool): from the `lazy` argument, add the aggregation to a pending
+            `LazyPlan` of the entity, see `lazy_plan`, rather than running it straight
+            away, unless the entity is streamed or a `chunksize` is set
+
+        backend (Optional[str]): from the `backend` argument, "pandas" or "polars",
+            `None` to use the `backend` of each entity's `PD_DataFrames`
+
+        backend_fallbacks (Dict[int, str]): {entity: reason} why the last aggregation
+            of an entity on the "polars" backend ran on pandas
+
+        consumes (Sequence[str]): from the `consumes` argument, e.g. ["dataframe_2"],
+            the slots emptied once the aggregation is written, for pipelines where no
+            later processor reads them
+    """
+
+    def __init__(self, **kwargs):
+        self.components: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_GroupBy_Agg,
+            PD_DataFrames,
+        ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_GroupBy_Agg,
+        ]
+        self.writes: Sequence = [
+            PD_DataFrames,
+        ]
+        self.partials: Dict[int, PartialAggregation] = {}
+        self.lazy: bool = bool(kwargs.get("lazy", False))
+        self.backend: Optional[str] = kwargs.get("backend")
+        self.backend_fallbacks: Dict[int, str] = {}
+        self.consumes: Sequence[str] = list(kwargs.get("consumes", []))
+        for slot in self.consumes:
+            if slot not in DATAFRAME_SLOTS:
+                raise ValueError(
+                    f"Unknown slot: '{slot!r}', expected one of {DATAFRAME_SLOTS}"
+                )
+
+    def aggregate_frame(
+        self,
+        ent: int,
+        pd_input_groupby_agg: PD_Input_GroupBy_Agg,
+        pd_dataframes: PD_DataFrames,
+        frame,
+    ):
+        """`groupby` and `agg` the whole frame at once."""
+        if backend_of(self.backend, pd_dataframes) == "polars":
+            result, reason = aggregate_polars(
+                frame,
+                pd_dataframes.group_by_columns,
+                pd_dataframes.agg_columns,
+                sort=pd_input_groupby_agg.sort,
+                dropna=pd_input_groupby_agg.dropna,
+            )
+            if result is not None:
+                self.backend_fallbacks.pop(ent, None)
+                return result
+            self.backend_fallbacks[ent] = reason
+        return frame.groupby(
+            pd_dataframes.group_by_columns,
+            sort=pd_input_groupby_agg.sort,
+            observed=pd_input_groupby_agg.observed,
+            dropna=pd_input_groupby_agg.dropna,
+        ).agg(pd_dataframes.agg_columns)
+
+    def plan_step(
+        self,
+        ent: int,
+        pd_input_groupby_agg: PD_Input_GroupBy_Agg,
+        pd_dataframes: PD_DataFrames,
+    ) -> PlanStep:
+        """The aggregation as a step of a `LazyPlan`."""
+
+        def run(frame):
+            result = self.aggregate_frame(
+                ent, pd_input_groupby_agg, pd_dataframes, frame
+            )
+            return result if pd_input_groupby_agg.as_index else result.reset_index()
+
+        return PlanStep(
+            name="pd_groupby_agg",
+            source=pd_input_groupby_agg.source,
+            target=pd_input_groupby_agg.target,
+            run=run,
+            reads=list(pd_dataframes.group_by_columns)
+            + list(pd_dataframes.agg_columns),
+            consumes=self.consumes,
+        )
+
+    def aggregate(
+        self,
+        ent: int,
+        pd_input_groupby_agg: PD_Input_GroupBy_Agg,
+        pd_dataframes: PD_DataFrames,
+    ):
+        """The aggregation of the `source`, or `None` while a stream is not drained."""
+        frame = slot_frame(pd_dataframes, pd_input_groupby_agg.source)
+        streamed = pd_dataframes.stream is not None or ent in self.partials
+        if not streamed and pd_input_groupby_agg.chunksize is None:
+            return self.aggregate_frame(ent, pd_input_groupby_agg, pd_dataframes, frame)
+
+        partial = self.partials.get(ent)
+        if partial is None:
+            partial = self.partials[ent] = PartialAggregation(
+                pd_dataframes.group_by_columns,
+                pd_dataframes.agg_columns,
+                sort=pd_input_groupby_agg.sort,
+                observed=pd_input_groupby_agg.observed,
+                dropna=pd_input_groupby_agg.dropna,
+            )
+        chunksize = pd_input_groupby_agg.chunksize or max(len(frame), 1)
+        for start in range(0, len(frame), chunksize):
+            partial.add(frame.iloc[start : start + chunksize])
+
+        if pd_dataframes.stream is not None:
+            return None
+        del self.partials[ent]
+        if partial.chunks == 0:
+            # Nothing to merge, aggregate the empty frame for its columns
+            return self.aggregate_frame(ent, pd_input_groupby_agg, pd_dataframes, frame)
+        return partial.result()
+
+    def process(self):
+        """Generic naming convention `process` to allow for every processor to run
+        specific logic, providing a generic interface for us to engage with.
+
+        It uses the `components` parameter to fetch the components from the world
+        """
+        for ent, (
+            runtime_debug_print,
+            pd_input_groupby_agg,
+            pd_dataframes,
+        ) in self.world.get_components(*self.components):
+            if pd_input_groupby_agg.source not in DATAFRAME_SLOTS:
+                raise ValueError(
+                    f"Unknown slot: '{pd_input_groupby_agg.source!r}', expected one of {DATAFRAME_SLOTS}"
+                )
+            if pd_input_groupby_agg.target not in TARGET_SLOTS:
+                raise ValueError(
+                    f"Unknown target: '{pd_input_groupby_agg.target!r}', expected one of {TARGET_SLOTS}"
+                )
+            if not pd_dataframes.group_by_columns or not pd_dataframes.agg_columns:
+                continue
+
+            if (
+                self.lazy
+                and pd_dataframes.plan is not None
+                and pd_dataframes.stream is None
+                and pd_input_groupby_agg.chunksize is None
+                and ent not in self.partials
+            ):
+                plan_of(pd_dataframes).add(
+                    pd_dataframes,
+                    self.plan_step(ent, pd_input_groupby_agg, pd_dataframes),
+                )
+                result = None
+            else:
+                result = self.aggregate(ent, pd_input_groupby_agg, pd_dataframes)
+            if result is not None:
+                if not pd_input_groupby_agg.as_index:
+                    result = result.reset_index()
+                setattr(pd_dataframes, pd_input_groupby_agg.target, result)
+                release_slots(pd_dataframes, self.consumes)
+
+            if runtime_debug_print.runtime_debug_flag is True:
+                print()
+                print("PD_GroupBy_Agg")
+                print("============")
+                print()
+                print("ent: ", ent)
+                print()
+                print("pd_input_groupby_agg:")
+                print(pd_input_groupby_agg)
+                if ent in self.partials:
+                    print()
+                    print("chunks aggregated: ", self.partials[ent].chunks)
+                if ent in self.backend_fallbacks:
+                    print()
+                    print("pandas fallback: ", self.backend_fallbacks[ent])
+                if pd_dataframes.plan is not None:
+                    print()
+                    print("plan: ", pd_dataframes.plan.explain())
+                print()
+                print("pd_dataframes:")
+                print(pd_dataframes)
+                if runtime_debug_print.pause_execution is True:
+                    print()
+                    input("Enter to continue execution:")
+
+    def end_tick(self) -> None:
+        """Execute the `LazyPlan` of every entity once the tick is done."""
+        if self.lazy:
+            execute_plans(self.world)
+
+
+def register() -> None:
+    """use `processor_factory` to register the `PD_GroupBy_Agg` component as 'pd_groupby_agg'"""
+    processor_factory.register("pd_groupby_agg", PD_GroupBy_Agg)
@@ -0,0 +1,152 @@
+"""Shrink the dtypes of a dataframe, column by column, keeping only the conversions that
+save memory."""
+
+import importlib.util
+from typing import Any, List, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnSavings(NamedTuple):
+    """The conversion of a column, and the memory it saved
+
+    Params:
+        slot (str): the `PD_DataFrames` slot of the column
+
+        column (str): the column
+
+        from_dtype (str): the dtype before
+
+        to_dtype (str): the dtype after
+
+        bytes_before (int): the memory of the column before, including object values
+
+        bytes_after (int): the memory of the column after
+    """
+
+    slot: str
+    column: str
+    from_dtype: str
+    to_dtype: str
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def _column_bytes(series: Any) -> int:
+    return int(series.memory_usage(index=False, deep=True))
+
+
+def _downcast_integer(series: Any, unsigned: bool) -> Any:
+    if unsigned and len(series) and series.min() >= 0:
+        return pd.to_numeric(series, downcast="unsigned")
+    return pd.to_numeric(series, downcast="integer")
+
+
+def _downcast_float(series: Any) -> Optional[Any]:
+    """float64 to float32, if every value round trips exactly."""
+    if series.dtype != np.float64:
+        return None
+    values = series.to_numpy()
+    downcast = values.astype(np.float32)
+    if not np.array_equal(downcast.astype(np.float64), values, equal_nan=True):
+        return None
+    return pd.Series(downcast, index=series.index, name=series.name)
+
+
+def _convert_object(
+    series: Any,
+    categorical_ratio: float,
+    max_categories: Optional[int],
+    arrow_strings: bool,
+) -> Optional[Any]:
+    """`category` or `string[pyarrow]`, `None` for columns holding unhashable values,
+    e.g. lists or dicts, which neither can hold."""
+    try:
+        distinct = series.nunique(dropna=True)
+    except TypeError:
+        # unhashable type
+        return None
+    if distinct <= len(series) * categorical_ratio and (
+        max_categories is None or distinct <= max_categories
+    ):
+        return series.astype("category")
+    if (
+        arrow_strings
+        and importlib.util.find_spec("pyarrow") is not None
+        and pd.api.types.infer_dtype(series, skipna=True) == "string"
+    ):
+        return series.astype("string[pyarrow]")
+    return None
+
+
+def optimize_dtypes(
+    frame: Any,
+    slot: str,
+    exclude: List[str],
+    downcast_integers: bool = True,
+    unsigned: bool = False,
+    downcast_floats: bool = True,
+    categorical_ratio: float = 0.5,
+    max_categories: Optional[int] = None,
+    arrow_strings: bool = False,
+) -> List[ColumnSavings]:
+    """Convert the columns of a dataframe, in place, to smaller dtypes, keeping a
+    conversion only if the column gets smaller.
+
+    Columns are replaced one at a time, so at most one extra column is held in memory.
+    Columns with duplicate names are left as they are.
+
+    Args:
+        frame (Any): the dataframe, changed in place
+
+        slot (str): the slot of the dataframe, for the report
+
+        exclude (List[str]): columns left as they are
+
+        See `PD_Input_Optimize_Dtypes` for the other arguments
+
+    Returns:
+        List[ColumnSavings]: the columns converted
+    """
+    savings: List[ColumnSavings] = []
+    duplicated = set(frame.columns[frame.columns.duplicated()])
+    for column in list(frame.columns):
+        if column in exclude or column in duplicated:
+            continue
+        series = frame[column]
+        dtype = series.dtype
+        converted = None
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+        if pd.api.types.is_integer_dtype(dtype) and downcast_integers:
+            converted = _downcast_integer(series, unsigned)
+        elif pd.api.types.is_float_dtype(dtype) and downcast_floats:
+            converted = _downcast_float(series)
+        elif pd.api.types.is_object_dtype(dtype):
+            converted = _convert_object(
+                series, categorical_ratio, max_categories, arrow_strings
+            )
+        if converted is None or converted.dtype == dtype:
+            continue
+
+        bytes_before = _column_bytes(series)
+        bytes_after = _column_bytes(converted)
+        if bytes_after >= bytes_before:
+            continue
+        frame[column] = converted
+        savings.append(
+            ColumnSavings(
+                slot=slot,
+                column=str(column),
+                from_dtype=str(dtype),
+                to_dtype=str(converted.dtype),
+                bytes_before=bytes_before,
+                bytes_after=bytes_after,
+            )
+        )
+    return savings
@@ -0,0 +1,196 @@
+import sys
+import os.path
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from esper import Processor
+
+from bspec.processors import processor_factory
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.components.pd_input_optimize_dtypes.pd_input_optimize_dtypes import (
+    PD_Input_Optimize_Dtypes,
+)
+from bspec.components.pd_dataframe.pd_dataframes import (
+    DATAFRAME_SLOTS,
+    PD_DataFrames,
+    slot_frame,
+)
+from bspec.components.pd_dataframe.step_cache import (
+    set_slot_fingerprint,
+    slot_fingerprint,
+    step_key,
+)
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+#######################################
+#  Import Required Processor Modules: #
+#######################################
+try:
+    import pandas as pd  # noqa: E402
+except ImportError:
+    module_name = "pandas"
+    dynamic_module_install(module_name, requirements_dict)
+    import pandas as pd  # noqa: E402
+
+from bspec.processors.pd_optimize_dtypes.dtype_optimizer import (  # noqa: E402
+    ColumnSavings,
+    optimize_dtypes,
+)
+
+#########################
+#  Define some Systems: #
+#########################
+
+
+@dataclass
+class PD_Optimize_Dtypes(Processor):
+    """Shrink the dtypes of `PD_DataFrames` slots in place: downcast numeric columns,
+    and convert low cardinality object columns to `category` (or other string columns
+    to Arrow strings), keeping only the conversions that save memory.
+
+    Args:
+        Processor (_type_): ECS framework `esper`'s Processor class
+
+    Params:
+        components (Sequence): Sequence of components that the system
+            will use to function. This includes generic entity settings
+            or persist data. Components include:
+                * RuntimeDebugPrint
+                * PD_Input_Optimize_Dtypes
+                * PD_DataFrames
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
+
+        savings (Dict[int, List[ColumnSavings]]): {entity: [ColumnSavings]} the columns
+            converted by the last run, with the bytes saved by each
+    """
+
+    def __init__(self, **kwargs):
+        self.components: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_Optimize_Dtypes,
+            PD_DataFrames,
+        ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_Optimize_Dtypes,
+        ]
+        self.writes: Sequence = [
+            PD_DataFrames,
+        ]
+        self.savings: Dict[int, List[ColumnSavings]] = {}
+
+    def optimize_slot(
+        self,
+        pd_input_optimize_dtypes: PD_Input_Optimize_Dtypes,
+        pd_dataframes: PD_DataFrames,
+        slot: str,
+    ) -> List[ColumnSavings]:
+        """Optimize the dataframe in a slot, and carry its step cache fingerprint over
+        to the optimized dataframe."""
+        if slot not in DATAFRAME_SLOTS:
+            raise ValueError(
+                f"Unknown slot: '{slot!r}', expected one of {DATAFRAME_SLOTS}"
+            )
+        frame = slot_frame(pd_dataframes, slot)
+        if not isinstance(frame, pd.DataFrame):
+            return []
+
+        fingerprint: Optional[str] = slot_fingerprint(pd_dataframes, slot)
+        savings = optimize_dtypes(
+            frame,
+            slot,
+            exclude=pd_input_optimize_dtypes.exclude,
+            downcast_integers=pd_input_optimize_dtypes.downcast_integers,
+            unsigned=pd_input_optimize_dtypes.unsigned,
+            downcast_floats=pd_input_optimize_dtypes.downcast_floats,
+            categorical_ratio=pd_input_optimize_dtypes.categorical_ratio,
+            max_categories=pd_input_optimize_dtypes.max_categories,
+            arrow_strings=pd_input_optimize_dtypes.arrow_strings,
+        )
+        if savings:
+            # The dataframe changed in place, so it is now the result of this step
+            set_slot_fingerprint(
+                pd_dataframes,
+                slot,
+                None
+                if fingerprint is None
+                else step_key(
+                    "pd_optimize_dtypes", fingerprint, vars(pd_input_optimize_dtypes)
+                ),
+            )
+        return savings
+
+    def process(self):
+        """Generic naming convention `process` to allow for every processor to run
+        specific logic, providing a generic interface for us to engage with.
+
+        It uses the `components` parameter to fetch the components from the world
+        """
+        for ent, (
+            runtime_debug_print,
+            pd_input_optimize_dtypes,
+            pd_dataframes,
+        ) in self.world.get_components(*self.components):
+            self.savings[ent] = [
+                column_savings
+                for slot in pd_input_optimize_dtypes.slots
+                for column_savings in self.optimize_slot(
+                    pd_input_optimize_dtypes, pd_dataframes, slot
+                )
+            ]
+
+            if runtime_debug_print.runtime_debug_flag is True:
+                print()
+                print("PD_Optimize_Dtypes")
+                print("============")
+                print()
+                print("ent: ", ent)
+                print()
+                print("pd_input_optimize_dtypes:")
+                print(pd_input_optimize_dtypes)
+                print()
+                print("savings:")
+                for column_savings in self.savings[ent]:
+                    print(
+                        f"{column_savings.slot}.{column_savings.column}: "
+                        f"{column_savings.from_dtype} -> {column_savings.to_dtype}, "
+                        f"{column_savings.bytes_saved} bytes saved"
+                    )
+                print(
+                    "total: %d bytes saved"
+                    % sum(
+                        column_savings.bytes_saved
+                        for column_savings in self.savings[ent]
+                    )
+                )
+                print()
+                print("pd_dataframes:")
+                print(pd_dataframes)
+                if runtime_debug_print.pause_execution is True:
+                    print()
+                    input("Enter to continue execution:")
+
+
+def register() -> None:
+    """use `processor_factory` to register the `PD_Optimize_Dtypes` component as 'pd_optimize_dtypes'"""
+    processor_factory.register("pd_optimize_dtypes", PD_Optimize_Dtypes)
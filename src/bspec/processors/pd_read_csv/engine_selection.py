@@ -0,0 +1,240 @@
+"""Pick the fastest `read_csv` parser engine that supports the options in use, and fall
+back to the next engine, with a recorded reason, when pandas rejects an option."""
+
+import importlib.util
+import inspect
+import re
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+"""
+Engines from fastest to slowest
+"""
+ENGINES: Tuple[str, ...] = ("pyarrow", "c", "python")
+
+"""
+The options each engine rejects in pandas 1.5, used when the private sets of the
+installed pandas can not be imported, and pinned against the installed pandas by the
+tests
+"""
+FALLBACK_UNSUPPORTED_OPTIONS: Dict[str, FrozenSet[str]] = {
+    "pyarrow": frozenset(
+        {
+            "skipfooter",
+            "float_precision",
+            "chunksize",
+            "comment",
+            "nrows",
+            "thousands",
+            "memory_map",
+            "dialect",
+            "warn_bad_lines",
+            "error_bad_lines",
+            "on_bad_lines",
+            "delim_whitespace",
+            "quoting",
+            "lineterminator",
+            "converters",
+            "decimal",
+            "iterator",
+            "dayfirst",
+            "infer_datetime_format",
+            "verbose",
+            "skipinitialspace",
+            "low_memory",
+        }
+    ),
+    "c": frozenset({"skipfooter"}),
+    "python": frozenset({"low_memory", "float_precision"}),
+}
+
+try:
+    from pandas.io.parsers.readers import (
+        _c_unsupported,
+        _pyarrow_unsupported,
+        _python_unsupported,
+    )
+
+    UNSUPPORTED_OPTIONS: Dict[str, set] = {
+        "pyarrow": set(_pyarrow_unsupported),
+        "c": set(_c_unsupported),
+        "python": set(_python_unsupported),
+    }
+except ImportError:
+    UNSUPPORTED_OPTIONS = {
+        engine: set(options) for engine, options in FALLBACK_UNSUPPORTED_OPTIONS.items()
+    }
+
+"""
+The messages of the `ValueError`s pandas raises when an engine rejects an option, or is
+unknown, before any data is parsed
+"""
+REJECTED_OPTION_MESSAGES = re.compile(
+    r"not supported with the '\w+' engine"
+    r"|engine does not support"
+    r"|engine doesn't support"
+    r"|when using engine="
+    r"|if engine="
+    r"|engine cannot iterate"
+    r"|Unknown engine"
+)
+
+
+def rejected_option(error: BaseException) -> bool:
+    """Whether `error` is pandas rejecting an option of the engine, before parsing,
+    so the same read can be retried with the next engine.
+
+    Parse errors, missing files, permissions and memory errors are not, as every engine
+    would fail the same way, or a more lenient engine would read different data.
+
+    Args:
+        error (BaseException): the error `read_csv` raised
+
+    Returns:
+        bool: `True` if the next engine should be tried
+    """
+    return (
+        isinstance(error, ValueError)
+        and not isinstance(error, pd.errors.ParserError)
+        and REJECTED_OPTION_MESSAGES.search(str(error)) is not None
+    )
+
+
+READ_CSV_DEFAULTS: Dict[str, Any] = {
+    name: parameter.default
+    for name, parameter in inspect.signature(pd.read_csv).parameters.items()
+    if parameter.default is not inspect.Parameter.empty
+}
+
+"""
+Values, other than the `read_csv` default, that read the same as the default
+"""
+EQUIVALENT_DEFAULTS: Dict[str, Tuple[Any, ...]] = {
+    "on_bad_lines": ("error",),
+    "skipinitialspace": (None,),
+}
+
+
+def normalize_defaults(read_csv_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace values that read the same as the `read_csv` default with the default,
+    so an engine is not ruled out by an option that is effectively unset, e.g. the
+    `skipinitialspace=None` of `PD_Input_File_CSV`.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+    Returns:
+        Dict[str, Any]: the keyword arguments, with equivalent values replaced
+    """
+    return {
+        name: READ_CSV_DEFAULTS[name]
+        if value in EQUIVALENT_DEFAULTS.get(name, ())
+        else value
+        for name, value in read_csv_kwargs.items()
+    }
+
+
+def _is_default(name: str, value: Any) -> bool:
+    default = READ_CSV_DEFAULTS.get(name, None)
+    try:
+        return bool(value == default)
+    except (TypeError, ValueError):
+        return value is default
+
+
+def _separator(read_csv_kwargs: Dict[str, Any]) -> Any:
+    delimiter = read_csv_kwargs.get("delimiter", None)
+    return read_csv_kwargs.get("sep", None) if delimiter is None else delimiter
+
+
+def unsupported_options(engine: str, read_csv_kwargs: Dict[str, Any]) -> List[str]:
+    """The options, changed from the `read_csv` defaults, that `engine` can not parse.
+
+    Args:
+        engine (str): "pyarrow", "c" or "python"
+
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+    Returns:
+        List[str]: the unsupported options, with a description of the separator when it
+                    is a regular expression
+    """
+    unsupported = sorted(
+        name
+        for name in UNSUPPORTED_OPTIONS[engine]
+        if name in read_csv_kwargs and not _is_default(name, read_csv_kwargs[name])
+    )
+    separator = _separator(read_csv_kwargs)
+    if engine != "python" and isinstance(separator, str):
+        if len(separator) > 1 and separator != r"\s+":
+            unsupported.append(f"regex separator {separator!r}")
+    return unsupported
+
+
+def select_engines(read_csv_kwargs: Dict[str, Any]) -> Tuple[List[str], str]:
+    """The engines that support the options in use, fastest first.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments, `engine` is
+                    ignored
+
+    Returns:
+        Tuple[List[str], str]: the candidate engines, and why faster engines were
+                    ruled out
+    """
+    candidates: List[str] = []
+    reasons: List[str] = []
+    for engine in ENGINES:
+        if engine == "pyarrow" and importlib.util.find_spec("pyarrow") is None:
+            reasons.append("pyarrow: not installed")
+            continue
+        unsupported = unsupported_options(engine, read_csv_kwargs)
+        if unsupported and engine != "python":
+            reasons.append(f"{engine}: unsupported {', '.join(unsupported)}")
+            continue
+        candidates.append(engine)
+    return candidates, "; ".join(reasons)
+
+
+def read_csv_auto(
+    read_csv_kwargs: Dict[str, Any], engines: Optional[Sequence[str]] = None
+) -> Tuple[Any, str, str]:
+    """`read_csv` with the fastest compatible engine, falling back to the next engine
+    when pandas rejects an option of the engine before parsing, see `rejected_option`.
+    Any other error, e.g. a missing file or data that can not be parsed, is raised from
+    the engine that failed, as is the rejection of the last engine.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments, `engine` is
+                    replaced
+
+        engines (Sequence[str], optional): the engines to try, defaults to
+                    `select_engines`
+
+    Returns:
+        Tuple[Any, str, str]: what `read_csv` returned, the engine used, and the reason
+                    faster engines were not used, empty if the fastest engine was used
+    """
+    read_csv_kwargs = normalize_defaults(read_csv_kwargs)
+    reason = ""
+    if engines is None:
+        engines, reason = select_engines(read_csv_kwargs)
+    reasons: List[str] = [reason] if reason else []
+
+    # A buffer has to be rewound before it can be read again by the next engine
+    buffer = read_csv_kwargs.get("filepath_or_buffer")
+    position = buffer.tell() if callable(getattr(buffer, "tell", None)) else None
+
+    for index, engine in enumerate(engines):
+        try:
+            result = pd.read_csv(**{**read_csv_kwargs, "engine": engine})
+            return result, engine, "; ".join(reasons)
+        except Exception as e:
+            if index == len(engines) - 1 or not rejected_option(e):
+                raise
+            reasons.append(f"{engine}: {e}")
+            if position is not None:
+                buffer.seek(position)
+
+    raise ValueError("No `read_csv` engine to try")
@@ -0,0 +1,237 @@
+"""Read a CSV with the multithreaded Polars reader, for the `read_csv` options it reads
+the same way, and hand the result to pandas through Arrow."""
+
+import codecs
+import os
+import os.path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pandas._libs.parsers import STR_NA_VALUES
+
+from bspec.components.pd_dataframe.polars_backend import (
+    import_polars,
+    polars_errors,
+    to_pandas,
+)
+from bspec.processors.pd_read_csv.engine_selection import (
+    _is_default,
+    _separator,
+    normalize_defaults,
+)
+from bspec.processors.pd_read_csv.tail_read import COMPRESSED_EXTENSIONS
+
+
+"""
+Options that do not change what is read, or have no effect with the other options
+Polars supports
+"""
+POLARS_IGNORED_OPTIONS = frozenset(
+    {
+        "engine",
+        "verbose",
+        "low_memory",
+        "memory_map",
+        "cache_dates",
+        "infer_datetime_format",
+        "keep_date_col",
+        "dayfirst",
+        "float_precision",
+    }
+)
+
+"""
+Options translated to `polars.scan_csv` arguments, for the values checked in
+`polars_arguments`
+"""
+POLARS_OPTIONS = frozenset(
+    {
+        "filepath_or_buffer",
+        "sep",
+        "delimiter",
+        "header",
+        "names",
+        "usecols",
+        "skiprows",
+        "nrows",
+        "na_values",
+        "keep_default_na",
+        "na_filter",
+        "quotechar",
+        "encoding",
+        "encoding_errors",
+        "compression",
+        "parse_dates",
+        "index_col",
+    }
+)
+
+"""
+Rows Polars infers the column types from, before inferring them from every row if a
+later row does not fit
+"""
+INFER_SCHEMA_ROWS = 10_000
+
+
+def _null_values(read_csv_kwargs: Dict[str, Any]) -> Tuple[Optional[List[str]], str]:
+    """The strings `read_csv` parses as missing, or `None` and why Polars can not
+    parse missing values the same way.
+
+    Polars always reads an empty field of a numeric column as missing, so the empty
+    string has to be one of the missing values pandas parses too.
+    """
+    if not read_csv_kwargs.get("na_filter", True):
+        return None, "na_filter=False"
+    na_values = read_csv_kwargs.get("na_values")
+    if isinstance(na_values, dict):
+        return None, "na_values per column"
+    if na_values is None:
+        na_values = []
+    elif isinstance(na_values, str):
+        na_values = [na_values]
+    if not all(isinstance(value, str) for value in na_values):
+        return None, "na_values that are not strings"
+
+    null_values = set(na_values)
+    if read_csv_kwargs.get("keep_default_na", True):
+        null_values |= STR_NA_VALUES
+    if "" not in null_values:
+        return None, "empty fields are not parsed as missing"
+    return sorted(null_values), ""
+
+
+def polars_arguments(
+    read_csv_kwargs: Dict[str, Any]
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """The `polars.scan_csv` arguments that read a CSV as `read_csv` does.
+
+    Polars reads an empty field of a numeric column as missing, so CSVs read without
+    parsing missing values (`na_filter=False`, the `PD_Input_File_CSV` default) or
+    without parsing empty fields as missing are left to pandas.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], str]: the arguments, or `None` and why Polars
+                    can not read the CSV the same way
+    """
+    read_csv_kwargs = normalize_defaults(read_csv_kwargs)
+    unsupported = sorted(
+        name
+        for name, value in read_csv_kwargs.items()
+        if name not in POLARS_OPTIONS
+        and name not in POLARS_IGNORED_OPTIONS
+        and not _is_default(name, value)
+    )
+    if unsupported:
+        return None, f"unsupported options {unsupported}"
+
+    source = read_csv_kwargs["filepath_or_buffer"]
+    if not isinstance(source, (str, os.PathLike)):
+        return None, "not a local file"
+    source = os.fspath(source)
+    if "://" in source or not os.path.isfile(source):
+        return None, "not a local file"
+
+    compression = read_csv_kwargs.get("compression")
+    if compression not in (None, "infer") or source.lower().endswith(
+        COMPRESSED_EXTENSIONS
+    ):
+        return None, "compressed"
+
+    separator = _separator(read_csv_kwargs) or ","
+    if not isinstance(separator, str) or len(separator) != 1:
+        return None, f"separator {separator!r}"
+
+    header = read_csv_kwargs.get("header", "infer")
+    names = read_csv_kwargs.get("names")
+    if header not in ("infer", 0, None):
+        return None, f"header {header!r}"
+
+    if callable(read_csv_kwargs.get("usecols")):
+        return None, "callable usecols"
+
+    skiprows = read_csv_kwargs.get("skiprows")
+    if skiprows is not None and not isinstance(skiprows, int):
+        return None, "skiprows is not a number of rows"
+
+    encoding = read_csv_kwargs.get("encoding")
+    if encoding is not None and codecs.lookup(encoding).name != "utf-8":
+        return None, f"encoding {encoding!r}"
+    encoding_errors = read_csv_kwargs.get("encoding_errors")
+    if encoding_errors not in (None, "strict", "replace"):
+        return None, f"encoding_errors {encoding_errors!r}"
+
+    if read_csv_kwargs.get("index_col") not in (None, False):
+        return None, "index_col"
+    # `parse_dates=True` only parses the index
+    if read_csv_kwargs.get("parse_dates") not in (None, False, True):
+        return None, "parse_dates"
+
+    null_values, reason = _null_values(read_csv_kwargs)
+    if null_values is None:
+        return None, reason
+    return (
+        {
+            "source": source,
+            "has_header": header == 0 or (header == "infer" and names is None),
+            "new_columns": None if names is None else list(names),
+            "separator": separator,
+            "quote_char": read_csv_kwargs.get("quotechar", '"'),
+            "skip_rows": skiprows or 0,
+            "n_rows": read_csv_kwargs.get("nrows"),
+            "null_values": null_values,
+            "missing_utf8_is_empty_string": False,
+            "encoding": "utf8-lossy" if encoding_errors == "replace" else "utf8",
+        },
+        "",
+    )
+
+
+def _selected_columns(columns: List[str], usecols: Any) -> Optional[List[str]]:
+    """The columns `usecols` selects, in the order of the file as `read_csv` returns
+    them, `None` if one of them is not in the file."""
+    usecols = list(usecols)
+    if all(isinstance(column, int) for column in usecols):
+        if any(not 0 <= column < len(columns) for column in usecols):
+            return None
+        return [columns[column] for column in sorted(set(usecols))]
+    if any(column not in columns for column in usecols):
+        return None
+    return [column for column in columns if column in set(usecols)]
+
+
+def read_csv_polars(read_csv_kwargs: Dict[str, Any]) -> Tuple[Optional[Any], str]:
+    """Read a CSV with Polars' lazy, multithreaded, reader, parsing only the `usecols`.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+    Returns:
+        Tuple[Optional[Any], str]: the pandas dataframe, or `None` and why Polars can
+                    not read the CSV as `read_csv` does
+    """
+    arguments, reason = polars_arguments(read_csv_kwargs)
+    if arguments is None:
+        return None, reason
+
+    pl = import_polars()
+    usecols = read_csv_kwargs.get("usecols")
+    try:
+        for infer_schema_length in (INFER_SCHEMA_ROWS, None):
+            scan = pl.scan_csv(**arguments, infer_schema_length=infer_schema_length)
+            if usecols is not None:
+                columns = _selected_columns(scan.columns, usecols)
+                if columns is None:
+                    return None, "usecols not in the file"
+                scan = scan.select(columns)
+            try:
+                frame = scan.collect()
+                break
+            except pl.exceptions.ComputeError:
+                # A row after the first `INFER_SCHEMA_ROWS` does not fit the types
+                if infer_schema_length is None:
+                    raise
+    except polars_errors() as error:
+        return None, f"{type(error).__name__}: {error}".splitlines()[0]
+    return to_pandas(frame), ""
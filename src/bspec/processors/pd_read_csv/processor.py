@@ -1,17 +1,45 @@
 import sys
 import os.path
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
-from typing import Sequence
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from esper import Processor
 
 from bspec.processors import processor_factory
-from bspec.common_core.read_module_requirements import read_module_requirements
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.common_core.dynamic_module_install import dynamic_module_install
 
 from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
-from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
-from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_file_csv.pd_input_file_csv import (
+    EXECUTION_FIELDS,
+    PD_Input_File_CSV,
+    expand_filepaths,
+    read_csv_kwargs,
+)
+from bspec.components.pd_dataframe.pd_dataframes import DataFrameStream, PD_DataFrames
+from bspec.components.pd_dataframe.polars_backend import backend_of
+from bspec.components.pd_dataframe.lazy_plan import (
+    PlanStep,
+    execute_plans,
+    plan_of,
+)
+from bspec.components.pd_dataframe.step_cache import (
+    files_fingerprint,
+    run_step,
+    step_cache,
+    step_key,
+)
 
 ###########################################################################
 #  Load System Modules module_requirements.txt to support dynamic import: #
@@ -24,7 +52,7 @@ else:
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
 requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
-requirements_dict = read_module_requirements(requirements_path)
+requirements_dict = requirements_registry.read(requirements_path)
 
 #######################################
 #  Import Required Processor Modules: #
@@ -36,6 +64,95 @@ except ImportError:
     dynamic_module_install(module_name, requirements_dict)
     import pandas as pd  # noqa: E402
 
+from bspec.processors.pd_read_csv.engine_selection import read_csv_auto  # noqa: E402
+from bspec.processors.pd_read_csv.polars_read import read_csv_polars  # noqa: E402
+from bspec.processors.pd_read_csv.schema_cache import schema_cache  # noqa: E402
+from bspec.processors.pd_read_csv.tail_read import (  # noqa: E402
+    TailState,
+    read_tail,
+    tailable,
+)
+
+"""
+Pools to read multiple files on, by the `executor` of `PD_Input_File_CSV`
+"""
+executor_types = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+"""
+Rows read at a time by a lazy read that filters each chunk as it is read
+"""
+SCAN_CHUNK_ROWS = 1_000_000
+
+
+def read_csv_file(
+    csv_kwargs: Dict[str, Any], backend: str = "pandas"
+) -> Tuple[Any, str, str, float]:
+    """`read_csv` a single file, picking the engine when it is "auto", and time it.
+
+    On the "polars" backend the file is read by Polars when it can read it as
+    `read_csv` does, and by pandas otherwise.
+
+    This is a module level function so it can run on a process pool.
+
+    Args:
+        csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+        backend (str, optional): "pandas" or "polars". Defaults to "pandas".
+
+    Returns:
+        Tuple[Any, str, str, float]: what `read_csv` returned, the engine used, why
+                    faster engines were not used, and the seconds taken
+    """
+    start_time = time.perf_counter()
+    polars_reason = ""
+    if backend == "polars":
+        result, polars_reason = read_csv_polars(csv_kwargs)
+        if result is not None:
+            return result, "polars", "", time.perf_counter() - start_time
+
+    if csv_kwargs.get("engine") == "auto":
+        result, engine, reason = read_csv_auto(csv_kwargs)
+    else:
+        result = pd.read_csv(**csv_kwargs)
+        engine, reason = csv_kwargs.get("engine"), ""
+    if polars_reason:
+        reason = "; ".join(filter(None, [f"polars: {polars_reason}", reason]))
+    return result, engine, reason, time.perf_counter() - start_time
+
+
+def same_inference(first: Any, dtypes: Any) -> bool:
+    """Whether a chunk of a chunked read was inferred the same `dtypes` as the `first`
+    chunk, or numeric dtypes, which concatenate to the dtype a full read infers, e.g. an
+    int64 column where a later chunk has missing values.
+
+    Otherwise, e.g. integers in one chunk and strings in another, the chunks concatenate
+    to a column of mixed Python objects where a full read infers strings.
+
+    Args:
+        first (pd.Series): the `dtypes` of the first chunk
+
+        dtypes (pd.Series): the `dtypes` of a later chunk
+
+    Returns:
+        bool: the chunks concatenate to the dtypes of a full read
+    """
+    if not first.index.equals(dtypes.index):
+        return False
+    return all(
+        a == b or (a.kind in "iuf" and b.kind in "iuf") for a, b in zip(first, dtypes)
+    )
+
+
+def run_now(fn: Callable, *args) -> Future:
+    """`fn(*args)` run on the calling thread, as a completed `Future`."""
+    future: Future = Future()
+    try:
+        future.set_result(fn(*args))
+    except BaseException as error:
+        future.set_exception(error)
+    return future
+
+
 #########################
 #  Define some Systems: #
 #########################
@@ -45,6 +162,47 @@ except ImportError:
 class PD_Read_CSV(Processor):
     """Read a CSV using Pandas `read_csv`
 
+    With a `chunksize` (or `iterator`) set on `PD_Input_File_CSV`, the CSV is streamed:
+    each tick reads the next chunk into `dataframe_1`, so the processors that follow
+    handle one chunk at a time with bounded memory, and the processor is `pending`
+    until every chunk has been read. Use `PD_Sink_Stream` to collect, or write out, the
+    processed chunks.
+
+    With `engine="auto"` (the default) the fastest parser engine that supports the
+    options in use is picked, from `pyarrow`, `c` and `python`, falling back to the
+    next engine if pandas rejects it.
+
+    When `filepath_or_buffer` is a glob pattern or a list, the files are read
+    concurrently and concatenated, in order, into `dataframe_1`. The files are read on
+    the `file_pool` of the universe's `executor_service`, or else on a pool of the
+    component's `executor` and `file_workers`, created on first use and reused. The
+    files of an entity read on that same pool are read one after the other, by the
+    worker reading the entity. Streamed reads go through the files one after the other.
+
+    With a `schema_cache`, the schema inferred by the first full read of a file is
+    passed back as explicit `dtype` and `parse_dates` on later reads of the unchanged
+    file, streamed reads use the cached schema but never record one from a chunk.
+
+    With `lazy`, a full read of a single file is added to the `LazyPlan` of the entity
+    instead of running, so the `usecols` and row filters of the lazy processors that
+    follow are pushed into the read when the plan is executed at the end of the tick.
+
+    On the "polars" `backend`, full reads of local files are parsed by Polars'
+    multithreaded reader, for the options it reads the same way as `read_csv`, and
+    handed to `dataframe_1` through Arrow. Other reads fall back to pandas, and the
+    reason is recorded in `selected_engines`.
+
+    With `max_workers`, the full reads of every entity are run concurrently on a
+    thread pool of that size, the parsers release the GIL, so a world with many CSV
+    entities reads them on as many cores. An error is raised against the first entity
+    whose read failed, once every read has finished. With a `pool`, the entities are
+    read on that thread pool of the universe's `executor_service` instead, shared with
+    the processors of every world, a `pool` without an `executor_service` raises.
+
+    With `incremental`, a single local file is read in full once, then each tick only
+    parses the lines appended since the last tick and appends them to `dataframe_1`,
+    reading the whole file again if it was truncated, rotated or rewritten.
+
     Args:
         Processor (_type_): ECS framework `esper`'s Processor class
 
@@ -55,6 +213,55 @@ class PD_Read_CSV(Processor):
                 * RuntimeDebugPrint
                 * PD_Input_File_CSV
                 * PD_DataFrames
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
+
+        selected_engines (Dict[int, Tuple[str, str]]): {entity: (engine, reason)} the
+            engine picked by `engine="auto"` for each entity, and why faster engines
+            were not used
+
+        file_timings (Dict[int, List[Tuple[str, int, float]]]): {entity: [(path, rows,
+            seconds)]} the rows and read time of each file, when reading multiple files
+
+        tail_states (Dict[int, TailState]): {entity: state} where the last
+            `incremental` read of each entity stopped
+
+        tail_reads (Dict[int, Tuple[int, str]]): {entity: (rows, reason)} the rows the
+            last `incremental` read parsed, and why it read the whole file, empty when
+            it only read the appended lines
+
+        step_cache (Optional[StepCache]): from the `step_cache` argument, e.g.
+            {"path": ".bspec_step_cache", "max_bytes": 1073741824}, reuse `dataframe_1`
+            while the files and `PD_Input_File_CSV` are unchanged, for full reads of
+            local files
+
+        lazy (bool): from the `lazy` argument, add reads to the `LazyPlan` of the
+            entity, see `lazy_plan`, rather than reading straight away. Reads that
+            are streamed, incremental, of several files or step cached are not lazy
+
+        backend (Optional[str]): from the `backend` argument, "pandas" or "polars",
+            `None` to use the `backend` of each entity's `PD_DataFrames`
+
+        max_workers (Optional[int]): from the `max_workers` argument, the number of
+            entities read at the same time, `None` to read them one after the other
+
+        read_errors (Dict[int, BaseException]): {entity: error} the reads that failed
+            during the last concurrent read of the entities
+
+        executor_service (Optional[ExecutorService]): the pools shared by the universe,
+            injected by `universe` as the `executor_service` argument
+
+        pool (Optional[str]): from the `pool` argument, the thread pool of the
+            `executor_service` to read the entities on, e.g. "thread"
+
+        file_pool (Optional[str]): from the `file_pool` argument, the pool of the
+            `executor_service` to read the files of a glob pattern or list on, defaults
+            to the pool named after the `executor` of `PD_Input_File_CSV`, "thread" or
+            "process", as the default pools of the `executor_service` are
     """
 
     def __init__(self, **kwargs):
@@ -63,6 +270,440 @@ class PD_Read_CSV(Processor):
             PD_Input_File_CSV,
             PD_DataFrames,
         ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_File_CSV,
+        ]
+        self.writes: Sequence = [
+            PD_DataFrames,
+        ]
+        self.selected_engines: Dict[int, Tuple[str, str]] = {}
+        self.file_timings: Dict[int, List[Tuple[str, int, float]]] = {}
+        self.tail_states: Dict[int, TailState] = {}
+        self.tail_reads: Dict[int, Tuple[int, str]] = {}
+        self.step_cache = step_cache(kwargs.get("step_cache"))
+        self.lazy: bool = bool(kwargs.get("lazy", False))
+        self.backend: Optional[str] = kwargs.get("backend")
+        self.max_workers: Optional[int] = kwargs.get("max_workers")
+        if self.max_workers is not None and (
+            not isinstance(self.max_workers, int) or self.max_workers < 1
+        ):
+            raise ValueError(
+                f"`max_workers` must be a positive integer, got: {self.max_workers!r}"
+            )
+        self.read_errors: Dict[int, BaseException] = {}
+        self.executor_service = kwargs.get("executor_service")
+        self.pool: Optional[str] = kwargs.get("pool")
+        self.file_pool: Optional[str] = kwargs.get("file_pool")
+        for argument in ("pool", "file_pool"):
+            if getattr(self, argument) is not None and self.executor_service is None:
+                raise ValueError(
+                    f"`{argument}` needs the `executor_service` of the universe"
+                )
+        if self.pool is not None:
+            if self.executor_service.pool(self.pool).executor_name != "thread":
+                raise ValueError(
+                    f"Entities can only be read on a `thread` pool, not `{self.pool}`"
+                )
+        self._executor: Optional[Executor] = None
+        self._file_executors: Dict[Tuple[str, Optional[int]], Executor] = {}
+        self._file_executors_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict:
+        # Pools and locks can not be pickled, the pools are recreated on first use
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_file_executors"] = {}
+        del state["_file_executors_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._file_executors_lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        """The pool the entities are read on: the shared `pool` of the
+        `executor_service`, or else a pool of `max_workers` created on first use and
+        reused for every tick."""
+        if self.pool is not None:
+            return self.executor_service.pool(self.pool)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def file_executor(self, pd_input_file_csv: PD_Input_File_CSV) -> Executor:
+        """The pool the files of a glob pattern or list are read on: the `file_pool` of
+        the `executor_service`, or else a pool of the component's `executor` and
+        `file_workers` created on first use and reused for every tick."""
+        if self.executor_service is not None:
+            return self.executor_service.pool(
+                self.file_pool or pd_input_file_csv.executor
+            )
+        key = (pd_input_file_csv.executor, pd_input_file_csv.file_workers)
+        # Entities read concurrently may ask for the same pool at once
+        with self._file_executors_lock:
+            if key not in self._file_executors:
+                self._file_executors[key] = executor_types[pd_input_file_csv.executor](
+                    max_workers=pd_input_file_csv.file_workers
+                )
+            return self._file_executors[key]
+
+    def _record_engine(
+        self,
+        ent: int,
+        pd_input_file_csv: PD_Input_File_CSV,
+        engine: str,
+        reason: str,
+        backend: str = "pandas",
+    ) -> None:
+        if pd_input_file_csv.engine == "auto" or backend != "pandas":
+            self.selected_engines[ent] = (engine, reason)
+
+    def prepare_schema(
+        self,
+        pd_input_file_csv: PD_Input_File_CSV,
+        csv_kwargs: Dict[str, Any],
+        backend: str = "pandas",
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Apply the cached schema of the file, when the component has a
+        `schema_cache`, see `SchemaCache.prepare`. Polars infers its own schema."""
+        cache = schema_cache(pd_input_file_csv.schema_cache)
+        if cache is None or backend != "pandas":
+            return csv_kwargs, None
+        return cache.prepare(csv_kwargs, pd_input_file_csv.schema_categories)
+
+    def record_schema(
+        self,
+        pd_input_file_csv: PD_Input_File_CSV,
+        csv_kwargs: Dict[str, Any],
+        fingerprint: Optional[Dict[str, Any]],
+        frame: Any,
+        engine: str,
+    ) -> None:
+        """Cache the schema of a file read without a cached schema, and the engine
+        that read it."""
+        if fingerprint is not None:
+            schema_cache(pd_input_file_csv.schema_cache).record(
+                csv_kwargs, fingerprint, frame, engine
+            )
+
+    def read_step_key(
+        self, pd_input_file_csv: PD_Input_File_CSV, backend: str = "pandas"
+    ) -> Optional[str]:
+        """The step cache key of a full read, `None` if the read can not be cached."""
+        if self.step_cache is None or pd_input_file_csv.incremental:
+            return None
+        filepaths = expand_filepaths(pd_input_file_csv.filepath_or_buffer)
+        fingerprint = files_fingerprint(
+            [pd_input_file_csv.filepath_or_buffer] if filepaths is None else filepaths
+        )
+        if fingerprint is None:
+            return None
+        # Every field that changes the dataframe read, including the schema cache
+        # options and the `incremental` mode, and the backend it is read on
+        settings = {
+            key: value
+            for key, value in vars(pd_input_file_csv).items()
+            if key not in EXECUTION_FIELDS
+        }
+        settings["backend"] = backend
+        return step_key("pd_read_csv", fingerprint, settings)
+
+    def read_csv(
+        self,
+        ent: int,
+        pd_input_file_csv: PD_Input_File_CSV,
+        backend: str = "pandas",
+        reading_on: Optional[Executor] = None,
+    ) -> Any:
+        """`read_csv` with the settings of the `pd_input_file_csv` component of `ent`,
+        picking the engine when it is "auto", and reading every file of a glob pattern
+        or list, see `read_csv_files`."""
+        pd_input_file_csv_kwargs = read_csv_kwargs(pd_input_file_csv)
+        streamed = pd_input_file_csv.chunksize is not None or pd_input_file_csv.iterator
+        filepaths = expand_filepaths(pd_input_file_csv.filepath_or_buffer)
+        if pd_input_file_csv.incremental and tailable(pd_input_file_csv_kwargs):
+            return self.read_csv_tail(ent, pd_input_file_csv, pd_input_file_csv_kwargs)
+        if filepaths is None:
+            csv_kwargs, fingerprint = self.prepare_schema(
+                pd_input_file_csv, pd_input_file_csv_kwargs, backend
+            )
+            result, engine, reason, _ = read_csv_file(csv_kwargs, backend)
+            self._record_engine(ent, pd_input_file_csv, engine, reason, backend)
+            if not streamed:
+                self.record_schema(
+                    pd_input_file_csv,
+                    pd_input_file_csv_kwargs,
+                    fingerprint,
+                    result,
+                    engine,
+                )
+            return result
+
+        if streamed:
+            return self.stream_csv_files(
+                ent, pd_input_file_csv, pd_input_file_csv_kwargs, filepaths
+            )
+        return self.read_csv_files(
+            ent,
+            pd_input_file_csv,
+            pd_input_file_csv_kwargs,
+            filepaths,
+            backend,
+            reading_on,
+        )
+
+    def lazy_readable(self, pd_input_file_csv: PD_Input_File_CSV) -> bool:
+        """Whether a full read can be added to a `LazyPlan`."""
+        return (
+            self.lazy
+            and self.step_cache is None
+            and not pd_input_file_csv.incremental
+            and expand_filepaths(pd_input_file_csv.filepath_or_buffer) is None
+        )
+
+    def scan_csv(
+        self,
+        ent: int,
+        pd_input_file_csv: PD_Input_File_CSV,
+        backend: str,
+        columns: Optional[List[str]],
+        chunk: Optional[Any],
+    ) -> Any:
+        """The `LazyPlan` scan of a single file: read only `columns`, unless the
+        component already selects `usecols` or an `index_col`, and apply `chunk` to
+        each `SCAN_CHUNK_ROWS` rows as they are read.
+
+        Each chunk infers its own dtypes, so when a chunk is inferred dtypes that would
+        not concatenate to those of a full read, see `same_inference`, the file is read
+        again at once, to give the same dataframe as without a plan."""
+        pd_input_file_csv_kwargs = read_csv_kwargs(pd_input_file_csv)
+        if (
+            columns is not None
+            and pd_input_file_csv.usecols is None
+            and pd_input_file_csv.index_col in (None, False)
+        ):
+            pd_input_file_csv_kwargs["usecols"] = columns
+        csv_kwargs, fingerprint = self.prepare_schema(
+            pd_input_file_csv, pd_input_file_csv_kwargs, backend
+        )
+        # The pyarrow engine can not read in chunks, Polars reads the whole file
+        # faster than pandas reads it in chunks, and a buffer can not be read again
+        # should the chunks disagree on a dtype
+        chunked = (
+            chunk is not None
+            and pd_input_file_csv.engine != "pyarrow"
+            and backend == "pandas"
+            and isinstance(pd_input_file_csv.filepath_or_buffer, (str, os.PathLike))
+        )
+        if chunked:
+            csv_kwargs = {**csv_kwargs, "chunksize": SCAN_CHUNK_ROWS}
+
+        result, engine, reason, _ = read_csv_file(csv_kwargs, backend)
+        self._record_engine(ent, pd_input_file_csv, engine, reason, backend)
+        if not chunked:
+            self.record_schema(
+                pd_input_file_csv, pd_input_file_csv_kwargs, fingerprint, result, engine
+            )
+            return result if chunk is None else chunk(result)
+
+        frames: Optional[List] = []
+        first_dtypes = None
+        with result as reader:
+            for frame in reader:
+                if first_dtypes is None:
+                    first_dtypes = frame.dtypes
+                elif not same_inference(first_dtypes, frame.dtypes):
+                    frames = None
+                    break
+                frames.append(chunk(frame))
+        if frames is not None:
+            return pd.concat(frames, copy=False) if frames else pd.DataFrame()
+
+        result, _, _, _ = read_csv_file(
+            {key: value for key, value in csv_kwargs.items() if key != "chunksize"},
+            backend,
+        )
+        return chunk(result)
+
+    def read_csv_tail(
+        self,
+        ent: int,
+        pd_input_file_csv: PD_Input_File_CSV,
+        pd_input_file_csv_kwargs: Dict[str, Any],
+    ) -> Any:
+        """Every row of the file, parsing only the lines appended since the last read of
+        `ent`, see `read_tail`."""
+
+        def read(csv_kwargs: Dict[str, Any]) -> Any:
+            result, engine, reason, _ = read_csv_file(csv_kwargs)
+            self._record_engine(ent, pd_input_file_csv, engine, reason)
+            return result
+
+        state, rows, reason = read_tail(
+            pd_input_file_csv_kwargs, self.tail_states.get(ent), read
+        )
+        self.tail_reads[ent] = (rows, reason)
+        if state is None:
+            # Not even a complete header yet
+            self.tail_states.pop(ent, None)
+            return pd.DataFrame()
+        self.tail_states[ent] = state
+        return state.frame
+
+    def stream_csv_files(
+        self,
+        ent: int,
+        pd_input_file_csv: PD_Input_File_CSV,
+        pd_input_file_csv_kwargs: Dict[str, Any],
+        filepaths: List[str],
+    ) -> Iterator:
+        """The chunks of every file, one file after the other, each file is only opened
+        once the previous one is drained."""
+        for filepath in filepaths:
+            csv_kwargs, _ = self.prepare_schema(
+                pd_input_file_csv,
+                {**pd_input_file_csv_kwargs, "filepath_or_buffer": filepath},
+            )
+            reader, engine, reason, _ = read_csv_file(csv_kwargs)
+            self._record_engine(ent, pd_input_file_csv, engine, reason)
+            yield from reader
+
+    def read_csv_files(
+        self,
+        ent: int,
+        pd_input_file_csv: PD_Input_File_CSV,
+        pd_input_file_csv_kwargs: Dict[str, Any],
+        filepaths: List[str],
+        backend: str = "pandas",
+        reading_on: Optional[Executor] = None,
+    ) -> Any:
+        """Read the files concurrently on the `file_executor`, and concatenate them in
+        order without copying the data again.
+
+        Work on a pool must not wait on other work of the same pool, so when the entity
+        is read `reading_on` the `file_executor` itself, the files are read one after
+        the other on the calling worker instead."""
+        files_kwargs = [
+            {**pd_input_file_csv_kwargs, "filepath_or_buffer": filepath}
+            for filepath in filepaths
+        ]
+        prepared = [
+            self.prepare_schema(pd_input_file_csv, csv_kwargs, backend)
+            for csv_kwargs in files_kwargs
+        ]
+        executor = self.file_executor(pd_input_file_csv)
+        if executor is reading_on:
+            futures = [
+                run_now(read_csv_file, csv_kwargs, backend)
+                for csv_kwargs, _ in prepared
+            ]
+        else:
+            futures = [
+                executor.submit(read_csv_file, csv_kwargs, backend)
+                for csv_kwargs, _ in prepared
+            ]
+
+        if pd_input_file_csv.show_progress:
+            future_filepaths = dict(zip(futures, filepaths))
+            for done, future in enumerate(as_completed(futures), start=1):
+                if future.exception() is not None:
+                    continue
+                frame, engine, _, seconds = future.result()
+                print(
+                    f"[{done}/{len(futures)}] {future_filepaths[future]}: "
+                    f"{len(frame)} rows in {seconds:.3f}s ({engine})"
+                )
+
+        frames: List = []
+        file_timings: List[Tuple[str, int, float]] = []
+        for filepath, csv_kwargs, (_, fingerprint), future in zip(
+            filepaths, files_kwargs, prepared, futures
+        ):
+            frame, engine, reason, seconds = future.result()
+            self._record_engine(ent, pd_input_file_csv, engine, reason, backend)
+            self.record_schema(
+                pd_input_file_csv, csv_kwargs, fingerprint, frame, engine
+            )
+            frames.append(frame)
+            file_timings.append((filepath, len(frame), seconds))
+
+        self.file_timings[ent] = file_timings
+        return pd.concat(frames, ignore_index=True, copy=False)
+
+    def read_entity(
+        self,
+        ent: int,
+        pd_input_file_csv: PD_Input_File_CSV,
+        pd_dataframes: PD_DataFrames,
+        backend: str,
+        reading_on: Optional[Executor] = None,
+    ) -> None:
+        """Read the whole CSV of `ent` into `dataframe_1`, through the step cache, on a
+        worker of `reading_on` when the entities are read concurrently."""
+
+        def read() -> None:
+            pd_dataframes.dataframe_1 = self.read_csv(
+                ent, pd_input_file_csv, backend, reading_on
+            )
+
+        run_step(
+            self.step_cache,
+            self.read_step_key(pd_input_file_csv, backend),
+            pd_dataframes,
+            ["dataframe_1"],
+            read,
+        )
+
+    def read_entities(self, entities: List[Tuple[int, Tuple[Any, ...]]]) -> List[int]:
+        """Read the full reads of `entities` concurrently on the `executor`.
+
+        Every read runs to the end, so the entities that were read keep their
+        `dataframe_1`, before the error of the first entity whose read failed is raised.
+
+        Args:
+            entities (List[Tuple[int, Tuple[Any, ...]]]): the entities and components of
+                        `world.get_components`
+
+        Raises:
+            RuntimeError: from the error of the first entity that failed, naming it
+
+        Returns:
+            List[int]: the entities that were read
+        """
+        futures: Dict[int, Future] = {}
+        executor = self.executor
+        for ent, (_, pd_input_file_csv, pd_dataframes) in entities:
+            streamed = (
+                pd_input_file_csv.chunksize is not None or pd_input_file_csv.iterator
+            )
+            if streamed or self.lazy_readable(pd_input_file_csv):
+                continue
+            futures[ent] = executor.submit(
+                self.read_entity,
+                ent,
+                pd_input_file_csv,
+                pd_dataframes,
+                backend_of(self.backend, pd_dataframes),
+                executor,
+            )
+        wait(futures.values())
+
+        self.read_errors = {
+            ent: future.exception()
+            for ent, future in futures.items()
+            if future.exception() is not None
+        }
+        if self.read_errors:
+            ent, error = next(iter(self.read_errors.items()))
+            others = list(self.read_errors)[1:]
+            raise RuntimeError(
+                f"PD_Read_CSV failed to read entity {ent}: "
+                f"{type(error).__name__}: {error}"
+                + (f" (entities {others} failed too)" if others else "")
+            ) from error
+        return list(futures)
 
     def process(self):
         """Generic naming convention `process` to allow for every processor to run
@@ -70,13 +711,40 @@ class PD_Read_CSV(Processor):
 
         It uses the `components` parameter to fetch the components from the world
         """
+        entities = list(self.world.get_components(*self.components))
+        concurrent = self.max_workers is not None or self.pool is not None
+        read = self.read_entities(entities) if concurrent else []
         for ent, (
             runtime_debug_print,
             pd_input_file_csv,
             pd_dataframes,
-        ) in self.world.get_components(*self.components):
-            pd_input_file_csv_kwargs = vars(pd_input_file_csv)
-            pd_dataframes.dataframe_1 = pd.read_csv(**pd_input_file_csv_kwargs)
+        ) in entities:
+            backend = backend_of(self.backend, pd_dataframes)
+            streamed = (
+                pd_input_file_csv.chunksize is not None or pd_input_file_csv.iterator
+            )
+            if not streamed and self.lazy_readable(pd_input_file_csv):
+                plan_of(pd_dataframes).add(
+                    pd_dataframes,
+                    PlanStep(
+                        name="pd_read_csv",
+                        target="dataframe_1",
+                        run=functools.partial(
+                            self.scan_csv, ent, pd_input_file_csv, backend
+                        ),
+                    ),
+                )
+            elif not streamed:
+                if ent not in read:
+                    self.read_entity(ent, pd_input_file_csv, pd_dataframes, backend)
+            else:
+                if pd_dataframes.stream is None:
+                    pd_dataframes.stream = DataFrameStream(
+                        self.read_csv(ent, pd_input_file_csv)
+                    )
+                pd_dataframes.dataframe_1 = pd_dataframes.stream.pull()
+                if pd_dataframes.stream.drained:
+                    pd_dataframes.stream = None
 
             if runtime_debug_print.runtime_debug_flag is True:
                 print()
@@ -87,6 +755,31 @@ class PD_Read_CSV(Processor):
                 print()
                 print("pd_input_file_csv:")
                 print(pd_input_file_csv)
+                if ent in self.selected_engines:
+                    print()
+                    print("engine: %s (%s)" % self.selected_engines[ent])
+                if ent in self.file_timings:
+                    print()
+                    print("file_timings:")
+                    for filepath, rows, seconds in self.file_timings[ent]:
+                        print(f"{filepath}: {rows} rows in {seconds:.3f}s")
+                if ent in self.tail_reads:
+                    rows, reason = self.tail_reads[ent]
+                    print()
+                    print(
+                        f"incremental: {rows} rows"
+                        + (f", full read ({reason})" if reason else " appended")
+                    )
+                if self.step_cache is not None:
+                    print()
+                    print("step_cache: ", self.step_cache.stats())
+                if pd_dataframes.plan is not None:
+                    print()
+                    print("plan: ", pd_dataframes.plan.explain())
+                cache = schema_cache(pd_input_file_csv.schema_cache)
+                if cache is not None:
+                    print()
+                    print(f"schema_cache: {cache.hits} hits, {cache.misses} misses")
                 print()
                 print("pd_dataframes:")
                 print(pd_dataframes)
@@ -94,6 +787,18 @@ class PD_Read_CSV(Processor):
                     print()
                     input("Enter to continue execution:")
 
+    def pending(self) -> bool:
+        """Whether a streamed CSV still has chunks left to read."""
+        return any(
+            pd_dataframes.stream is not None
+            for _, pd_dataframes in self.world.get_component(PD_DataFrames)
+        )
+
+    def end_tick(self) -> None:
+        """Execute the `LazyPlan` of every entity once the tick is done."""
+        if self.lazy:
+            execute_plans(self.world)
+
 
 def register() -> None:
     """use `processor_factory` to register the `PD_Read_CSV` component as 'pd_read_csv'"""
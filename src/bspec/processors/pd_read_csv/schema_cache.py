@@ -0,0 +1,317 @@
+"""Remember the schema pandas infers for a CSV file, and feed it back as explicit `dtype`
+and `parse_dates` arguments on later reads of the same, unchanged, file."""
+
+import hashlib
+import json
+import os
+import os.path
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from bspec.processors.pd_read_csv.engine_selection import select_engines
+
+
+"""
+Bytes read from the start of a file to fingerprint its header
+"""
+HEADER_BYTES = 64 * 1024
+
+"""
+Object columns with at most this ratio of distinct values to rows are categorical
+candidates
+"""
+CATEGORY_RATIO = 0.5
+
+"""
+`read_csv` arguments that do not change the schema of what is read, left out of the
+options fingerprint
+"""
+SCHEMA_INDEPENDENT_OPTIONS = frozenset(
+    {
+        "filepath_or_buffer",
+        "infer_datetime_format",
+        "iterator",
+        "chunksize",
+        "low_memory",
+        "memory_map",
+        "verbose",
+        "cache_dates",
+        "storage_options",
+    }
+)
+
+
+def _local_filepath(filepath_or_buffer: Any) -> Optional[str]:
+    if not isinstance(filepath_or_buffer, (str, os.PathLike)):
+        return None
+    filepath = os.fspath(filepath_or_buffer)
+    if "://" in filepath or not os.path.isfile(filepath):
+        return None
+    return os.path.abspath(filepath)
+
+
+def cacheable(read_csv_kwargs: Dict[str, Any]) -> bool:
+    """Whether the schema of a read can be cached and replayed: a local file, without an
+    index, converters, date parser, or combined date columns.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+    Returns:
+        bool: the schema can be cached
+    """
+    parse_dates = read_csv_kwargs.get("parse_dates")
+    dtype = read_csv_kwargs.get("dtype")
+    return (
+        _local_filepath(read_csv_kwargs.get("filepath_or_buffer")) is not None
+        and read_csv_kwargs.get("index_col") in (None, False)
+        and read_csv_kwargs.get("converters") is None
+        and read_csv_kwargs.get("date_parser") is None
+        and (dtype is None or isinstance(dtype, dict))
+        and (
+            parse_dates is None
+            or isinstance(parse_dates, bool)
+            or (
+                isinstance(parse_dates, (list, tuple))
+                and all(isinstance(column, str) for column in parse_dates)
+            )
+        )
+    )
+
+
+def fingerprint(read_csv_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Identify a file, and the options it is read with, so a cached schema is only
+    used while neither change.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments of a local
+                    file, see `cacheable`
+
+    Returns:
+        Dict[str, Any]: the size, modification time, header hash and options hash
+    """
+    filepath = _local_filepath(read_csv_kwargs["filepath_or_buffer"])
+    stat = os.stat(filepath)
+    with open(filepath, "rb") as file:
+        header = file.readline(HEADER_BYTES)
+    options = repr(
+        sorted(
+            (key, repr(value))
+            for key, value in read_csv_kwargs.items()
+            if key not in SCHEMA_INDEPENDENT_OPTIONS
+        )
+    )
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "header": hashlib.blake2b(header, digest_size=16).hexdigest(),
+        "options": hashlib.blake2b(options.encode(), digest_size=16).hexdigest(),
+    }
+
+
+def infer_schema(frame: Any) -> Optional[Dict[str, Any]]:
+    """The schema pandas inferred for a DataFrame.
+
+    Args:
+        frame (Any): the DataFrame `read_csv` returned
+
+    Returns:
+        Optional[Dict[str, Any]]: {"dtype": {column: dtype name}, "parse_dates":
+                    [column], "categorical": [column]}, or `None` if the columns are
+                    not all named, e.g. without a header
+    """
+    if not all(isinstance(column, str) for column in frame.columns):
+        return None
+
+    dtype: Dict[str, str] = {}
+    parse_dates: List[str] = []
+    categorical: List[str] = []
+    for column, column_dtype in frame.dtypes.items():
+        if pd.api.types.is_datetime64_any_dtype(column_dtype):
+            parse_dates.append(column)
+            continue
+        dtype[column] = str(column_dtype)
+        if pd.api.types.is_object_dtype(column_dtype) and len(frame):
+            if frame[column].nunique() <= len(frame) * CATEGORY_RATIO:
+                categorical.append(column)
+    return {"dtype": dtype, "parse_dates": parse_dates, "categorical": categorical}
+
+
+def apply_schema(
+    read_csv_kwargs: Dict[str, Any],
+    schema: Dict[str, Any],
+    categories: bool = False,
+    engine: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Replace inference with a cached schema.
+
+    The `dtype` set on the component wins over the cached dtype of a column. Engines
+    parse the same file differently, e.g. which values are missing, so with
+    `engine="auto"` the `engine` the schema was inferred with is used again.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+        schema (Dict[str, Any]): the cached schema, see `infer_schema`
+
+        categories (bool, optional): read the categorical candidates as `category`.
+                    Defaults to False.
+
+        engine (Optional[str], optional): the engine the schema was inferred with.
+                    Defaults to None, to leave the engine as it is.
+
+    Returns:
+        Dict[str, Any]: the keyword arguments with explicit `dtype` and `parse_dates`
+    """
+    dtype: Dict[str, str] = dict(schema["dtype"])
+    if categories:
+        dtype.update((column, "category") for column in schema["categorical"])
+    dtype.update(read_csv_kwargs.get("dtype") or {})
+
+    schema_kwargs: Dict[str, Any] = {
+        **read_csv_kwargs,
+        "dtype": dtype,
+        "parse_dates": list(schema["parse_dates"]) or False,
+    }
+    # Unless the engine does not support the other options, e.g. a `chunksize`
+    if engine is not None and read_csv_kwargs.get("engine") == "auto":
+        if engine in select_engines(schema_kwargs)[0]:
+            schema_kwargs["engine"] = engine
+    return schema_kwargs
+
+
+class SchemaCache:
+    """Schemas by file path, in memory, and persisted to a JSON file when a `path` is
+    given, so they survive between runs.
+
+    A schema is used only while the size, modification time and header of the file,
+    and the options it is read with, match those it was inferred from, and is read
+    with the engine it was inferred with.
+
+    Thread safe, so files can be read concurrently.
+
+    Params:
+        path (Optional[str]): the JSON file the schemas are persisted to
+
+        hits (int): reads that used a cached schema
+
+        misses (int): reads that inferred the schema
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if path is not None and os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as file:
+                    self._schemas = json.load(file)
+            except (OSError, ValueError):
+                self._schemas = {}
+
+    def prepare(
+        self, read_csv_kwargs: Dict[str, Any], categories: bool = False
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Apply the cached schema of a file to its `read_csv` arguments.
+
+        Args:
+            read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+            categories (bool, optional): see `apply_schema`. Defaults to False.
+
+        Returns:
+            Tuple[Dict[str, Any], Optional[Dict[str, Any]]]: the keyword arguments, and
+                        the fingerprint to `record` the schema with after the read, or
+                        `None` when the cached schema was used or can not be cached
+        """
+        if not cacheable(read_csv_kwargs):
+            return read_csv_kwargs, None
+
+        filepath = _local_filepath(read_csv_kwargs["filepath_or_buffer"])
+        file_fingerprint = fingerprint(read_csv_kwargs)
+        with self._lock:
+            entry = self._schemas.get(filepath)
+            if (
+                entry is not None
+                and entry["fingerprint"] == file_fingerprint
+                and entry.get("engine") is not None
+            ):
+                self.hits += 1
+                schema_kwargs = apply_schema(
+                    read_csv_kwargs, entry["schema"], categories, entry["engine"]
+                )
+                return schema_kwargs, None
+            self.misses += 1
+        return read_csv_kwargs, file_fingerprint
+
+    def record(
+        self,
+        read_csv_kwargs: Dict[str, Any],
+        file_fingerprint: Dict[str, Any],
+        frame: Any,
+        engine: str,
+    ) -> None:
+        """Cache the schema inferred by a read, and persist it.
+
+        Args:
+            read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+            file_fingerprint (Dict[str, Any]): the fingerprint `prepare` returned
+
+            frame (Any): the DataFrame read, the whole file, not a chunk
+
+            engine (str): the engine the file was read with
+        """
+        schema = infer_schema(frame)
+        if schema is None:
+            return
+
+        filepath = _local_filepath(read_csv_kwargs["filepath_or_buffer"])
+        with self._lock:
+            self._schemas[filepath] = {
+                "fingerprint": file_fingerprint,
+                "schema": schema,
+                "engine": engine,
+            }
+            self.save()
+
+    def save(self) -> None:
+        """Write the schemas to `path`, replacing the file in one step so a concurrent
+        reader never sees a partial file."""
+        if self.path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(self._schemas, file, indent=2, sort_keys=True)
+        os.replace(temporary_path, self.path)
+
+
+_schema_caches: Dict[Optional[str], SchemaCache] = {}
+_schema_caches_lock = threading.Lock()
+
+
+def schema_cache(path: Union[bool, str, os.PathLike, None]) -> Optional[SchemaCache]:
+    """The cache shared by every component with the same `schema_cache` setting.
+
+    Args:
+        path (Union[bool, str, os.PathLike, None]): the `schema_cache` of a
+                    `PD_Input_File_CSV`: a JSON file path, `True` for a cache in memory,
+                    or `None`/`False` for no cache
+
+    Returns:
+        Optional[SchemaCache]: the cache, or `None`
+    """
+    if path is None or path is False:
+        return None
+    key = None if path is True else os.path.abspath(os.fspath(path))
+    with _schema_caches_lock:
+        cache = _schema_caches.get(key)
+        if cache is None:
+            cache = _schema_caches[key] = SchemaCache(key)
+        return cache
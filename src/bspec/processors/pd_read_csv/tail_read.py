@@ -0,0 +1,285 @@
+"""Read an append only CSV incrementally: remember the byte offset and header of the last
+read, and parse only the complete lines appended since, reloading the whole file when it
+is truncated, rotated or rewritten."""
+
+import codecs
+import io
+import os
+import os.path
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from bspec.processors.pd_read_csv.schema_cache import apply_schema, infer_schema
+
+
+"""
+Bytes read at a time when searching backwards for the end of the last complete line
+"""
+BLOCK_BYTES = 64 * 1024
+
+"""
+Bytes before the offset that must be unchanged for the file to count as appended to
+"""
+TAIL_CHECK_BYTES = 256
+
+"""
+Extensions `read_csv` decompresses with `compression="infer"`, which can not be read
+from a byte offset
+"""
+COMPRESSED_EXTENSIONS = (".gz", ".bz2", ".zip", ".xz", ".zst", ".tar", ".tgz")
+
+
+@dataclass
+class TailState:
+    """Where the last read of a file stopped
+
+    Params:
+        device (int): the device of the file, with `inode`, identifies a rotated file
+
+        inode (int): the inode of the file
+
+        offset (int): the byte offset after the last complete line read
+
+        header (bytes): the header line, prefixed to the appended bytes so they parse
+                    with the same columns
+
+        tail (bytes): the bytes just before `offset`, to detect a rewritten file
+
+        frame (Any): every row read so far
+    """
+
+    device: int
+    inode: int
+    offset: int
+    header: bytes
+    tail: bytes
+    frame: Any
+
+
+class _BoundedReader(io.RawIOBase):
+    """A binary file, read from its current position up to `end`, so a full read stops
+    at the last complete line even while the file is appended to."""
+
+    def __init__(self, file: io.BufferedReader, end: int):
+        self._file = file
+        self._start = file.tell()
+        self._end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.tell()
+        elif whence == io.SEEK_END:
+            offset += self._end - self._start
+        self._file.seek(self._start + max(0, offset))
+        return self.tell()
+
+    def tell(self) -> int:
+        return self._file.tell() - self._start
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._end - self._file.tell())
+        if size <= 0:
+            return 0
+        data = self._file.read(size)
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _has_header(read_csv_kwargs: Dict[str, Any]) -> bool:
+    header = read_csv_kwargs.get("header", "infer")
+    if header == "infer":
+        return read_csv_kwargs.get("names") is None
+    return header == 0
+
+
+def tailable(read_csv_kwargs: Dict[str, Any]) -> bool:
+    """Whether a read can be incremental: a single, uncompressed, local file, with one
+    header line or none, without skipped rows, footer, row limit, index or chunks.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments
+
+    Returns:
+        bool: appended lines can be parsed on their own
+    """
+    filepath = read_csv_kwargs.get("filepath_or_buffer")
+    if not isinstance(filepath, (str, os.PathLike)):
+        return False
+    filepath = os.fspath(filepath)
+    compression = read_csv_kwargs.get("compression", "infer")
+    encoding = read_csv_kwargs.get("encoding")
+    return (
+        "://" not in filepath
+        and os.path.isfile(filepath)
+        and (
+            compression is None
+            or compression == "infer"
+            and not filepath.lower().endswith(COMPRESSED_EXTENSIONS)
+        )
+        and (
+            encoding is None
+            or not codecs.lookup(encoding).name.startswith(("utf-16", "utf-32"))
+        )
+        and read_csv_kwargs.get("header", "infer") in ("infer", 0, None)
+        and not read_csv_kwargs.get("skiprows")
+        and not read_csv_kwargs.get("skipfooter")
+        and read_csv_kwargs.get("nrows") is None
+        and read_csv_kwargs.get("index_col") in (None, False)
+        and read_csv_kwargs.get("chunksize") is None
+        and not read_csv_kwargs.get("iterator")
+        and read_csv_kwargs.get("lineterminator") is None
+    )
+
+
+def _complete_end(file: io.BufferedReader, start: int, size: int) -> int:
+    """The offset after the last newline between `start` and `size`, or `start` when
+    there is not a complete line."""
+    end = size
+    while end > start:
+        block_start = max(start, end - BLOCK_BYTES)
+        file.seek(block_start)
+        newline = file.read(end - block_start).rfind(b"\n")
+        if newline != -1:
+            return block_start + newline + 1
+        end = block_start
+    return start
+
+
+def _reload_reason(
+    file: io.BufferedReader, stat: os.stat_result, state: TailState
+) -> Optional[str]:
+    """Why the file can not be read from the offset of the last read, if it can not."""
+    if (stat.st_dev, stat.st_ino) != (state.device, state.inode):
+        return "rotated"
+    if stat.st_size < state.offset:
+        return "truncated"
+    file.seek(0)
+    if file.read(len(state.header)) != state.header:
+        return "header changed"
+    file.seek(state.offset - len(state.tail))
+    if file.read(len(state.tail)) != state.tail:
+        return "rewritten"
+    return None
+
+
+def _full_read(
+    read_csv_kwargs: Dict[str, Any],
+    file: io.BufferedReader,
+    stat: os.stat_result,
+    read: Callable[[Dict[str, Any]], Any],
+) -> Optional[TailState]:
+    header = b""
+    if _has_header(read_csv_kwargs):
+        file.seek(0)
+        header = file.readline()
+        if not header.endswith(b"\n"):
+            return None
+
+    end = _complete_end(file, 0, stat.st_size)
+    file.seek(0)
+    frame = read(
+        {
+            **read_csv_kwargs,
+            "filepath_or_buffer": io.BufferedReader(_BoundedReader(file, end)),
+            "memory_map": False,
+        }
+    )
+    file.seek(max(0, end - TAIL_CHECK_BYTES))
+    return TailState(
+        device=stat.st_dev,
+        inode=stat.st_ino,
+        offset=end,
+        header=header,
+        tail=file.read(end - max(0, end - TAIL_CHECK_BYTES)),
+        frame=frame,
+    )
+
+
+def _appended_read(
+    read_csv_kwargs: Dict[str, Any],
+    file: io.BufferedReader,
+    stat: os.stat_result,
+    state: TailState,
+    read: Callable[[Dict[str, Any]], Any],
+) -> Tuple[TailState, int]:
+    end = _complete_end(file, state.offset, stat.st_size)
+    if end == state.offset:
+        return state, 0
+
+    file.seek(state.offset)
+    appended = io.BytesIO(state.header + file.read(end - state.offset))
+    appended_kwargs = {
+        **read_csv_kwargs,
+        "filepath_or_buffer": appended,
+        "memory_map": False,
+    }
+    # Parse the new rows with the dtypes of the rows read so far, so the columns keep
+    # their dtype when concatenated, unless the new rows do not fit them
+    schema = infer_schema(state.frame)
+    try:
+        if schema is None:
+            raise ValueError("no schema")
+        frame = read(apply_schema(appended_kwargs, schema))
+    except (ValueError, TypeError):
+        appended.seek(0)
+        frame = read(appended_kwargs)
+
+    file.seek(max(0, end - TAIL_CHECK_BYTES))
+    tail = file.read(end - max(0, end - TAIL_CHECK_BYTES))
+    return (
+        TailState(
+            device=state.device,
+            inode=state.inode,
+            offset=end,
+            header=state.header,
+            tail=tail,
+            frame=pd.concat([state.frame, frame], ignore_index=True, copy=False),
+        ),
+        len(frame),
+    )
+
+
+def read_tail(
+    read_csv_kwargs: Dict[str, Any],
+    state: Optional[TailState],
+    read: Callable[[Dict[str, Any]], Any],
+) -> Tuple[Optional[TailState], int, str]:
+    """Read the lines appended to a file since `state`, or the whole file.
+
+    A last line without a newline is left for the next read, as it may still be being
+    written.
+
+    Args:
+        read_csv_kwargs (Dict[str, Any]): the `read_csv` keyword arguments, see
+                    `tailable`
+
+        state (Optional[TailState]): where the last read stopped, `None` to read the
+                    whole file
+
+        read (Callable[[Dict[str, Any]], Any]): reads a DataFrame from `read_csv`
+                    keyword arguments
+
+    Returns:
+        Tuple[Optional[TailState], int, str]: where this read stopped, with every row
+                    read so far, `None` if the file does not have a complete header
+                    yet, the rows read, and why the whole file was read, empty for an
+                    incremental read
+    """
+    filepath = os.fspath(read_csv_kwargs["filepath_or_buffer"])
+    with open(filepath, "rb") as file:
+        stat = os.fstat(file.fileno())
+        reason = "first read" if state is None else _reload_reason(file, stat, state)
+        if reason is None:
+            state, rows = _appended_read(read_csv_kwargs, file, stat, state, read)
+            return state, rows, ""
+
+        state = _full_read(read_csv_kwargs, file, stat, read)
+        return state, 0 if state is None else len(state.frame), reason
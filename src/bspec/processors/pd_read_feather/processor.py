@@ -0,0 +1,151 @@
+import sys
+import os.path
+from dataclasses import dataclass
+from typing import Sequence
+
+from esper import Processor
+
+from bspec.processors import processor_factory
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.components.pd_input_file_feather.pd_input_file_feather import (
+    PD_Input_File_Feather,
+)
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+#######################################
+#  Import Required Processor Modules: #
+#######################################
+try:
+    import pyarrow.dataset as ds  # noqa: E402
+    import pyarrow.feather as feather  # noqa: E402
+    from pyarrow import fs  # noqa: E402
+    from pyarrow.parquet import filters_to_expression  # noqa: E402
+except ImportError:
+    module_name = "pyarrow"
+    dynamic_module_install(module_name, requirements_dict)
+    import pyarrow.dataset as ds  # noqa: E402
+    import pyarrow.feather as feather  # noqa: E402
+    from pyarrow import fs  # noqa: E402
+    from pyarrow.parquet import filters_to_expression  # noqa: E402
+
+from bspec.processors.pd_read_parquet.arrow_filters import arrow_filters  # noqa: E402
+
+#########################
+#  Define some Systems: #
+#########################
+
+
+@dataclass
+class PD_Read_Feather(Processor):
+    """Read a Feather (Arrow IPC) file, or dataset, into a Pandas DataFrame using `pyarrow`
+
+    Only the `columns` asked for are read, record batches are filtered by the `filters`
+    while they are scanned, and local files are memory mapped by default.
+
+    Args:
+        Processor (_type_): ECS framework `esper`'s Processor class
+
+    Params:
+        components (Sequence): Sequence of components that the system
+            will use to function. This includes generic entity settings
+            or persist data. Components include:
+                * RuntimeDebugPrint
+                * PD_Input_File_Feather
+                * PD_DataFrames
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
+    """
+
+    def __init__(self, **kwargs):
+        self.components: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_File_Feather,
+            PD_DataFrames,
+        ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_File_Feather,
+        ]
+        self.writes: Sequence = [
+            PD_DataFrames,
+        ]
+
+    @staticmethod
+    def read_table(pd_input_file_feather: PD_Input_File_Feather):
+        """Read the `pyarrow` Table, a single local file without `filters` is read
+        directly, anything else is scanned as a dataset."""
+        path = pd_input_file_feather.path
+        filters = arrow_filters(pd_input_file_feather.filters)
+        if filters is None and os.path.isfile(path):
+            return feather.read_table(
+                path,
+                columns=pd_input_file_feather.columns,
+                memory_map=pd_input_file_feather.memory_map,
+                use_threads=pd_input_file_feather.use_threads,
+            )
+
+        filesystem = None
+        if pd_input_file_feather.memory_map and "://" not in path:
+            filesystem = fs.LocalFileSystem(use_mmap=True)
+        dataset = ds.dataset(path, format="ipc", filesystem=filesystem)
+        return dataset.to_table(
+            columns=pd_input_file_feather.columns,
+            filter=None if filters is None else filters_to_expression(filters),
+            use_threads=pd_input_file_feather.use_threads,
+        )
+
+    def process(self):
+        """Generic naming convention `process` to allow for every processor to run
+        specific logic, providing a generic interface for us to engage with.
+
+        It uses the `components` parameter to fetch the components from the world
+        """
+        for ent, (
+            runtime_debug_print,
+            pd_input_file_feather,
+            pd_dataframes,
+        ) in self.world.get_components(*self.components):
+            pd_dataframes.dataframe_1 = self.read_table(
+                pd_input_file_feather
+            ).to_pandas(use_threads=pd_input_file_feather.use_threads)
+
+            if runtime_debug_print.runtime_debug_flag is True:
+                print()
+                print("PD_Read_Feather")
+                print("============")
+                print()
+                print("ent: ", ent)
+                print()
+                print("pd_input_file_feather:")
+                print(pd_input_file_feather)
+                print()
+                print("pd_dataframes:")
+                print(pd_dataframes)
+                if runtime_debug_print.pause_execution is True:
+                    print()
+                    input("Enter to continue execution:")
+
+
+def register() -> None:
+    """use `processor_factory` to register the `PD_Read_Feather` component as 'pd_read_feather'"""
+    processor_factory.register("pd_read_feather", PD_Read_Feather)
@@ -0,0 +1,26 @@
+"""Convert JSON config predicates into the filters `pyarrow` expects."""
+
+from typing import Any, List, Optional, Tuple, Union
+
+Predicate = Tuple[str, str, Any]
+
+
+def arrow_filters(
+    filters: Optional[List],
+) -> Optional[Union[List[Predicate], List[List[Predicate]]]]:
+    """Convert predicates from JSON lists, `[column, op, value]`, into the tuples used
+    by `pyarrow`, keeping the AND (a list of predicates) or OR of ANDs (a list of
+    lists of predicates) structure.
+
+    Args:
+        filters (List, optional): the predicates from the config
+
+    Returns:
+        Optional[Union[List[Predicate], List[List[Predicate]]]]: the `pyarrow` filters,
+                    `None` when there are none
+    """
+    if not filters:
+        return None
+    if isinstance(filters[0][0], str):
+        return [tuple(predicate) for predicate in filters]
+    return [[tuple(predicate) for predicate in conjunction] for conjunction in filters]
@@ -0,0 +1,145 @@
+import sys
+import os.path
+from dataclasses import dataclass
+from typing import Sequence
+
+from esper import Processor
+
+from bspec.processors import processor_factory
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.components.pd_input_file_parquet.pd_input_file_parquet import (
+    PD_Input_File_Parquet,
+)
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+#######################################
+#  Import Required Processor Modules: #
+#######################################
+try:
+    import pandas as pd  # noqa: E402
+except ImportError:
+    module_name = "pandas"
+    dynamic_module_install(module_name, requirements_dict)
+    import pandas as pd  # noqa: E402
+
+try:
+    import pyarrow.parquet as pq  # noqa: E402
+except ImportError:
+    module_name = "pyarrow"
+    dynamic_module_install(module_name, requirements_dict)
+    import pyarrow.parquet as pq  # noqa: E402
+
+from bspec.processors.pd_read_parquet.arrow_filters import arrow_filters  # noqa: E402
+
+#########################
+#  Define some Systems: #
+#########################
+
+
+@dataclass
+class PD_Read_Parquet(Processor):
+    """Read a Parquet file, or dataset, into a Pandas DataFrame using `pyarrow`
+
+    Only the `columns` asked for are read, row groups that can not match the `filters`
+    are skipped using their statistics, and local files can be memory mapped.
+
+    Args:
+        Processor (_type_): ECS framework `esper`'s Processor class
+
+    Params:
+        components (Sequence): Sequence of components that the system
+            will use to function. This includes generic entity settings
+            or persist data. Components include:
+                * RuntimeDebugPrint
+                * PD_Input_File_Parquet
+                * PD_DataFrames
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
+    """
+
+    def __init__(self, **kwargs):
+        self.components: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_File_Parquet,
+            PD_DataFrames,
+        ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+            PD_Input_File_Parquet,
+        ]
+        self.writes: Sequence = [
+            PD_DataFrames,
+        ]
+
+    def process(self):
+        """Generic naming convention `process` to allow for every processor to run
+        specific logic, providing a generic interface for us to engage with.
+
+        It uses the `components` parameter to fetch the components from the world
+        """
+        for ent, (
+            runtime_debug_print,
+            pd_input_file_parquet,
+            pd_dataframes,
+        ) in self.world.get_components(*self.components):
+            if pd_input_file_parquet.storage_options is None:
+                pd_dataframes.dataframe_1 = pq.read_table(
+                    pd_input_file_parquet.path,
+                    columns=pd_input_file_parquet.columns,
+                    filters=arrow_filters(pd_input_file_parquet.filters),
+                    memory_map=pd_input_file_parquet.memory_map,
+                    use_threads=pd_input_file_parquet.use_threads,
+                    use_pandas_metadata=True,
+                ).to_pandas()
+            else:
+                # `storage_options` configure an fsspec filesystem, which pandas sets up
+                pd_dataframes.dataframe_1 = pd.read_parquet(
+                    pd_input_file_parquet.path,
+                    engine="pyarrow",
+                    columns=pd_input_file_parquet.columns,
+                    storage_options=pd_input_file_parquet.storage_options,
+                    filters=arrow_filters(pd_input_file_parquet.filters),
+                    memory_map=pd_input_file_parquet.memory_map,
+                    use_threads=pd_input_file_parquet.use_threads,
+                )
+
+            if runtime_debug_print.runtime_debug_flag is True:
+                print()
+                print("PD_Read_Parquet")
+                print("============")
+                print()
+                print("ent: ", ent)
+                print()
+                print("pd_input_file_parquet:")
+                print(pd_input_file_parquet)
+                print()
+                print("pd_dataframes:")
+                print(pd_dataframes)
+                if runtime_debug_print.pause_execution is True:
+                    print()
+                    input("Enter to continue execution:")
+
+
+def register() -> None:
+    """use `processor_factory` to register the `PD_Read_Parquet` component as 'pd_read_parquet'"""
+    processor_factory.register("pd_read_parquet", PD_Read_Parquet)
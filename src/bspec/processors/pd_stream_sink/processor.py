@@ -0,0 +1,143 @@
+import sys
+import os.path
+from dataclasses import dataclass
+from typing import Sequence
+
+from esper import Processor
+
+from bspec.processors import processor_factory
+from bspec.common_core.requirements_registry import requirements_registry
+from bspec.common_core.dynamic_module_install import dynamic_module_install
+
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.components.pd_stream_sink.pd_stream_sink import PD_Stream_Sink
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames, slot_frame
+
+###########################################################################
+#  Load System Modules module_requirements.txt to support dynamic import: #
+###########################################################################
+if getattr(sys, "frozen", False):
+    # running as bundle (aka frozen)
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    # running live
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+
+requirements_path = os.path.join(BASE_DIR, "requirements/module_requirements.txt")
+requirements_dict = requirements_registry.read(requirements_path)
+
+#######################################
+#  Import Required Processor Modules: #
+#######################################
+try:
+    import pandas as pd  # noqa: E402
+except ImportError:
+    module_name = "pandas"
+    dynamic_module_install(module_name, requirements_dict)
+    import pandas as pd  # noqa: E402
+
+#########################
+#  Define some Systems: #
+#########################
+
+
+@dataclass
+class PD_Sink_Stream(Processor):
+    """Collect, or write out, each processed chunk of a streamed Pandas read
+
+    While `PD_Read_CSV` streams a CSV one chunk per tick, every chunk in `source` is
+    appended to the `to_csv_path` file, and dropped once written. Only with a `target`
+    are the chunks kept until the stream is drained, when they are concatenated into
+    `target`. Without a stream, the whole dataframe is a single chunk.
+
+    Args:
+        Processor (_type_): ECS framework `esper`'s Processor class
+
+    Params:
+        components (Sequence): Sequence of components that the system
+            will use to function. This includes generic entity settings
+            or persist data. Components include:
+                * RuntimeDebugPrint
+                * PD_Stream_Sink
+                * PD_DataFrames
+
+        reads (Sequence): the components the system only reads
+
+        writes (Sequence): the components the system changes, systems in a world with
+            `parallel_processors` run in parallel unless one writes a component the
+            other reads or writes
+    """
+
+    def __init__(self, **kwargs):
+        self.components: Sequence = [
+            RuntimeDebugPrint,
+            PD_Stream_Sink,
+            PD_DataFrames,
+        ]
+        self.reads: Sequence = [
+            RuntimeDebugPrint,
+        ]
+        self.writes: Sequence = [
+            PD_Stream_Sink,
+            PD_DataFrames,
+        ]
+
+    def process(self):
+        """Generic naming convention `process` to allow for every processor to run
+        specific logic, providing a generic interface for us to engage with.
+
+        It uses the `components` parameter to fetch the components from the world
+        """
+        for ent, (
+            runtime_debug_print,
+            pd_stream_sink,
+            pd_dataframes,
+        ) in self.world.get_components(*self.components):
+            chunk = slot_frame(pd_dataframes, pd_stream_sink.source)
+
+            if pd_stream_sink.to_csv_path is not None:
+                first_chunk = pd_stream_sink.chunks_written == 0
+                chunk.to_csv(
+                    pd_stream_sink.to_csv_path,
+                    mode="w" if first_chunk else "a",
+                    header=first_chunk,
+                    index=pd_stream_sink.to_csv_index,
+                )
+                pd_stream_sink.chunks_written += 1
+
+            if pd_stream_sink.target is not None:
+                pd_stream_sink.chunks.append(chunk)
+
+            # The stream is drained, or there was no stream, so the sink is complete
+            if pd_dataframes.stream is None:
+                if pd_stream_sink.target is not None:
+                    setattr(
+                        pd_dataframes,
+                        pd_stream_sink.target,
+                        pd_stream_sink.chunks[0]
+                        if len(pd_stream_sink.chunks) == 1
+                        else pd.concat(pd_stream_sink.chunks),
+                    )
+                pd_stream_sink.chunks = []
+                pd_stream_sink.chunks_written = 0
+
+            if runtime_debug_print.runtime_debug_flag is True:
+                print()
+                print("PD_Stream_Sink")
+                print("============")
+                print()
+                print("ent: ", ent)
+                print()
+                print("pd_stream_sink:")
+                print(pd_stream_sink)
+                print()
+                print("pd_dataframes:")
+                print(pd_dataframes)
+                if runtime_debug_print.pause_execution is True:
+                    print()
+                    input("Enter to continue execution:")
+
+
+def register() -> None:
+    """use `processor_factory` to register the `PD_Sink_Stream` processor as 'pd_stream_sink'"""
+    processor_factory.register("pd_stream_sink", PD_Sink_Stream)
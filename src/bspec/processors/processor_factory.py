@@ -5,6 +5,8 @@ from uuid import uuid4
 
 from esper import Processor
 
+from bspec.common_core.frozen import thaw
+
 
 """
 Dictionary of functions defined by the key 'processor_name' within a 
@@ -44,20 +46,27 @@ def unregister(processor_name: str) -> None:
     processor_creation_funcs.pop(processor_name, None)
 
 
-def create(world_name: str, arguments: dict[str, Any]) -> Processor:
+def create(world_name: str, arguments: dict[str, Any], **injected: Any) -> Processor:
     """Create a processor of a specific name 'processor_name', given JSON data,
     and use all other 'objects' as key-value properties to init the processor class.
 
     Args:
         arguments (dict[str, Any]): any arguments for the processor
 
+        **injected (Any): shared objects passed to every processor next to its
+            arguments, e.g. the universe's `executor_service`, unless the arguments
+            set the same key
+
     Raises:
         ValueError: missing processor name in `processor_creation_funcs`
 
     Returns:
-        Processor:  the instantiated processor function with it's own arguments
+        Processor:  the instantiated processor function with it's own arguments,
+            and the `processor_name` it was created with
     """
-    args_copy = arguments.copy()
+    # Thaw into a mutable deep copy, the config may be read only and shared between
+    # the worlds of the same pipeline
+    args_copy = thaw(arguments)
     processor_name = args_copy.pop("processor_name")
     try:
         processor_uuid = processor_names_uuids[processor_name].pop(0)
@@ -77,4 +86,6 @@ def create(world_name: str, arguments: dict[str, Any]) -> Processor:
         creator_func = processor_creation_funcs[processor_uuid]
     except KeyError:
         raise ValueError(f"Unknown processor name: '{processor_name!r}'") from None
-    return creator_func(**args_copy)
+    processor = creator_func(**{**injected, **args_copy})
+    processor.processor_name = processor_name
+    return processor
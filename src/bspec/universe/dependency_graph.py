@@ -0,0 +1,188 @@
+"""Run the nodes of a dependency graph on a pool, as soon as their dependencies finish."""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+
+def check_for_cycles(dependencies: Mapping[Hashable, Iterable[Hashable]]) -> None:
+    """Raise a `ValueError` naming the cycle if `dependencies` are circular.
+
+    Args:
+        dependencies (Mapping[Hashable, Iterable[Hashable]]): {node: [nodes it depends on]}
+
+    Raises:
+        ValueError: circular dependency
+    """
+    visiting: Set[Hashable] = set()
+    visited: Set[Hashable] = set()
+
+    def visit(node: Hashable, path: List[Hashable]) -> None:
+        if node in visited:
+            return
+        if node in visiting:
+            cycle = " -> ".join(str(item) for item in path + [node])
+            raise ValueError(f"Circular dependency: {cycle}")
+        visiting.add(node)
+        for dependency in dependencies.get(node, []):
+            visit(dependency, path + [node])
+        visiting.discard(node)
+        visited.add(node)
+
+    for node in dependencies:
+        visit(node, [])
+
+
+def reachable(
+    entry_nodes: Union[Hashable, Iterable[Hashable]],
+    dependencies: Mapping[Hashable, Iterable[Hashable]],
+) -> List[Hashable]:
+    """Find the entry nodes and every node they transitively depend on.
+
+    Args:
+        entry_nodes (Union[Hashable, Iterable[Hashable]]): a node name, or node names, to
+                    start from
+
+        dependencies (Mapping[Hashable, Iterable[Hashable]]): {node: [nodes it depends on]},
+                    with an entry for every known node
+
+    Raises:
+        KeyError: unknown node
+
+    Returns:
+        List[Hashable]: the reachable nodes, in the order of `dependencies`
+    """
+    if isinstance(entry_nodes, str):
+        entry_nodes = [entry_nodes]
+
+    found: Set[Hashable] = set()
+    stack: List[Hashable] = list(entry_nodes)
+    while stack:
+        node = stack.pop()
+        if node in found:
+            continue
+        if node not in dependencies:
+            raise KeyError(f"Unknown name: `{node}`")
+        found.add(node)
+        stack.extend(dependencies[node])
+
+    return [node for node in dependencies if node in found]
+
+
+def run_in_dependency_order(
+    nodes: Sequence[Hashable],
+    dependencies: Mapping[Hashable, Iterable[Hashable]],
+    run: Callable[[Hashable], None],
+    submit: Callable[[Hashable], Future],
+    on_done: Optional[Callable[[Hashable, Future], None]] = None,
+) -> None:
+    """Run every node once its dependencies have finished, submitting independent
+    nodes together so they run concurrently.
+
+    Nothing can run alongside a lone ready node, so it is `run` on the calling thread
+    instead of being submitted, which saves the hand off to the pool.
+
+    Dependencies on nodes outside of `nodes` are ignored.
+
+    Args:
+        nodes (Sequence[Hashable]): the nodes to run, ready nodes are started in this order
+
+        dependencies (Mapping[Hashable, Iterable[Hashable]]): {node: [nodes it depends on]}
+
+        run (Callable[[Hashable], None]): run a node on the calling thread
+
+        submit (Callable[[Hashable], Future]): submit a node to a pool
+
+        on_done (Callable[[Hashable, Future], None], optional): called with each finished
+                    future, defaults to `future.result()` so exceptions are raised
+    """
+    scheduled: Set[Hashable] = set(nodes)
+    waiting_on: Dict[Hashable, Set[Hashable]] = {
+        node: set(dependencies.get(node, [])) & scheduled for node in nodes
+    }
+    finished: Set[Hashable] = set()
+    running: Dict[Future, Hashable] = {}
+
+    while waiting_on or running:
+        ready: List[Hashable] = [
+            node for node, depends_on in waiting_on.items() if depends_on <= finished
+        ]
+        for node in ready:
+            del waiting_on[node]
+
+        if len(ready) == 1 and not running:
+            run(ready[0])
+            finished.add(ready[0])
+            continue
+
+        for node in ready:
+            running[submit(node)] = node
+
+        if not running:
+            raise ValueError(f"Circular dependency between: {list(waiting_on)}")
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            node = running.pop(future)
+            if on_done is None:
+                future.result()
+            else:
+                on_done(node, future)
+            finished.add(node)
+
+
+async def arun_in_dependency_order(
+    nodes: Sequence[Hashable],
+    dependencies: Mapping[Hashable, Iterable[Hashable]],
+    run: Callable[[Hashable], Awaitable[None]],
+) -> None:
+    """Await every node once its dependencies have finished, running independent nodes
+    concurrently on the current event loop.
+
+    Dependencies on nodes outside of `nodes` are ignored, and a node is not run if one
+    of its dependencies raised.
+
+    Args:
+        nodes (Sequence[Hashable]): the nodes to run
+
+        dependencies (Mapping[Hashable, Iterable[Hashable]]): {node: [nodes it depends on]}
+
+        run (Callable[[Hashable], Awaitable[None]]): run a node
+    """
+    loop = asyncio.get_running_loop()
+    finished: Dict[Hashable, asyncio.Future] = {
+        node: loop.create_future() for node in nodes
+    }
+    for future in finished.values():
+        # A failure is raised by `gather`, do not also report it as never retrieved
+        future.add_done_callback(
+            lambda future: future.cancelled() or future.exception()
+        )
+
+    async def run_node(node: Hashable) -> None:
+        try:
+            for dependency in dependencies.get(node, []):
+                if dependency in finished:
+                    await finished[dependency]
+            await run(node)
+        except asyncio.CancelledError:
+            finished[node].cancel()
+            raise
+        except BaseException as e:
+            finished[node].set_exception(e)
+            raise
+        finished[node].set_result(None)
+
+    await asyncio.gather(*(run_node(node) for node in nodes))
@@ -0,0 +1,322 @@
+"""Thread and process pools owned by the universe and shared by every processor, sized to
+the CPUs the process may run on and the memory available, so that processors of many
+worlds wanting parallelism do not each start a pool of their own."""
+
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+"""
+Dictionary of executor classes defined by the key 'executor' of each pool within the
+`executor_service` config as the value
+"""
+executor_types: Dict[str, Callable[..., Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+"""
+The pools of the service when the `executor_service` config does not define any
+"""
+DEFAULT_POOLS: Dict[str, Dict[str, Any]] = {
+    "thread": {"executor": "thread"},
+    "process": {"executor": "process"},
+}
+
+
+def available_cpus() -> int:
+    """The CPUs the process may run on, from its CPU affinity where the platform has
+    one, e.g. when pinned with `taskset` or limited by a container cpuset."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def available_memory() -> Optional[int]:
+    """The bytes of memory available to start new workers with, `None` when the
+    platform does not tell."""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def pool_size(
+    executor: str,
+    max_workers: Optional[int] = None,
+    memory_per_worker_mb: Optional[float] = None,
+) -> int:
+    """The number of workers of a pool.
+
+    Thread pools default to the `concurrent.futures` default, `min(32, cpus + 4)`, from
+    the CPUs of the process' affinity rather than of the machine. Process pools default
+    to one worker per CPU, and are never larger, as CPU bound workers beyond that only
+    compete for the same cores. With `memory_per_worker_mb`, the pool is also limited to
+    the workers that fit in the memory available.
+
+    Args:
+        executor (str): "thread" or "process"
+
+        max_workers (int, optional): the configured size of the pool
+
+        memory_per_worker_mb (float, optional): the memory each worker is expected to
+                    use, in megabytes
+
+    Returns:
+        int: the number of workers, at least 1
+    """
+    cpus = available_cpus()
+    if executor == "process":
+        size = cpus if max_workers is None else min(max_workers, cpus)
+    else:
+        size = min(32, cpus + 4) if max_workers is None else max_workers
+
+    if memory_per_worker_mb:
+        memory = available_memory()
+        if memory is not None:
+            size = min(size, int(memory // (memory_per_worker_mb * 1024 * 1024)))
+    return max(size, 1)
+
+
+class SharedPool(Executor):
+    """A pool of the `ExecutorService`, counting the work submitted to it.
+
+    Work is only counted as it is submitted and completed, so the workers never run
+    anything but the submitted callable, and process pools work the same as thread
+    pools. Of the submitted work not yet completed, up to `max_workers` is counted as
+    running and the rest as queued.
+
+    Args:
+        name (str): the name of the pool in the `executor_service` config
+
+        executor (str): "thread" or "process"
+
+        max_workers (int): the number of workers, see `pool_size`
+    """
+
+    def __init__(self, name: str, executor: str, max_workers: int):
+        if executor not in executor_types:
+            raise ValueError(
+                f"Unknown executor of pool `{name}`: '{executor}', expected one of {list(executor_types)}"
+            )
+        self.name = name
+        self.executor_name = executor
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.submitted = 0
+        self.completed = 0
+        self._in_flight = 0
+        self._busy_seconds = 0.0
+        self._started = time.perf_counter()
+        self._changed = self._started
+
+    def __getstate__(self) -> Dict:
+        # Pools and locks can not be pickled, the pool is recreated on first use
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._reset_counters()
+
+    @property
+    def executor(self) -> Executor:
+        """The pool is created on first use and reused until shut down."""
+        if self._executor is None:
+            self._executor = executor_types[self.executor_name](
+                max_workers=self.max_workers
+            )
+            with self._lock:
+                # Utilization is measured from when the pool starts
+                self._started = self._changed = time.perf_counter()
+                self._busy_seconds = 0.0
+        return self._executor
+
+    def _running(self) -> int:
+        return min(self._in_flight, self.max_workers)
+
+    def _change_in_flight(self, change: int) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            self._busy_seconds += self._running() * (now - self._changed)
+            self._changed = now
+            self._in_flight += change
+            if change > 0:
+                self.submitted += change
+            else:
+                self.completed -= change
+
+    def submit(self, fn: Callable, /, *args, **kwargs) -> Future:
+        """Schedule `fn(*args, **kwargs)` on the pool, see `Executor.submit`."""
+        executor = self.executor
+        self._change_in_flight(1)
+        try:
+            future = executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._change_in_flight(-1)
+            raise
+        future.add_done_callback(lambda _: self._change_in_flight(-1))
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """The queue depth and utilization of the pool.
+
+        Returns:
+            Dict[str, Any]: the `executor`, `max_workers`, the work `queued` and
+                    `running` now, the work `submitted` and `completed` so far, and the
+                    `utilization`, the share of the workers' time spent running work
+                    since the pool was started, from 0 to 1
+        """
+        now = time.perf_counter()
+        with self._lock:
+            running = self._running()
+            busy_seconds = self._busy_seconds + running * (now - self._changed)
+            elapsed = now - self._started
+            return {
+                "executor": self.executor_name,
+                "max_workers": self.max_workers,
+                "queued": self._in_flight - running,
+                "running": running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "utilization": (
+                    round(busy_seconds / (self.max_workers * elapsed), 4)
+                    if elapsed > 0
+                    else 0.0
+                ),
+            }
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shut the pool down, it will be recreated if the pool is used again."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+            self._executor = None
+
+
+class ExecutorService:
+    """The named thread and process pools the universe shares between the processors
+    of every world, injected into each processor as its `executor_service` argument.
+
+    Pools are only created, and sized, see `pool_size`, when a processor first asks for
+    them, and only started once work is submitted to them, so pools no processor uses
+    cost nothing and are left out of the stats. Work submitted to a pool should not wait
+    on other work of the same pool, which would deadlock once every worker is waiting.
+
+    Configured with the optional `executor_service` config, by default a "thread" and a
+    "process" pool sized to the CPUs of the process:
+        e.g.
+            "executor_service": {
+                "pools": {
+                    "io": {"executor": "thread", "max_workers": 16},
+                    "cpu": {"executor": "process", "memory_per_worker_mb": 512}
+                }
+            }
+
+    Args:
+        pools (Dict[str, Dict[str, Any]], optional): {name: {"executor", "max_workers",
+                    "memory_per_worker_mb"}} the pools, defaults to `DEFAULT_POOLS`
+
+    Raises:
+        ValueError: a pool with an unknown `executor`
+    """
+
+    def __init__(self, pools: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.pool_configs: Dict[str, Dict[str, Any]] = dict(pools or DEFAULT_POOLS)
+        for name, pool_config in self.pool_configs.items():
+            executor = pool_config.get("executor", "thread")
+            if executor not in executor_types:
+                raise ValueError(
+                    f"Unknown executor of pool `{name}`: '{executor}', expected one of {list(executor_types)}"
+                )
+        self.pools: Dict[str, SharedPool] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict:
+        # Locks can not be pickled
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def pool(self, name: str) -> SharedPool:
+        """The pool named `name`, created on first use.
+
+        Raises:
+            KeyError: an unknown pool name
+        """
+        with self._lock:
+            if name not in self.pools:
+                try:
+                    pool_config = self.pool_configs[name]
+                except KeyError:
+                    raise KeyError(
+                        f"Unknown pool: `{name}`, expected one of {list(self.pool_configs)}"
+                    ) from None
+                executor = pool_config.get("executor", "thread")
+                self.pools[name] = SharedPool(
+                    name=name,
+                    executor=executor,
+                    max_workers=pool_size(
+                        executor,
+                        max_workers=pool_config.get("max_workers", None),
+                        memory_per_worker_mb=pool_config.get(
+                            "memory_per_worker_mb", None
+                        ),
+                    ),
+                )
+            return self.pools[name]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """{name: stats} the queue depth and utilization of each pool work was
+        submitted to, see `SharedPool.stats`."""
+        with self._lock:
+            pools = list(self.pools.items())
+        return {name: pool.stats() for name, pool in pools if pool.submitted}
+
+    def print_report(self) -> None:
+        """Print the queue depth and utilization of each pool work was submitted to."""
+        for name, stats in self.stats().items():
+            print(
+                f"{name} ({stats['executor']}, {stats['max_workers']} workers): "
+                f"{stats['queued']} queued, {stats['running']} running, "
+                f"{stats['completed']}/{stats['submitted']} completed, "
+                f"{stats['utilization']:.1%} utilization"
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut every pool down, they will be recreated if used again."""
+        with self._lock:
+            pools = list(self.pools.values())
+        for pool in pools:
+            pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "ExecutorService":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown(wait=exc_info[0] is None)
@@ -0,0 +1,249 @@
+"""Schedule the worlds of a galaxy concurrently, respecting declared dependencies."""
+
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from esper import World
+
+from bspec.universe.dependency_graph import (
+    arun_in_dependency_order,
+    check_for_cycles,
+    reachable,
+    run_in_dependency_order,
+)
+
+
+"""
+Dictionary of executor classes defined by the key 'executor' within the
+`scheduler` config as the value
+"""
+executor_types: Dict[str, Callable[..., Executor]] = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+def _process_world(world: World) -> World:
+    """Process a world once and return it.
+
+    The process pool works on a pickled copy of the world, so the processed
+    world has to be handed back to replace the one held in the `galaxy`.
+
+    Args:
+        world (World): the world to process
+
+    Returns:
+        World: the processed world
+    """
+    world.process()
+    return world
+
+
+class GalaxyScheduler:
+    """Run the worlds of a galaxy on a thread or process pool.
+
+    Worlds that do not depend on each other are submitted to the pool together,
+    a world that declares `depends_on` is only submitted once every world it
+    depends on has finished processing for the current tick.
+
+    Args:
+        galaxy (Dict[str, World]): the named worlds to schedule
+
+        dependencies (Dict[str, List[str]]): {world_name: [world_names it depends on]}
+
+        executor (str, default "thread"): the pool type, either "thread" or "process".
+                    A process pool requires the worlds to be picklable
+
+        max_workers (int, optional): the size of the pool, defaults to the
+                    `concurrent.futures` default which scales with the CPU count
+    """
+
+    def __init__(
+        self,
+        galaxy: Dict[str, World],
+        dependencies: Dict[str, List[str]],
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+    ):
+        if executor not in executor_types:
+            raise ValueError(
+                f"Unknown scheduler executor: '{executor}', expected one of {list(executor_types)}"
+            )
+
+        self.galaxy = galaxy
+        self.dependencies = dependencies
+        self.executor_name = executor
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+
+        self._validate_dependencies()
+
+    def _validate_dependencies(self) -> None:
+        """Raise a `ValueError` for unknown world names or circular dependencies."""
+        for world_name, depends_on in self.dependencies.items():
+            for dependency in depends_on:
+                if dependency not in self.galaxy:
+                    raise ValueError(
+                        f"World `{world_name}` depends on unknown world: `{dependency}`"
+                    )
+
+        check_for_cycles(self.dependencies)
+
+    def add_world(self, world_name: str, world: World, depends_on: List[str]) -> None:
+        """Schedule a world created after the scheduler, e.g. one deferred until
+        `load_world`, along with the worlds it depends on.
+
+        Args:
+            world_name (str): the name of the world
+
+            world (World): the world
+
+            depends_on (List[str]): the names of the worlds it depends on, which have to
+                        be scheduled already
+
+        Raises:
+            ValueError: an unknown world name or a circular dependency
+        """
+        for dependency in depends_on:
+            if dependency not in self.galaxy:
+                raise ValueError(
+                    f"World `{world_name}` depends on unknown world: `{dependency}`"
+                )
+        self.dependencies[world_name] = list(depends_on)
+        try:
+            check_for_cycles(self.dependencies)
+        except ValueError:
+            del self.dependencies[world_name]
+            raise
+        self.galaxy[world_name] = world
+
+    @property
+    def executor(self) -> Executor:
+        """The pool is created on first use and reused for every tick."""
+        if self._executor is None:
+            self._executor = executor_types[self.executor_name](
+                max_workers=self.max_workers
+            )
+        return self._executor
+
+    def reachable(self, entry_worlds: Union[str, Iterable[str]]) -> List[str]:
+        """Find the entry worlds and every world they transitively depend on.
+
+        Args:
+            entry_worlds (Union[str, Iterable[str]]): world name(s) to start from
+
+        Returns:
+            List[str]: reachable world names, in `galaxy` order
+        """
+        return reachable(
+            entry_worlds,
+            {
+                world_name: self.dependencies.get(world_name, [])
+                for world_name in self.galaxy
+            },
+        )
+
+    def run_tick(self, world_names: Iterable[str]) -> None:
+        """Process each named world once, running independent worlds concurrently.
+
+        Dependencies on worlds outside of `world_names` are ignored for this tick, and a
+        lone ready world is processed on the calling thread, which also keeps blocking
+        worlds (e.g. a web server) responsive to Ctrl+C.
+
+        Args:
+            world_names (Iterable[str]): the worlds to process
+        """
+
+        def on_done(world_name: str, future: Future) -> None:
+            world = future.result()
+            if self.executor_name == "process":
+                # The processed world is a copy, carry over what could not be pickled
+                world.timing_collector = self.galaxy[world_name].timing_collector
+                world.record_timings()
+                self.galaxy[world_name] = world
+
+        run_in_dependency_order(
+            nodes=list(world_names),
+            dependencies=self.dependencies,
+            run=lambda world_name: self.galaxy[world_name].process(),
+            submit=lambda world_name: self.executor.submit(
+                _process_world, self.galaxy[world_name]
+            ),
+            on_done=on_done,
+        )
+
+    async def arun_tick(self, world_names: Iterable[str]) -> None:
+        """Process each named world once on the running event loop, the asyncio
+        counterpart of `run_tick`.
+
+        Independent worlds are awaited concurrently, and synchronous processors are
+        offloaded to the scheduler's pool, which has to be a thread pool.
+
+        Args:
+            world_names (Iterable[str]): the worlds to process
+        """
+        if self.executor_name != "thread":
+            raise ValueError(
+                f"Worlds can only be processed on an event loop with the `thread` executor, not `{self.executor_name}`"
+            )
+
+        async def run(world_name: str) -> None:
+            await self.galaxy[world_name].aprocess(self.executor)
+
+        await arun_in_dependency_order(
+            nodes=list(world_names),
+            dependencies=self.dependencies,
+            run=run,
+        )
+
+    def pending(self, world_names: Iterable[str]) -> List[str]:
+        """The named worlds with work left over from the last tick, see `World.pending`."""
+        return [
+            world_name
+            for world_name in world_names
+            if self.galaxy[world_name].pending()
+        ]
+
+    def run_until_drained(self, world_names: Iterable[str]) -> int:
+        """Process the named worlds with `run_tick`, and keep processing them while any
+        of them is `pending`, e.g. until every chunk of a streamed CSV has been
+        processed.
+
+        Args:
+            world_names (Iterable[str]): the worlds to process
+
+        Returns:
+            int: the number of ticks processed
+        """
+        world_names = list(world_names)
+        ticks = 0
+        while ticks == 0 or self.pending(world_names):
+            self.run_tick(world_names)
+            ticks += 1
+        return ticks
+
+    async def arun_until_drained(self, world_names: Iterable[str]) -> int:
+        """The asyncio counterpart of `run_until_drained`."""
+        world_names = list(world_names)
+        ticks = 0
+        while ticks == 0 or self.pending(world_names):
+            await self.arun_tick(world_names)
+            ticks += 1
+        return ticks
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut the pool down, it will be recreated if the scheduler is used again."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+
+    def __enter__(self) -> "GalaxyScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown(wait=exc_info[0] is None)
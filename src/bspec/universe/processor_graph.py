@@ -0,0 +1,66 @@
+"""Build a dependency graph of a world's processors from their component read/write sets."""
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from esper import Processor
+
+
+def processor_access(processor: Processor) -> Optional[Tuple[Set[type], Set[type]]]:
+    """Get the component types a processor reads and writes.
+
+    Processors declare these with the `reads` and `writes` sequences, alongside
+    their `components`. A processor that declares neither could touch anything, so
+    `None` is returned and it is treated as conflicting with every other processor.
+
+    Args:
+        processor (Processor): the processor to inspect
+
+    Returns:
+        Optional[Tuple[Set[type], Set[type]]]: (reads, writes), or `None` if undeclared
+    """
+    reads = getattr(processor, "reads", None)
+    writes = getattr(processor, "writes", None)
+    if reads is None and writes is None:
+        return None
+    return set(reads or []), set(writes or [])
+
+
+def processors_conflict(
+    first: Optional[Tuple[Set[type], Set[type]]],
+    second: Optional[Tuple[Set[type], Set[type]]],
+) -> bool:
+    """Two processors conflict if either is undeclared, or one of them writes a
+    component that the other reads or writes."""
+    if first is None or second is None:
+        return True
+    first_reads, first_writes = first
+    second_reads, second_writes = second
+    return bool(
+        first_writes & (second_reads | second_writes) or second_writes & first_reads
+    )
+
+
+def build_processor_dependencies(
+    processors: Sequence[Processor],
+) -> Dict[int, List[int]]:
+    """Build the dependencies between processors, by their index in `processors`.
+
+    `processors` is in priority order, a processor depends on every higher priority
+    processor it conflicts with, so conflicting processors keep esper's priority
+    order while non conflicting processors can run in parallel.
+
+    Args:
+        processors (Sequence[Processor]): processors, sorted by priority
+
+    Returns:
+        Dict[int, List[int]]: {processor index: [indexes of processors it depends on]}
+    """
+    access = [processor_access(processor) for processor in processors]
+    return {
+        index: [
+            earlier
+            for earlier in range(index)
+            if processors_conflict(access[earlier], access[index])
+        ]
+        for index in range(len(processors))
+    }
@@ -0,0 +1,185 @@
+"""Fixed rate tick loop, processing the scheduled worlds of a galaxy every tick."""
+
+import asyncio
+from dataclasses import dataclass
+import time
+from typing import Callable, List, Optional
+
+from bspec.universe.galaxy_scheduler import GalaxyScheduler
+
+
+@dataclass
+class TickStats:
+    """Counters collected by the `TickLoop`
+
+    Params:
+        ticks (int): the number of ticks processed
+
+        missed_deadlines (int): ticks that took longer than the latency budget
+
+        skipped_ticks (int): tick slots dropped because a tick overran the whole period
+
+        deferred_processors (int): processors deferred because their world overran the budget
+
+        last_tick_ms (float): the duration of the last tick
+
+        max_tick_ms (float): the duration of the slowest tick
+
+        total_jitter_ms (float): the summed delay between when ticks were due and started
+
+        max_jitter_ms (float): the largest delay between when a tick was due and started
+    """
+
+    ticks: int = 0
+    missed_deadlines: int = 0
+    skipped_ticks: int = 0
+    deferred_processors: int = 0
+    last_tick_ms: float = 0.0
+    max_tick_ms: float = 0.0
+    total_jitter_ms: float = 0.0
+    max_jitter_ms: float = 0.0
+
+    @property
+    def mean_jitter_ms(self) -> float:
+        return self.total_jitter_ms / self.ticks if self.ticks else 0.0
+
+
+class TickLoop:
+    """Process the scheduled worlds at a fixed `rate`, with a per tick latency budget.
+
+    Each world is given the tick deadline, so low priority processors are deferred
+    once the budget is spent. Ticks are scheduled against a fixed timeline, so a slow
+    tick does not shift the ticks that follow it, and slots that were overrun
+    completely are skipped instead of run back to back.
+
+    Args:
+        scheduler (GalaxyScheduler): the scheduler used to process a tick
+
+        world_names (List[str]): the worlds to process every tick
+
+        rate (float): the target number of ticks per second
+
+        budget_ms (float, optional): the latency budget of a tick, defaults to the
+                    tick period (1000 / rate)
+
+        max_ticks (int, optional): stop after this many ticks, `None` runs until
+                    interrupted
+
+        on_tick (Callable[[int], None], optional): called after every tick with the
+                    number of ticks processed so far
+    """
+
+    def __init__(
+        self,
+        scheduler: GalaxyScheduler,
+        world_names: List[str],
+        rate: float,
+        budget_ms: Optional[float] = None,
+        max_ticks: Optional[int] = None,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+        on_tick: Optional[Callable[[int], None]] = None,
+    ):
+        if rate <= 0:
+            raise ValueError(f"The tick `rate` must be greater than 0, got: {rate}")
+
+        self.scheduler = scheduler
+        self.world_names = world_names
+        self.period = 1 / rate
+        self.budget = self.period if budget_ms is None else budget_ms / 1000
+        self.max_ticks = max_ticks
+        self.clock = clock
+        self.sleep = sleep
+        self.on_tick = on_tick
+        self.stats = TickStats()
+
+    def _start_tick(self, started: float) -> float:
+        """Hand the tick deadline to every scheduled world, and return it."""
+        deadline = started + self.budget
+        for world_name in self.world_names:
+            self.scheduler.galaxy[world_name].deadline = deadline
+        return deadline
+
+    def _finish_tick(self, started: float, deadline: float) -> None:
+        """Record the counters for a tick that started at `started`."""
+        finished = self.clock()
+        tick_ms = (finished - started) * 1000
+        self.stats.ticks += 1
+        self.stats.last_tick_ms = tick_ms
+        self.stats.max_tick_ms = max(self.stats.max_tick_ms, tick_ms)
+        if finished > deadline:
+            self.stats.missed_deadlines += 1
+        for world_name in self.world_names:
+            self.stats.deferred_processors += len(
+                getattr(self.scheduler.galaxy[world_name], "deferred", [])
+            )
+        if self.on_tick is not None:
+            self.on_tick(self.stats.ticks)
+
+    def _wait_time(self, next_tick: float) -> float:
+        """How long to sleep until `next_tick` is due."""
+        return max(next_tick - self.clock(), 0.0)
+
+    def _start_time(self, next_tick: float) -> float:
+        """Record the jitter of a tick that was due at `next_tick`, and return its start."""
+        now = self.clock()
+        jitter_ms = max(now - next_tick, 0.0) * 1000
+        self.stats.total_jitter_ms += jitter_ms
+        self.stats.max_jitter_ms = max(self.stats.max_jitter_ms, jitter_ms)
+        return now
+
+    def _next_tick(self, next_tick: float) -> float:
+        """Schedule the next tick one period on, skipping slots that were overrun."""
+        next_tick += self.period
+        overrun = self.clock() - next_tick
+        if overrun > 0:
+            skipped = int(overrun // self.period) + 1
+            self.stats.skipped_ticks += skipped
+            next_tick += skipped * self.period
+        return next_tick
+
+    def _running(self) -> bool:
+        return self.max_ticks is None or self.stats.ticks < self.max_ticks
+
+    def tick(self, started: float) -> None:
+        """Process a single tick that started at `started`."""
+        deadline = self._start_tick(started)
+        self.scheduler.run_tick(self.world_names)
+        self._finish_tick(started, deadline)
+
+    async def atick(self, started: float) -> None:
+        """Process a single tick on the running event loop."""
+        deadline = self._start_tick(started)
+        await self.scheduler.arun_tick(self.world_names)
+        self._finish_tick(started, deadline)
+
+    def run(self) -> TickStats:
+        """Run ticks until `max_ticks` is reached.
+
+        Returns:
+            TickStats: the counters collected while running
+        """
+        next_tick = self.clock()
+        while self._running():
+            wait_time = self._wait_time(next_tick)
+            if wait_time:
+                self.sleep(wait_time)
+            self.tick(started=self._start_time(next_tick))
+            next_tick = self._next_tick(next_tick)
+
+        return self.stats
+
+    async def arun(self) -> TickStats:
+        """Run ticks on the running event loop until `max_ticks` is reached, waiting
+        between ticks with `asyncio.sleep` so other tasks keep running.
+
+        Returns:
+            TickStats: the counters collected while running
+        """
+        next_tick = self.clock()
+        while self._running():
+            await asyncio.sleep(self._wait_time(next_tick))
+            await self.atick(started=self._start_time(next_tick))
+            next_tick = self._next_tick(next_tick)
+
+        return self.stats
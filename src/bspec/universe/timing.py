@@ -0,0 +1,254 @@
+"""Collect per world and per processor timings across ticks, and export them as JSON
+lines or in the Prometheus text format."""
+
+from collections import deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import math
+import os
+import threading
+import time
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+QUANTILES: Tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+def _nearest_rank(ordered: List[float], q: float) -> float:
+    """The nearest rank quantile `q` (0 to 1) of the sorted `ordered` timings."""
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+@dataclass
+class TimingHistogram:
+    """Timings of a single world or processor.
+
+    The count, sum, min and max cover every recorded timing, quantiles are computed
+    from a sliding `window` of the most recent timings so memory stays bounded on
+    long running tick loops.
+
+    Params:
+        window (int, default 10000): the number of recent timings kept for quantiles
+    """
+
+    window: int = 10000
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = 0.0
+    samples: Deque[float] = field(default_factory=deque)
+
+    def __post_init__(self):
+        self.samples = deque(self.samples, maxlen=self.window)
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+        self.samples.append(seconds)
+
+    def quantile(self, q: float) -> float:
+        """The nearest rank quantile `q` (0 to 1) of the recent timings."""
+        return _nearest_rank(sorted(self.samples), q)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        summary = {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum,
+        }
+        for q in QUANTILES:
+            summary[f"p{int(q * 100)}"] = _nearest_rank(ordered, q)
+        return summary
+
+
+def _prometheus_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class TimingCollector:
+    """Thread safe collector of world and processor timings, in seconds.
+
+    Args:
+        window (int, default 10000): the number of recent timings kept per histogram
+                    to compute the p50/p95/p99 quantiles
+    """
+
+    def __init__(self, window: int = 10000):
+        self.window = window
+        self.worlds: Dict[str, TimingHistogram] = {}
+        self.processors: Dict[Tuple[str, str], TimingHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record_world(self, world_name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.worlds.get(world_name)
+            if histogram is None:
+                histogram = self.worlds[world_name] = TimingHistogram(self.window)
+            histogram.record(seconds)
+
+    def record_processor(
+        self, world_name: str, processor_name: str, seconds: float
+    ) -> None:
+        with self._lock:
+            key = (world_name, processor_name)
+            histogram = self.processors.get(key)
+            if histogram is None:
+                histogram = self.processors[key] = TimingHistogram(self.window)
+            histogram.record(seconds)
+
+    def summaries(self) -> List[Dict]:
+        """A summary per world and per processor, the rows of the JSON lines export."""
+        with self._lock:
+            rows: List[Dict] = [
+                {"kind": "world", "world": world_name, **histogram.summary()}
+                for world_name, histogram in self.worlds.items()
+            ]
+            rows.extend(
+                {
+                    "kind": "processor",
+                    "world": world_name,
+                    "processor": processor_name,
+                    **histogram.summary(),
+                }
+                for (world_name, processor_name), histogram in self.processors.items()
+            )
+        return rows
+
+    def to_json_lines(self) -> str:
+        timestamp = time.time()
+        return "".join(
+            json.dumps({"timestamp": timestamp, **row}) + "\n"
+            for row in self.summaries()
+        )
+
+    def to_prometheus(self) -> str:
+        """Render the timings as Prometheus summaries, in the text exposition format."""
+        lines: List[str] = []
+        rows = self.summaries()
+        for kind, help_text in (
+            ("world", "Wall time of a world tick in seconds"),
+            ("processor", "Wall time of a processor `process` call in seconds"),
+        ):
+            metric = f"bspec_{kind}_seconds"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} summary")
+            for row in rows:
+                if row["kind"] != kind:
+                    continue
+                labels = f'world="{_prometheus_label_value(row["world"])}"'
+                if kind == "processor":
+                    labels += (
+                        f',processor="{_prometheus_label_value(row["processor"])}"'
+                    )
+                for q in QUANTILES:
+                    lines.append(
+                        f'{metric}{{{labels},quantile="{q}"}} {row[f"p{int(q * 100)}"]!r}'
+                    )
+                lines.append(f"{metric}_sum{{{labels}}} {row['sum']!r}")
+                lines.append(f"{metric}_count{{{labels}}} {row['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write_json_lines(self, path: str) -> None:
+        """Append the current summaries to the JSON lines file at `path`."""
+        with open(path, "a") as file:
+            file.write(self.to_json_lines())
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically replace `path` with the Prometheus text export, for use with a
+        textfile collector."""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w") as file:
+            file.write(self.to_prometheus())
+        os.replace(temporary_path, path)
+
+    def serve_prometheus(
+        self, port: int, host: str = "127.0.0.1"
+    ) -> ThreadingHTTPServer:
+        """Serve the Prometheus text export on `http://{host}:{port}/metrics` from a
+        daemon thread.
+
+        Returns:
+            ThreadingHTTPServer: the running server, call `shutdown` to stop it
+        """
+        collector = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = collector.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+class TimingExporter:
+    """Export a `TimingCollector` as configured by the `timing` config.
+
+    Args:
+        collector (TimingCollector): the timings to export
+
+        jsonl_path (str, optional): append JSON lines summaries to this file
+
+        prometheus_path (str, optional): write the Prometheus text export to this file
+
+        prometheus_port (int, optional): serve the Prometheus text export on this port
+
+        prometheus_host (str, default "127.0.0.1"): the interface to serve on
+
+        export_every_ticks (int, default 100): how often a tick loop exports
+    """
+
+    def __init__(
+        self,
+        collector: TimingCollector,
+        jsonl_path: Optional[str] = None,
+        prometheus_path: Optional[str] = None,
+        prometheus_port: Optional[int] = None,
+        prometheus_host: str = "127.0.0.1",
+        export_every_ticks: int = 100,
+    ):
+        self.collector = collector
+        self.jsonl_path = jsonl_path
+        self.prometheus_path = prometheus_path
+        self.export_every_ticks = export_every_ticks
+        self.server: Optional[ThreadingHTTPServer] = None
+        if prometheus_port is not None:
+            self.server = collector.serve_prometheus(
+                prometheus_port, host=prometheus_host
+            )
+
+    def export(self) -> None:
+        if self.jsonl_path is not None:
+            self.collector.write_json_lines(self.jsonl_path)
+        if self.prometheus_path is not None:
+            self.collector.write_prometheus(self.prometheus_path)
+
+    def on_tick(self, ticks: int) -> None:
+        """Export every `export_every_ticks` ticks."""
+        if ticks % self.export_every_ticks == 0:
+            self.export()
+
+    def close(self) -> None:
+        """Write a final export and stop serving."""
+        self.export()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server = None
@@ -1,12 +1,20 @@
+import functools
 import platform
-from typing import Callable, Dict, List, Union, Set
-
-from esper import World
+from typing import Callable, Dict, List, Optional, Union, Set
 
+from bspec.common_core.requirements_registry import requirements_registry
 from bspec.plugin_core import loader as plugins_loader
+from bspec.plugin_core.import_profiler import ImportProfiler
 from bspec.processors import processor_factory
 from bspec.components import component_factory
 from bspec.pipelines.recursive_pipeline_read import recursive_pipeline_read
+from bspec.pipelines.galaxy_cache import MAX_ENTRIES, cached_pipeline_read
+from bspec.universe.dependency_graph import check_for_cycles, reachable
+from bspec.universe.executor_service import ExecutorService
+from bspec.universe.galaxy_scheduler import GalaxyScheduler
+from bspec.universe.tick_loop import TickLoop, TickStats
+from bspec.universe.timing import TimingCollector, TimingExporter
+from bspec.universe.world import World
 
 
 print("Python Version: ", platform.python_version())
@@ -16,16 +24,221 @@ print("Python Version: ", platform.python_version())
 ######################################
 galaxy: Dict[str, World] = {}
 
-############################################################
-# Instantiate everything, and create your main logic loop: #
-############################################################
-def universe(
+"""
+Dictionary of functions that create a world, defined by the key 'world_name', for worlds
+that are not reachable from the starting world(s) and are created on first use
+"""
+deferred_worlds: Dict[str, Callable[[], World]] = {}
+
+"""
+Dictionary of the `depends_on` of each deferred world, defined by the key 'world_name',
+registered with the scheduler once `load_world` creates the world
+"""
+deferred_dependencies: Dict[str, List[str]] = {}
+
+"""
+The scheduler of the `galaxy`, from the last `create_galaxy`
+"""
+galaxy_scheduler: Optional[GalaxyScheduler] = None
+
+
+def world_processor_plugins(world: Dict, processor_plugins: Set[str]) -> Set[str]:
+    """Find the processor plugins a world needs.
+
+    Worlds created from pipelines list the `processor_plugins` of their pipeline.
+    Otherwise plugins are matched to the world's processors by the plugin naming
+    convention `{package}.{processor_name}.{module}`, falling back to every plugin of
+    the config if a processor does not match a plugin by name.
+
+    Args:
+        world (Dict): the world config
+
+        processor_plugins (Set[str]): every processor plugin of the config
+
+    Returns:
+        Set[str]: the processor plugins to load for the world
+    """
+    if world.get("processor_plugins") is not None:
+        return set(world["processor_plugins"])
+
+    world_plugins: Set[str] = set()
+    for processor in world["processors"]:
+        matches = {
+            plugin
+            for plugin in processor_plugins
+            if processor["processor_name"] in plugin.split(".")
+        }
+        if not matches:
+            return set(processor_plugins)
+        world_plugins.update(matches)
+    return world_plugins
+
+
+def create_world(
+    world: Dict,
+    processor_plugins: Set[str],
+    timed: bool = False,
+    deferrable_priority: int = 0,
+    timing_collector: Optional[TimingCollector] = None,
+    import_profiler: Optional[ImportProfiler] = None,
+    executor_service: Optional[ExecutorService] = None,
+    copy_on_write: bool = False,
+) -> World:
+    """Load the plugins of a world config, and create the world with its processors,
+    entities and components.
+
+    Args:
+        world (Dict): the world config
+
+        processor_plugins (Set[str]): the processor plugins the world needs
+
+        timed (bool): create the World with `timed`, see `universe`
+
+        deferrable_priority (int): see `World`
+
+        timing_collector (TimingCollector, optional): see `create_galaxy`
+
+        import_profiler (ImportProfiler, optional): profile the processor and component
+                    plugin imports of the world, see `create_galaxy`
+
+        executor_service (ExecutorService, optional): the shared pools, injected into
+                    every processor as its `executor_service` argument
+
+        copy_on_write (bool): pass `copy_on_write` to every processor, see
+                    `create_galaxy`
+
+    Returns:
+        World: the created world
+    """
+    world_name: str = world["world_name"]
+
+    # install any missing requirements of the processor plugins in one batch, the
+    # processor requirements also cover the components a processor imports
+    requirements_registry.preflight(processor_plugins)
+
+    # load the processor plugins
+    # currently using plugin_core loader which may need to change in the future
+    plugins_loader.load_plugins(processor_plugins, profiler=import_profiler)
+
+    new_world = World(
+        timed=timed,
+        deferrable_priority=deferrable_priority,
+        parallel_processors=world.get("parallel_processors", False),
+        max_workers=world.get("max_workers", None),
+        world_name=world_name,
+    )
+    new_world.timing_collector = timing_collector
+
+    # set up ECS requirements for global registration
+    entities: Dict = {}
+    processors: Dict[str, Dict[str, Union[Callable, int]]] = {}
+    components: Set[str] = set()
+
+    # create the processors, sharing the pools of the universe if it has any
+    injected: Dict = {}
+    if executor_service is not None:
+        injected["executor_service"] = executor_service
+    if copy_on_write:
+        injected["copy_on_write"] = True
+    for processor in world["processors"]:
+        processors[processor["processor_name"]] = {
+            "processor": processor_factory.create(world_name, processor, **injected),
+            "priority": processor["priority"],
+        }
+
+    # [new_world.add_processor(processor,priority = processor.priority['priority']) for processor in processors]
+    for processor_name in processors:
+        new_world.add_processor(
+            processors[processor_name]["processor"],
+            priority=processors[processor_name]["priority"],
+        )
+        processor_components = processors[processor_name]["processor"].__dict__[
+            "components"
+        ]
+
+        for component in processor_components:
+            components.add(component.__dict__["__module__"])
+
+    # load the component plugins
+    # currently using plugin_core loader which may need to change in the future
+    plugins_loader.load_plugins(components, profiler=import_profiler)
+
+    for entity in world["entities"]:
+        entity_id = entity["id"]
+        entities[entity_id] = new_world.create_entity()
+        for component in entity["components"]:
+            new_world.add_component(
+                entities[entity_id], component_factory.create(component)
+            )
+
+    return new_world
+
+
+def load_world(world_name: str, scheduler: Optional[GalaxyScheduler] = None) -> World:
+    """Get a world from the `galaxy`, creating it first if it was deferred because it
+    was not reachable from the starting world(s).
+
+    The worlds a deferred world depends on are loaded first, and the world is added to
+    the scheduler with its `depends_on`, so it runs after them like the starting worlds.
+
+    Args:
+        world_name (str): the name of the world
+
+        scheduler (GalaxyScheduler, optional): the scheduler to add the world to,
+                    defaults to the `galaxy_scheduler` of the last `create_galaxy`
+
+    Returns:
+        World: the world
+    """
+    if world_name in galaxy:
+        return galaxy[world_name]
+
+    scheduler = scheduler or galaxy_scheduler
+    depends_on = deferred_dependencies.pop(world_name, [])
+    for dependency in depends_on:
+        if dependency in deferred_worlds:
+            load_world(dependency, scheduler)
+
+    world = deferred_worlds.pop(world_name)()
+    if scheduler is None:
+        galaxy[world_name] = world
+    else:
+        scheduler.add_world(world_name, world, depends_on)
+    return world
+
+
+########################################################
+# Instantiate everything, and register it to a galaxy: #
+########################################################
+def create_galaxy(
     data: Dict[str, Union[str, list, int, float, dict]],
     exception_at_duplicate_world_names: bool = True,
     timed: bool = False,
-):
-    """The main `universe` function that will load the plugins, register worlds to the
-    galaxy and processing the starting world.
+    timing_collector: Optional[TimingCollector] = None,
+    executor_service: Optional[ExecutorService] = None,
+) -> GalaxyScheduler:
+    """Load the plugins and register the worlds of the config to the `galaxy`.
+
+    With the optional `galaxy_cache` config, the galaxy config resolved from the
+    pipelines is compiled to disk and reused on later starts, until the root config or
+    any pipeline JSON changes, keeping the latest compiled galaxy of each root config
+    and at most `max_entries` (default 8) compiled galaxies:
+        e.g.
+            "galaxy_cache": {"path": "./.bspec_cache", "max_entries": 8}
+
+    With the optional `startup_profile` config, the wall time, memory and transitive
+    imports of every plugin import and `register()` call made while creating the
+    starting worlds are reported, most expensive first, to the console or as JSON
+    (printed, or written to `path`):
+        e.g.
+            "startup_profile": {"format": "console", "sort_by": "wall_seconds", "trace_memory": true}
+            "startup_profile": {"format": "json", "path": "./startup_profile.json"}
+
+    With the optional `copy_on_write` config, every processor is created with the
+    `copy_on_write` argument, so the `pd_*` processors hand dataframes between slots
+    under pandas copy-on-write, scoped to their own steps, instead of copying them:
+        e.g.
+            "copy_on_write": true
 
     Args:
         data (Dict[str, Union[str, list, int, float, dict]]): Config data dictionary
@@ -34,39 +247,54 @@ def universe(
                                                 more than 1 world has the same name, to
                                                 prevent unexpected application behavior
 
-        timed (bool): using the package `esper` how will World be registered?
-                     it will replace `_process` with `_timed_process` allowing you to benchmark
-                     the runtime and understand how long each `Processor` will take to run the
-                     `process` function, which is saved to the property `process_times`
-    """
+        timed (bool): register each World with `timed`, see `universe`
+
+        timing_collector (TimingCollector, optional): record the timings of every
+                                                timed World to this collector
 
-    # Set the starting world
-    starting_world = data["starting_world"]
+        executor_service (ExecutorService, optional): the pools shared by the
+                                                processors of every world, see
+                                                `create_executor_service`
+
+    Returns:
+        GalaxyScheduler: the scheduler for the worlds in the `galaxy`
+    """
 
     processor_plugins: Set[str] = set(data["processor_plugins"])
 
     galaxy_config: List = data["galaxy"]
 
-    # Load pipelines:
-    returned_val = recursive_pipeline_read(
-        data=data,
-        processor_plugins=processor_plugins,
-        galaxy_config=galaxy_config,
-    )
+    deferrable_priority: int = data.get("tick_loop", {}).get("deferrable_priority", 0)
+
+    startup_profile_config: Optional[Dict] = data.get("startup_profile", None)
+    import_profiler: Optional[ImportProfiler] = None
+    if startup_profile_config is not None:
+        import_profiler = ImportProfiler(
+            trace_memory=startup_profile_config.get("trace_memory", True)
+        )
+
+    # Load pipelines, reusing the compiled galaxy if `galaxy_cache` is configured:
+    galaxy_cache_config: Optional[Dict] = data.get("galaxy_cache", None)
+    if galaxy_cache_config is None:
+        returned_val = recursive_pipeline_read(
+            data=data,
+            processor_plugins=processor_plugins,
+            galaxy_config=galaxy_config,
+        )
+    else:
+        returned_val = cached_pipeline_read(
+            data=data,
+            processor_plugins=processor_plugins,
+            galaxy_config=galaxy_config,
+            cache_dir=galaxy_cache_config.get("path", "./.bspec_cache"),
+            max_entries=galaxy_cache_config.get("max_entries", MAX_ENTRIES),
+        )
     processor_plugins.update(returned_val["all_processor_plugins"])
     galaxy_config = returned_val["galaxy_config"]
 
-    # load the processor plugins
-    # currently using plugin_core loader which may need to change in the future
-    plugins_loader.load_plugins(processor_plugins)
-
     # Highlight Duplicate World Names
     unique_world_names: List[str] = []
-
-    # set up ECS requirements for global registration
-    entities: Dict = {}
-    processors: Dict[str, Dict[str, Dict[str, Union[Callable, int]]]] = {}
-    components: Set[str] = set()
+    world_configs: Dict[str, Dict] = {}
 
     for world in galaxy_config:
         # Create a World instance to hold Entities, Components and Processors:
@@ -96,53 +324,314 @@ def universe(
             if exception_at_duplicate_world_names:
                 raise Exception(warning_msg)
 
-        galaxy[world_name] = World(timed=timed)
+        world_configs[world_name] = world
 
-        # create the processors
-        for processor in world["processors"]:
-            world_processors = processors.get(world_name, None)
-            if world_processors is None:
-                processors[world_name] = {}
+    # Only the worlds reachable from the starting world(s) are created, and only their
+    # plugins imported, the rest are deferred until `load_world` is called for them
+    world_dependencies: Dict[str, List[str]] = {
+        world_name: world.get("depends_on", [])
+        for world_name, world in world_configs.items()
+    }
+    # Deferred worlds are loaded after their dependencies, which can not be circular
+    check_for_cycles(world_dependencies)
+    reachable_worlds = reachable(data["starting_world"], world_dependencies)
 
-            processors[world_name][processor["processor_name"]] = {
-                "processor": processor_factory.create(world_name, processor),
-                "priority": processor["priority"],
-            }
+    world_plugins: Dict[str, Set[str]] = {
+        world_name: world_processor_plugins(world, processor_plugins)
+        for world_name, world in world_configs.items()
+    }
 
-        # [galaxy[world_name].add_processor(processor,priority = processor.priority['priority']) for processor in processors]
-        for processor_name in processors[world_name]:
-            galaxy[world_name].add_processor(
-                processors[world_name][processor_name]["processor"],
-                priority=processors[world_name][processor_name]["priority"],
+    # Resolve the requirements of every starting world up front, so whatever is missing
+    # is installed with a single pip call instead of one per module during import
+    requirements_registry.preflight(
+        set().union(*(world_plugins[world_name] for world_name in reachable_worlds))
+    )
+
+    try:
+        for world_name, world in world_configs.items():
+            create = functools.partial(
+                create_world,
+                world=world,
+                processor_plugins=world_plugins[world_name],
+                timed=timed,
+                deferrable_priority=deferrable_priority,
+                timing_collector=timing_collector,
+                executor_service=executor_service,
+                copy_on_write=bool(data.get("copy_on_write", False)),
             )
-            processor_components = processors[world_name][processor_name][
-                "processor"
-            ].__dict__["components"]
+            if world_name in reachable_worlds:
+                galaxy[world_name] = create(import_profiler=import_profiler)
+            else:
+                deferred_worlds[world_name] = create
+                deferred_dependencies[world_name] = world_dependencies[world_name]
+    finally:
+        if import_profiler is not None:
+            import_profiler.stop()
+            report_startup_profile(import_profiler, startup_profile_config)
+
+    scheduler_config: Dict = data.get("scheduler", {})
+    global galaxy_scheduler
+    galaxy_scheduler = GalaxyScheduler(
+        galaxy=galaxy,
+        dependencies={
+            world_name: world_dependencies[world_name] for world_name in galaxy
+        },
+        executor=scheduler_config.get("executor", "thread"),
+        max_workers=scheduler_config.get("max_workers", None),
+    )
+    return galaxy_scheduler
+
+
+def report_startup_profile(
+    import_profiler: ImportProfiler, startup_profile_config: Dict
+) -> None:
+    """Report the plugin imports as configured by the `startup_profile` config."""
+    sort_by: str = startup_profile_config.get("sort_by", "wall_seconds")
+    if startup_profile_config.get("format", "console") != "json":
+        import_profiler.print_report(sort_by=sort_by)
+        return
+
+    report = import_profiler.to_json(sort_by=sort_by)
+    path: Optional[str] = startup_profile_config.get("path", None)
+    if path is None:
+        print(report)
+    else:
+        with open(path, "w") as file:
+            file.write(report)
+
+
+def create_tick_loop(
+    scheduler: GalaxyScheduler,
+    world_names: List[str],
+    tick_loop_config: Dict,
+    timing_exporter: Optional[TimingExporter] = None,
+) -> TickLoop:
+    """Create the `TickLoop` defined by the `tick_loop` config."""
+    return TickLoop(
+        scheduler=scheduler,
+        world_names=world_names,
+        rate=tick_loop_config["rate"],
+        budget_ms=tick_loop_config.get("budget_ms", None),
+        max_ticks=tick_loop_config.get("max_ticks", None),
+        on_tick=None if timing_exporter is None else timing_exporter.on_tick,
+    )
+
+
+def create_executor_service(executor_service_config: Dict) -> ExecutorService:
+    """Create the `ExecutorService` defined by the `executor_service` config."""
+    return ExecutorService(pools=executor_service_config.get("pools", None))
+
+
+def print_executor_stats(executor_service: ExecutorService) -> None:
+    """Print the queue depth and utilization of the shared pools that were used."""
+    if not executor_service.stats():
+        return
+    print()
+    print("Executor Stats:")
+    executor_service.print_report()
+
+
+def create_timing_exporter(timing_config: Dict) -> TimingExporter:
+    """Create the `TimingExporter` defined by the `timing` config."""
+    return TimingExporter(
+        collector=TimingCollector(window=timing_config.get("window", 10000)),
+        jsonl_path=timing_config.get("jsonl_path", None),
+        prometheus_path=timing_config.get("prometheus_path", None),
+        prometheus_port=timing_config.get("prometheus_port", None),
+        prometheus_host=timing_config.get("prometheus_host", "127.0.0.1"),
+        export_every_ticks=timing_config.get("export_every_ticks", 100),
+    )
+
+
+def print_galaxy(starting_world: Union[str, List[str]], scheduled_worlds: List[str]):
+    """Print the `galaxy` and the worlds that are about to be processed."""
+    print()
+    print("----------------------")
+    print("galaxy: ", galaxy)
+    print("----------------------")
+    print()
+    print(f"Entry World: {starting_world}")
+    print(f"Scheduled Worlds: {scheduled_worlds}")
+    print()
+    print()
+
+
+############################################################
+# Instantiate everything, and create your main logic loop: #
+############################################################
+def universe(
+    data: Dict[str, Union[str, list, int, float, dict]],
+    exception_at_duplicate_world_names: bool = True,
+    timed: bool = False,
+) -> Optional[TickStats]:
+    """The main `universe` function that will load the plugins, register worlds to the
+    galaxy and processing the starting world, along with every world it depends on.
+
+    Only the worlds that are reachable from the starting world(s) are created, and only
+    the processor and component plugins they use are imported. Other worlds are created,
+    and their plugins imported, on first use with `load_world`.
+
+    Worlds declare their dependencies with a `depends_on` list of world names, and
+    independent worlds are processed concurrently by a `GalaxyScheduler` configured
+    with the optional `scheduler` config:
+        e.g.
+            "scheduler": {"executor": "thread", "max_workers": 4}
+
+    A world with `parallel_processors` set runs processors that do not conflict, based
+    on the components each processor `reads` and `writes`, concurrently on a thread pool
+    of `max_workers`:
+        e.g.
+            {"world_name": "...", "parallel_processors": true, "max_workers": 8, ...}
+
+    The universe owns the thread and process pools of the optional `executor_service`
+    config, sized to the CPUs of the process and the memory available, and injects them
+    into every processor as its `executor_service` argument, so processors submit their
+    work to pools shared by every world. The queue depth and utilization of each pool
+    is printed once the universe stops:
+        e.g.
+            "executor_service": {"pools": {"io": {"executor": "thread", "max_workers": 16}}}
+
+    The scheduled worlds are processed once, or again until no processor is `pending`
+    (e.g. a CSV read with a `chunksize` streams one chunk per tick), unless the optional
+    `tick_loop` config is set, which processes them continuously at a fixed `rate`
+    (ticks per second) with a per tick `budget_ms`. Processors with a priority at or below `deferrable_priority`
+    are deferred to the next tick when their world overruns the budget:
+        e.g.
+            "tick_loop": {"rate": 30, "budget_ms": 20, "deferrable_priority": 0, "max_ticks": null}
+
+    Args:
+        data (Dict[str, Union[str, list, int, float, dict]]): Config data dictionary
+
+        exception_at_duplicate_world_names (bool): this is used to raise an exception if
+                                                more than 1 world has the same name, to
+                                                prevent unexpected application behavior
 
-            for component in processor_components:
-                components.add(component.__dict__["__module__"])
+        timed (bool): using the package `esper` how will World be registered?
+                     it will replace `_process` with `_timed_process` allowing you to benchmark
+                     the runtime and understand how long each `Processor` will take to run the
+                     `process` function, which is saved to the property `process_times`.
+                     The wall time of every world tick and processor is also collected into
+                     p50/p95/p99 summaries, exported as configured by the optional `timing`
+                     config as JSON lines, a Prometheus text file and/ or a Prometheus
+                     `/metrics` endpoint:
+                        e.g.
+                            "timing": {
+                                "jsonl_path": "./timings.jsonl",
+                                "prometheus_path": "./bspec.prom",
+                                "prometheus_port": 9464,
+                                "export_every_ticks": 100
+                            }
 
-        # load the component plugins
-        # currently using plugin_core loader which may need to change in the future
-        plugins_loader.load_plugins(components)
+    Returns:
+        Optional[TickStats]: the tick loop counters, when running with `tick_loop`
+    """
+
+    # Set the starting world, or a list of starting worlds
+    starting_world: Union[str, List[str]] = data["starting_world"]
+    tick_loop_config: Optional[Dict] = data.get("tick_loop", None)
+
+    timing_exporter: Optional[TimingExporter] = None
+    if timed:
+        timing_exporter = create_timing_exporter(data.get("timing", {}))
 
-        for entity in world["entities"]:
-            entity_id = entity["id"]
-            entities[entity_id] = galaxy[world_name].create_entity()
-            for component in entity["components"]:
-                galaxy[world_name].add_component(
-                    entities[entity_id], component_factory.create(component)
-                )
+    executor_service = create_executor_service(data.get("executor_service", {}))
+
+    scheduler = create_galaxy(
+        data=data,
+        exception_at_duplicate_world_names=exception_at_duplicate_world_names,
+        timed=timed,
+        timing_collector=None if timing_exporter is None else timing_exporter.collector,
+        executor_service=executor_service,
+    )
 
     try:
-        print()
-        print("----------------------")
-        print("galaxy: ", galaxy)
-        print("----------------------")
-        print()
-        print(f"Entry World: {starting_world}")
-        print()
-        print()
-        galaxy[starting_world].process()
+        with scheduler, executor_service:
+            scheduled_worlds = scheduler.reachable(starting_world)
+            print_galaxy(starting_world, scheduled_worlds)
+            if tick_loop_config is None:
+                scheduler.run_until_drained(scheduled_worlds)
+                return None
+
+            tick_loop = create_tick_loop(
+                scheduler, scheduled_worlds, tick_loop_config, timing_exporter
+            )
+            try:
+                return tick_loop.run()
+            finally:
+                print()
+                print(f"Tick Stats: {tick_loop.stats}")
     except KeyboardInterrupt:
-        return
+        return None
+    finally:
+        print_executor_stats(executor_service)
+        if timing_exporter is not None:
+            timing_exporter.close()
+
+
+async def async_universe(
+    data: Dict[str, Union[str, list, int, float, dict]],
+    exception_at_duplicate_world_names: bool = True,
+    timed: bool = False,
+) -> Optional[TickStats]:
+    """The asyncio counterpart of `universe`, that drives every scheduled world on the
+    running event loop.
+
+    Processors with an `async def process` are awaited on the event loop, and
+    synchronous processors are offloaded to the `scheduler` thread pool, so I/O heavy
+    processors (file reads, HTTP serving, UI) overlap rather than block each other.
+    Configs are the same as for `universe`, but the `scheduler` executor has to be
+    `thread`:
+        e.g.
+            asyncio.run(async_universe(data=config))
+
+    Args:
+        data (Dict[str, Union[str, list, int, float, dict]]): Config data dictionary
+
+        exception_at_duplicate_world_names (bool): this is used to raise an exception if
+                                                more than 1 world has the same name, to
+                                                prevent unexpected application behavior
+
+        timed (bool): see `universe`
+
+    Returns:
+        Optional[TickStats]: the tick loop counters, when running with `tick_loop`
+    """
+
+    # Set the starting world, or a list of starting worlds
+    starting_world: Union[str, List[str]] = data["starting_world"]
+    tick_loop_config: Optional[Dict] = data.get("tick_loop", None)
+
+    timing_exporter: Optional[TimingExporter] = None
+    if timed:
+        timing_exporter = create_timing_exporter(data.get("timing", {}))
+
+    executor_service = create_executor_service(data.get("executor_service", {}))
+
+    scheduler = create_galaxy(
+        data=data,
+        exception_at_duplicate_world_names=exception_at_duplicate_world_names,
+        timed=timed,
+        timing_collector=None if timing_exporter is None else timing_exporter.collector,
+        executor_service=executor_service,
+    )
+
+    try:
+        with scheduler, executor_service:
+            scheduled_worlds = scheduler.reachable(starting_world)
+            print_galaxy(starting_world, scheduled_worlds)
+            if tick_loop_config is None:
+                await scheduler.arun_until_drained(scheduled_worlds)
+                return None
+
+            tick_loop = create_tick_loop(
+                scheduler, scheduled_worlds, tick_loop_config, timing_exporter
+            )
+            try:
+                return await tick_loop.arun()
+            finally:
+                print()
+                print(f"Tick Stats: {tick_loop.stats}")
+    finally:
+        print_executor_stats(executor_service)
+        if timing_exporter is not None:
+            timing_exporter.close()
@@ -0,0 +1,283 @@
+"""BSPEC World, extending the `esper` World with deadline aware, parallel and asyncio
+processing."""
+
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+import functools
+import inspect
+import time as _time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import esper
+from esper import Processor
+
+from bspec.universe.dependency_graph import (
+    arun_in_dependency_order,
+    run_in_dependency_order,
+)
+from bspec.universe.processor_graph import build_processor_dependencies
+from bspec.universe.timing import TimingCollector
+
+
+class World(esper.World):
+    """An `esper` World that can defer low priority processors once a tick overruns
+    its latency budget, and run non conflicting processors in parallel.
+
+    Processors may implement `process` as a coroutine function (`async def process`),
+    these are awaited by `aprocess` on the event loop while synchronous processors are
+    offloaded to a thread pool. `process` runs coroutine processors to completion with
+    `asyncio.run`, so either kind of processor works in either kind of world.
+
+    Args:
+        timed (bool): replace `_process` with `_timed_process`, saving how long each
+                    `Processor` takes to run to the property `process_times`
+
+        deferrable_priority (int, default 0): processors with a priority less than or
+                    equal to this value are skipped for the current tick once the
+                    `deadline` has passed. A processor deferred on one tick always runs
+                    on the next tick so it can not be starved.
+
+        parallel_processors (bool, default False): run processors on a thread pool,
+                    following the dependency graph built from each processor's
+                    `reads` and `writes` components, instead of strictly one at a time
+
+        max_workers (int, optional): the size of the processor thread pool
+
+        world_name (str, optional): the name of the world in the galaxy, used to label
+                    the timings recorded to the `timing_collector`
+
+    Params:
+        deadline (float, optional): a `time.perf_counter` timestamp set per tick by the
+                    tick loop, `None` means the world will never defer processors
+
+        deferred (List[Processor]): processors that were deferred during the last tick
+
+        timing_collector (TimingCollector, optional): when the world is `timed`, the
+                    timings of every tick are recorded to this collector
+
+        last_tick_seconds (float): when the world is `timed`, the wall time of the last tick
+
+        last_timings (Dict[str, float]): when the world is `timed`, the wall time of each
+                    processor during the last tick
+    """
+
+    def __init__(
+        self,
+        timed: bool = False,
+        deferrable_priority: int = 0,
+        parallel_processors: bool = False,
+        max_workers: Optional[int] = None,
+        world_name: Optional[str] = None,
+    ):
+        super().__init__(timed=timed)
+        self.world_name = world_name
+        self.deferrable_priority = deferrable_priority
+        self.parallel_processors = parallel_processors
+        self.max_workers = max_workers
+        self.deadline: Optional[float] = None
+        self.deferred: List[Processor] = []
+        self.timing_collector: Optional[TimingCollector] = None
+        self.last_tick_seconds: float = 0.0
+        self.last_timings: Dict[str, float] = {}
+
+        self._processor_dependencies: Optional[Dict[int, List[int]]] = None
+        self._executor: Optional[Executor] = None
+
+    def __getstate__(self) -> Dict:
+        # Pools can not be pickled, they are recreated on first use, and the timing
+        # collector is reattached by whoever unpickles the world
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["timing_collector"] = None
+        return state
+
+    @property
+    def executor(self) -> Executor:
+        """The processor pool is created on first use and reused for every tick."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def add_processor(self, processor_instance: Processor, priority=0) -> None:
+        super().add_processor(processor_instance, priority=priority)
+        self._processor_dependencies = None
+
+    def remove_processor(self, processor_type) -> None:
+        super().remove_processor(processor_type)
+        self._processor_dependencies = None
+
+    def pending(self) -> bool:
+        """Whether a processor has work left over from the last tick, e.g. a stream of
+        chunks that is not drained yet, so the world needs to be processed again.
+
+        Processors opt in by implementing `pending() -> bool`.
+        """
+        return any(
+            processor.pending()
+            for processor in self._processors
+            if callable(getattr(processor, "pending", None))
+        )
+
+    def end_tick(self) -> None:
+        """Let processors finish the tick once every processor has run, e.g. execute
+        the lazy plans they added steps to.
+
+        Processors opt in by implementing `end_tick() -> None`.
+        """
+        for processor in self._processors:
+            end_tick = getattr(processor, "end_tick", None)
+            if callable(end_tick):
+                end_tick()
+
+    def _should_defer(self, processor: Processor, previously_deferred) -> bool:
+        """Defer a low priority processor if the deadline has passed, unless it was
+        already deferred on the previous tick."""
+        return (
+            self.deadline is not None
+            and processor.priority <= self.deferrable_priority
+            and processor not in previously_deferred
+            and _time.perf_counter() > self.deadline
+        )
+
+    def _run_processors(
+        self, run_processor: Callable[..., None], *args, **kwargs
+    ) -> None:
+        """Run every processor with `run_processor`, serially in priority order or in
+        parallel following the processor dependency graph."""
+        previously_deferred, self.deferred = self.deferred, []
+
+        def run(index: int) -> None:
+            processor = self._processors[index]
+            if self._should_defer(processor, previously_deferred):
+                self.deferred.append(processor)
+                return
+            run_processor(processor, *args, **kwargs)
+
+        if not self.parallel_processors:
+            for index in range(len(self._processors)):
+                run(index)
+            return
+
+        if self._processor_dependencies is None:
+            self._processor_dependencies = build_processor_dependencies(
+                self._processors
+            )
+
+        def submit(index: int) -> Future:
+            return self.executor.submit(run, index)
+
+        run_in_dependency_order(
+            nodes=range(len(self._processors)),
+            dependencies=self._processor_dependencies,
+            run=run,
+            submit=submit,
+        )
+
+    @staticmethod
+    def _run_processor(processor: Processor, *args, **kwargs) -> None:
+        result = processor.process(*args, **kwargs)
+        if inspect.isawaitable(result):
+            asyncio.run(result)
+
+    def _record_processor_time(self, processor: Processor, seconds: float) -> None:
+        # `processor_name` is the registered name set by the `processor_factory`, and
+        # tells apart several processors of the same class
+        processor_name = getattr(processor, "processor_name", None)
+        self.last_timings[processor_name or processor.__class__.__name__] = seconds
+        self.process_times[processor.__class__.__name__] = int(round(seconds * 1000, 2))
+
+    def record_timings(self) -> None:
+        """Record the timings of the last tick to the `timing_collector`, if set."""
+        if self.timing_collector is None:
+            return
+        world_name = self.world_name or str(id(self))
+        self.timing_collector.record_world(world_name, self.last_tick_seconds)
+        for processor_name, seconds in self.last_timings.items():
+            self.timing_collector.record_processor(world_name, processor_name, seconds)
+
+    def _run_timed_processor(self, processor: Processor, *args, **kwargs) -> None:
+        start_time = _time.perf_counter()
+        self._run_processor(processor, *args, **kwargs)
+        self._record_processor_time(processor, _time.perf_counter() - start_time)
+
+    def _process(self, *args, **kwargs):
+        self._run_processors(self._run_processor, *args, **kwargs)
+        self.end_tick()
+
+    def _timed_process(self, *args, **kwargs):
+        """Track Processor execution time for benchmarking."""
+        start_time = _time.perf_counter()
+        self.last_timings = {}
+        self._run_processors(self._run_timed_processor, *args, **kwargs)
+        self.end_tick()
+        self.last_tick_seconds = _time.perf_counter() - start_time
+        self.record_timings()
+
+    async def _arun_processor(
+        self, processor: Processor, executor: Optional[Executor], *args, **kwargs
+    ) -> None:
+        if inspect.iscoroutinefunction(processor.process):
+            await processor.process(*args, **kwargs)
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executor, functools.partial(self._run_processor, processor, *args, **kwargs)
+        )
+
+    async def _arun_timed_processor(
+        self, processor: Processor, executor: Optional[Executor], *args, **kwargs
+    ) -> None:
+        start_time = _time.perf_counter()
+        await self._arun_processor(processor, executor, *args, **kwargs)
+        self._record_processor_time(processor, _time.perf_counter() - start_time)
+
+    async def aprocess(self, executor: Optional[Executor] = None, *args, **kwargs):
+        """Await every Processor on the running event loop, the asyncio counterpart
+        of `process`.
+
+        Coroutine processors are awaited directly and synchronous processors run on
+        `executor`, so blocking processors do not hold up the event loop. With
+        `parallel_processors` set, non conflicting processors are run concurrently.
+
+        Args:
+            executor (Executor, optional): the pool for synchronous processors,
+                        defaults to the event loop's default executor
+        """
+        self._clear_dead_entities()
+
+        timed = hasattr(self, "process_times")
+        if timed:
+            start_time = _time.perf_counter()
+            self.last_timings = {}
+            run_processor: Callable[..., Awaitable[None]] = self._arun_timed_processor
+        else:
+            run_processor = self._arun_processor
+
+        previously_deferred, self.deferred = self.deferred, []
+
+        async def run(index: int) -> None:
+            processor = self._processors[index]
+            if self._should_defer(processor, previously_deferred):
+                self.deferred.append(processor)
+                return
+            await run_processor(processor, executor, *args, **kwargs)
+
+        if not self.parallel_processors:
+            for index in range(len(self._processors)):
+                await run(index)
+        else:
+            if self._processor_dependencies is None:
+                self._processor_dependencies = build_processor_dependencies(
+                    self._processors
+                )
+            await arun_in_dependency_order(
+                nodes=range(len(self._processors)),
+                dependencies=self._processor_dependencies,
+                run=run,
+            )
+
+        await asyncio.get_running_loop().run_in_executor(executor, self.end_tick)
+
+        if timed:
+            self.last_tick_seconds = _time.perf_counter() - start_time
+            self.record_timings()
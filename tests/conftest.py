@@ -0,0 +1,18 @@
+import pytest
+
+from bspec.universe import universe as universe_module
+
+
+@pytest.fixture
+def empty_galaxy():
+    """Start and end the test with no worlds registered to the `galaxy`."""
+
+    def clear():
+        universe_module.galaxy.clear()
+        universe_module.deferred_worlds.clear()
+        universe_module.deferred_dependencies.clear()
+        universe_module.galaxy_scheduler = None
+
+    clear()
+    yield universe_module.galaxy
+    clear()
@@ -0,0 +1,116 @@
+"""Coroutine processors are awaited on the event loop, and synchronous processors are
+offloaded so they do not block it."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import esper
+import pytest
+
+from bspec.universe import universe
+from bspec.universe.galaxy_scheduler import GalaxyScheduler
+from bspec.universe.world import World
+
+
+class AsyncRecord(esper.Processor):
+    def __init__(self, name, processed):
+        super().__init__()
+        self.name = name
+        self.processed = processed
+
+    async def process(self):
+        await asyncio.sleep(0)
+        self.processed.append((self.name, threading.current_thread()))
+
+
+class SyncRecord(AsyncRecord):
+    def process(self):
+        self.processed.append((self.name, threading.current_thread()))
+
+
+class Handshake(esper.Processor):
+    """Waits for the other world, so both have to be awaited concurrently."""
+
+    def __init__(self, mine, theirs):
+        super().__init__()
+        self.mine = mine
+        self.theirs = theirs
+
+    async def process(self):
+        self.mine.set()
+        await asyncio.wait_for(self.theirs.wait(), timeout=5)
+
+
+def test_aprocess_offloads_synchronous_processors():
+    processed = []
+    world = World()
+    world.add_processor(AsyncRecord("fetch", processed), priority=2)
+    world.add_processor(SyncRecord("parse", processed), priority=1)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await world.aprocess(executor)
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(main())
+
+    assert [name for name, _ in processed] == ["fetch", "parse"]
+    assert processed[0][1] is loop_thread
+    assert processed[1][1] is not loop_thread
+
+
+def test_process_runs_coroutine_processors_to_completion():
+    processed = []
+    world = World()
+    world.add_processor(AsyncRecord("fetch", processed))
+
+    world.process()
+
+    assert [name for name, _ in processed] == ["fetch"]
+
+
+def test_independent_worlds_are_awaited_concurrently():
+    async def main():
+        left, right = asyncio.Event(), asyncio.Event()
+        galaxy = {"left": World(), "right": World()}
+        galaxy["left"].add_processor(Handshake(left, right))
+        galaxy["right"].add_processor(Handshake(right, left))
+        with GalaxyScheduler(galaxy, dependencies={}) as scheduler:
+            await scheduler.arun_tick(["left", "right"])
+
+    asyncio.run(main())
+
+
+def test_awaited_worlds_run_after_their_dependencies():
+    processed = []
+    galaxy = {"read": World(), "report": World()}
+    for world_name, world in galaxy.items():
+        world.add_processor(AsyncRecord(world_name, processed))
+
+    with GalaxyScheduler(galaxy, dependencies={"report": ["read"]}) as scheduler:
+        asyncio.run(scheduler.arun_tick(["report", "read"]))
+
+    assert [name for name, _ in processed] == ["read", "report"]
+
+
+def test_worlds_can_not_be_awaited_on_a_process_pool():
+    scheduler = GalaxyScheduler({}, dependencies={}, executor="process")
+
+    with pytest.raises(ValueError, match="`thread` executor"):
+        asyncio.run(scheduler.arun_tick([]))
+
+
+def test_async_universe_runs_the_tick_loop(empty_galaxy):
+    stats = asyncio.run(
+        universe.async_universe(
+            {
+                "processor_plugins": [],
+                "starting_world": "stores",
+                "galaxy": [{"world_name": "stores", "processors": [], "entities": []}],
+                "tick_loop": {"rate": 1000, "max_ticks": 2},
+            }
+        )
+    )
+
+    assert stats.ticks == 2
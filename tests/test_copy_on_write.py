@@ -0,0 +1,67 @@
+"""Copy-on-write is an opt-in of the processors, scoped to their own steps."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.pd_dataframes import (
+    PD_DataFrames,
+    copy_on_write,
+    copy_on_write_available,
+)
+from bspec.components.pd_input_dropna.pd_input_dropna import PD_Input_DropNA
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_dropna.processor import PD_DropNA
+from bspec.universe.world import World
+
+
+def dropna(**kwargs):
+    world = World()
+    pd_dataframes = PD_DataFrames(
+        dataframe_1=pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4, 5, 6]})
+    )
+    world.create_entity(RuntimeDebugPrint(), PD_Input_DropNA(), pd_dataframes)
+    world.add_processor(PD_DropNA(**kwargs))
+    world.process()
+    return pd_dataframes
+
+
+def shares_memory(pd_dataframes):
+    return np.shares_memory(
+        pd_dataframes.dataframe_1["a"].to_numpy(),
+        pd_dataframes.dataframe_2["a"].to_numpy(),
+    )
+
+
+def test_importing_the_component_leaves_the_pandas_options_alone():
+    if copy_on_write_available():
+        assert pd.get_option("mode.copy_on_write") is False
+
+
+def test_dropna_copies_by_default():
+    pd_dataframes = dropna()
+
+    assert not shares_memory(pd_dataframes)
+    pd_dataframes.dataframe_2.loc[0, "a"] = 100.0
+    assert pd_dataframes.dataframe_1.loc[0, "a"] == 1.0
+
+
+@pytest.mark.skipif(not copy_on_write_available(), reason="pandas < 1.5")
+def test_dropna_with_copy_on_write_is_scoped_to_the_step():
+    pd_dataframes = dropna(copy_on_write=True)
+
+    assert pd.get_option("mode.copy_on_write") is False
+    pd.testing.assert_frame_equal(pd_dataframes.dataframe_2, pd_dataframes.dataframe_1)
+    with copy_on_write():
+        pd_dataframes.dataframe_2.loc[0, "a"] = 100.0
+    assert pd_dataframes.dataframe_1.loc[0, "a"] == 1.0
+
+
+def test_copy_on_write_scope():
+    with copy_on_write(enabled=False):
+        if copy_on_write_available():
+            assert pd.get_option("mode.copy_on_write") is False
+    if copy_on_write_available():
+        with copy_on_write():
+            assert pd.get_option("mode.copy_on_write") is True
+        assert pd.get_option("mode.copy_on_write") is False
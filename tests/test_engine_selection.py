@@ -0,0 +1,127 @@
+"""`engine="auto"` reads with the fastest engine that supports the options, and only
+falls back to the next engine when pandas rejects an option."""
+
+import io
+
+import pandas as pd
+import pytest
+
+from bspec.processors.pd_read_csv import engine_selection
+from bspec.processors.pd_read_csv.engine_selection import (
+    FALLBACK_UNSUPPORTED_OPTIONS,
+    UNSUPPORTED_OPTIONS,
+    read_csv_auto,
+    rejected_option,
+    select_engines,
+)
+
+pytest.importorskip("pyarrow")
+
+"""
+A value, other than the `read_csv` default, for every option an engine may reject
+"""
+CHANGED_OPTIONS = {
+    "skipfooter": 1,
+    "float_precision": "high",
+    "chunksize": 1,
+    "comment": "#",
+    "nrows": 1,
+    "thousands": ",",
+    "memory_map": True,
+    "dialect": "excel",
+    "warn_bad_lines": True,
+    "error_bad_lines": False,
+    "on_bad_lines": "warn",
+    "delim_whitespace": True,
+    "quoting": 3,
+    "lineterminator": "\n",
+    "converters": {"a": str},
+    "decimal": ",",
+    "iterator": True,
+    "dayfirst": True,
+    "infer_datetime_format": True,
+    "verbose": True,
+    "skipinitialspace": True,
+    "low_memory": False,
+}
+
+
+@pytest.fixture
+def read_csv_calls(monkeypatch):
+    calls = []
+    read_csv = pd.read_csv
+
+    def spy(**kwargs):
+        calls.append(kwargs["engine"])
+        return read_csv(**kwargs)
+
+    monkeypatch.setattr(engine_selection.pd, "read_csv", spy)
+    return calls
+
+
+@pytest.mark.filterwarnings("ignore")
+@pytest.mark.parametrize("engine", ["pyarrow", "c", "python"])
+def test_unsupported_options_match_the_installed_pandas(engine):
+    assert UNSUPPORTED_OPTIONS[engine] == set(FALLBACK_UNSUPPORTED_OPTIONS[engine])
+    for option in sorted(FALLBACK_UNSUPPORTED_OPTIONS[engine]):
+        with pytest.raises(ValueError) as error:
+            pd.read_csv(
+                io.StringIO("a,b\n1,2\n3,4\n"),
+                engine=engine,
+                **{option: CHANGED_OPTIONS[option]},
+            )
+        assert rejected_option(error.value), (option, str(error.value))
+
+
+def test_select_engines():
+    assert select_engines({"sep": ","}) == (["pyarrow", "c", "python"], "")
+
+    engines, reason = select_engines({"comment": "#", "skipfooter": 1})
+    assert engines == ["python"]
+    assert reason == (
+        "pyarrow: unsupported comment, skipfooter; c: unsupported skipfooter"
+    )
+
+    engines, reason = select_engines({"sep": ";|,"})
+    assert engines == ["python"]
+    assert "regex separator ';|,'" in reason
+
+
+def test_rejected_option_falls_back_to_the_next_engine(read_csv_calls):
+    buffer = io.StringIO("a,b\n1,n/a\n3,4\n")
+
+    frame, engine, reason = read_csv_auto(
+        {"filepath_or_buffer": buffer, "na_values": {"b": ["n/a"]}}
+    )
+
+    assert read_csv_calls == ["pyarrow", "c"]
+    assert engine == "c"
+    assert "pyarrow: The pyarrow engine doesn't support passing a dict" in reason
+    assert frame["b"].isna().tolist() == [True, False]
+
+
+@pytest.mark.parametrize(
+    "filepath_or_buffer, error",
+    [
+        ("missing.csv", FileNotFoundError),
+        (io.StringIO("a,b\n1,2\n3,4,5\n"), ValueError),
+    ],
+    ids=["missing-file", "parse-error"],
+)
+def test_other_errors_are_raised_from_the_first_engine(
+    read_csv_calls, filepath_or_buffer, error
+):
+    with pytest.raises(error):
+        read_csv_auto({"filepath_or_buffer": filepath_or_buffer})
+
+    assert read_csv_calls == ["pyarrow"]
+
+
+def test_rejected_option():
+    assert rejected_option(
+        ValueError("The 'comment' option is not supported with the 'pyarrow' engine")
+    )
+    assert rejected_option(ValueError("the 'c' engine does not support skipfooter"))
+    assert not rejected_option(pd.errors.ParserError("Expected 2 fields, saw 3"))
+    assert not rejected_option(ValueError("could not convert string to float"))
+    assert not rejected_option(MemoryError())
@@ -0,0 +1,153 @@
+"""The galaxy cache reuses the compiled galaxy until the root config or a pipeline JSON
+changes."""
+
+import json
+import os
+
+import pytest
+
+from bspec.common_core.frozen import thaw
+from bspec.pipelines import galaxy_cache
+from bspec.pipelines.galaxy_cache import (
+    cached_pipeline_read,
+    galaxy_cache_key,
+    root_config_key,
+)
+from bspec.pipelines.recursive_pipeline_read import recursive_pipeline_read
+
+
+def write_pipeline(path, world_name="read_stores"):
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "processor_plugins": ["bspec.processors.pd_read_csv.processor"],
+                "world": {
+                    "world_name": world_name,
+                    "processors": [{"processor_name": "pd_read_csv", "priority": 1}],
+                    "entities": [
+                        {
+                            "id": "stores",
+                            "components": [{"component_name": "pd_dataframes"}],
+                        }
+                    ],
+                },
+            },
+            file,
+        )
+    return str(path)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return {
+        "processor_plugins": [],
+        "starting_world": "stores",
+        "galaxy": [],
+        "pipelines": [
+            {
+                "pipeline": write_pipeline(tmp_path / "read_stores.json"),
+                "world_name": "stores",
+            }
+        ],
+    }
+
+
+def read(config, cache_dir, **kwargs):
+    return cached_pipeline_read(
+        data=config,
+        processor_plugins=set(config["processor_plugins"]),
+        galaxy_config=list(config["galaxy"]),
+        cache_dir=cache_dir,
+        **kwargs,
+    )
+
+
+def compiled_galaxies(cache_dir):
+    return sorted(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else []
+
+
+def test_compiled_galaxy_is_reused(config, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    first = read(config, cache_dir)
+    assert compiled_galaxies(cache_dir) == [
+        f"galaxy-{root_config_key(config)}-{galaxy_cache_key(config)}.json"
+    ]
+
+    def resolve_again(**kwargs):
+        raise AssertionError("the pipelines were resolved again")
+
+    monkeypatch.setattr(galaxy_cache, "recursive_pipeline_read", resolve_again)
+    second = read(config, cache_dir)
+
+    assert second["all_processor_plugins"] == first["all_processor_plugins"]
+    assert second["galaxy_config"] == thaw(first["galaxy_config"])
+    assert second["galaxy_config"][0]["world_name"] == "stores"
+
+
+def test_changes_invalidate_the_compiled_galaxy(config, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    read(config, cache_dir)
+    key = galaxy_cache_key(config)
+
+    write_pipeline(config["pipelines"][0]["pipeline"], world_name="stores_v2")
+    assert galaxy_cache_key(config) != key
+
+    changed_root = {**config, "starting_world": "other"}
+    assert galaxy_cache_key(changed_root) not in (key, galaxy_cache_key(config))
+
+    read(changed_root, cache_dir)
+    assert len(compiled_galaxies(cache_dir)) == 2
+
+
+def test_corrupt_compiled_galaxy_is_rebuilt(config, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    read(config, cache_dir)
+    cache_path = os.path.join(cache_dir, compiled_galaxies(cache_dir)[0])
+    with open(cache_path, "w") as file:
+        file.write("{")
+
+    returned_val = read(config, cache_dir)
+
+    assert returned_val["galaxy_config"][0]["world_name"] == "stores"
+    with open(cache_path) as file:
+        assert json.load(file)["galaxy_config"][0]["world_name"] == "stores"
+
+
+def test_pipelines_without_json_are_not_cached(config, tmp_path):
+    config["pipelines"][0]["pipeline"] = str(tmp_path / "missing.json")
+    assert galaxy_cache_key(config) is None
+
+    config["pipelines"] = []
+    returned_val = read(config, str(tmp_path / "cache"))
+    assert returned_val == recursive_pipeline_read(
+        data=config, processor_plugins=set(), galaxy_config=[]
+    )
+
+
+def test_a_new_compiled_galaxy_replaces_the_previous_one(config, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    read(config, cache_dir)
+    write_pipeline(config["pipelines"][0]["pipeline"], world_name="stores_v2")
+    read(config, cache_dir)
+
+    assert compiled_galaxies(cache_dir) == [
+        f"galaxy-{root_config_key(config)}-{galaxy_cache_key(config)}.json"
+    ]
+
+
+def test_least_recently_used_compiled_galaxies_are_evicted(config, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    configs = [{**config, "starting_world": f"stores_{index}"} for index in range(3)]
+    for index, root_config in enumerate(configs):
+        read(root_config, cache_dir, max_entries=2)
+        # give every compiled galaxy a distinct, increasing modification time
+        for file_name in compiled_galaxies(cache_dir):
+            if file_name.startswith(f"galaxy-{root_config_key(root_config)}-"):
+                os.utime(os.path.join(cache_dir, file_name), (index, index))
+
+    remaining = compiled_galaxies(cache_dir)
+    assert len(remaining) == 2
+    assert not any(
+        file_name.startswith(f"galaxy-{root_config_key(configs[0])}-")
+        for file_name in remaining
+    )
@@ -0,0 +1,113 @@
+"""`GalaxyScheduler` runs independent worlds concurrently, and a world only after the
+worlds it depends on, on a thread or a process pool."""
+
+import threading
+
+import esper
+import pytest
+
+from bspec.universe.galaxy_scheduler import GalaxyScheduler
+from bspec.universe.world import World
+
+DEPENDENCIES = {
+    "read_stores": [],
+    "read_sales": [],
+    "join": ["read_stores", "read_sales"],
+    "report": ["join"],
+}
+
+
+class Count(esper.Processor):
+    def __init__(self, world_name, log_path=None):
+        super().__init__()
+        self.world_name = world_name
+        self.log_path = log_path
+        self.count = 0
+
+    def process(self):
+        self.count += 1
+        if self.log_path is not None:
+            with open(self.log_path, "a") as file:
+                file.write(f"{self.world_name}\n")
+
+
+class Meet(esper.Processor):
+    def __init__(self, barrier):
+        super().__init__()
+        self.barrier = barrier
+
+    def process(self):
+        self.barrier.wait()
+
+
+def galaxy_of(dependencies, log_path=None):
+    galaxy = {}
+    for world_name in dependencies:
+        galaxy[world_name] = World(world_name=world_name)
+        galaxy[world_name].add_processor(Count(world_name, log_path))
+    return galaxy
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_worlds_run_after_their_dependencies(tmp_path, executor):
+    log_path = str(tmp_path / "processed.log")
+    with GalaxyScheduler(
+        galaxy_of(DEPENDENCIES, log_path),
+        dependencies=DEPENDENCIES,
+        executor=executor,
+        max_workers=2,
+    ) as scheduler:
+        scheduler.run_tick(["report", "join", "read_sales", "read_stores"])
+        scheduler.run_tick(DEPENDENCIES)
+
+    with open(log_path) as file:
+        processed = file.read().split()
+    for tick in (processed[:4], processed[4:]):
+        assert set(tick[:2]) == {"read_stores", "read_sales"}
+        assert tick[2:] == ["join", "report"]
+    # the process pool works on copies, the processed worlds are handed back
+    for world_name, world in scheduler.galaxy.items():
+        assert world.get_processor(Count).count == 2
+
+
+def test_independent_worlds_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    galaxy = {"left": World(), "right": World()}
+    for world in galaxy.values():
+        world.add_processor(Meet(barrier))
+
+    with GalaxyScheduler(galaxy, dependencies={}, max_workers=2) as scheduler:
+        scheduler.run_tick(["left", "right"])
+
+    assert not barrier.broken
+
+
+def test_dependencies_outside_the_tick_are_ignored(tmp_path):
+    log_path = str(tmp_path / "processed.log")
+    with GalaxyScheduler(
+        galaxy_of(DEPENDENCIES, log_path), dependencies=DEPENDENCIES
+    ) as scheduler:
+        scheduler.run_tick(["report"])
+
+    with open(log_path) as file:
+        assert file.read().split() == ["report"]
+    assert scheduler.reachable("join") == ["read_stores", "read_sales", "join"]
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError, match="Unknown scheduler executor"):
+        GalaxyScheduler({}, dependencies={}, executor="fiber")
+
+
+def test_add_world_checks_its_dependencies():
+    scheduler = GalaxyScheduler(galaxy_of({"read": []}), dependencies={"read": []})
+
+    with pytest.raises(ValueError, match="unknown world: `join`"):
+        scheduler.add_world("report", World(), ["join"])
+
+    scheduler.add_world("join", World(), ["read"])
+    scheduler.dependencies["read"] = ["report"]
+    with pytest.raises(ValueError, match="Circular dependency"):
+        scheduler.add_world("report", World(), ["join"])
+    assert "report" not in scheduler.dependencies
+    assert "report" not in scheduler.galaxy
@@ -0,0 +1,86 @@
+"""`PD_GroupBy_Agg` aggregates the output of `PD_DropNA` with the component defaults, the
+same whether the CSV is read at once, lazily or streamed."""
+
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_dropna.pd_input_dropna import PD_Input_DropNA
+from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
+from bspec.components.pd_input_groupby_agg.pd_input_groupby_agg import (
+    PD_Input_GroupBy_Agg,
+)
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_dropna.processor import PD_DropNA
+from bspec.processors.pd_groupby_agg.partial_aggregation import PartialAggregation
+from bspec.processors.pd_groupby_agg.processor import PD_GroupBy_Agg
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV
+from bspec.universe.world import World
+
+AGG_COLUMNS = {"value": ["sum", "mean", "count", "min", "max"]}
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "region": ["north", "south", "east", "north", "south"] * 40,
+            "value": [float(value) if value % 6 else None for value in range(200)],
+        }
+    )
+
+
+@pytest.fixture
+def csv_path(tmp_path, frame):
+    path = tmp_path / "stores.csv"
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+def read_dropna_groupby(csv_path, lazy=False, chunksize=None):
+    world = World()
+    pd_dataframes = PD_DataFrames(group_by_columns=["region"], agg_columns=AGG_COLUMNS)
+    world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(
+            filepath_or_buffer=csv_path,
+            na_filter=True,
+            keep_default_na=True,
+            chunksize=chunksize,
+        ),
+        PD_Input_DropNA(),
+        PD_Input_GroupBy_Agg(),
+        pd_dataframes,
+    )
+    world.add_processor(PD_Read_CSV(lazy=lazy), priority=3)
+    world.add_processor(PD_DropNA(lazy=lazy), priority=2)
+    world.add_processor(PD_GroupBy_Agg(lazy=lazy), priority=1)
+    world.process()
+    while world.pending():
+        world.process()
+    return pd_dataframes
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"lazy": True}, {"chunksize": 30}], ids=["eager", "lazy", "stream"]
+)
+def test_defaults_aggregate_the_dropna_output(frame, csv_path, options):
+    pd_dataframes = read_dropna_groupby(csv_path, **options)
+
+    expected = frame.dropna().groupby("region", sort=False).agg(AGG_COLUMNS)
+    pd.testing.assert_frame_equal(
+        pd_dataframes.dataframe_3.sort_index(), expected.sort_index()
+    )
+    if not options:
+        assert len(pd_dataframes.dataframe_2) == len(frame.dropna())
+
+
+def test_partial_aggregation_matches_a_single_aggregation(frame):
+    partial = PartialAggregation(["region"], AGG_COLUMNS)
+    for start in range(0, len(frame), 33):
+        partial.add(frame.iloc[start : start + 33])
+
+    pd.testing.assert_frame_equal(
+        partial.result().sort_index(),
+        frame.groupby("region").agg(AGG_COLUMNS).sort_index(),
+    )
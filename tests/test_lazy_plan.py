@@ -0,0 +1,125 @@
+"""A lazy `PD_Read_CSV` and `PD_DropNA` give the same dataframes as running them straight
+away, fusing the dropna into the scan only when nothing else reads the unfiltered
+dataframe."""
+
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.lazy_plan import (
+    PendingFrame,
+    PlanStep,
+    execute_plans,
+    plan_of,
+)
+from bspec.components.pd_dataframe.pd_dataframes import (
+    PD_DataFrames,
+    slot_frame,
+    slot_memory,
+)
+from bspec.components.pd_input_dropna.pd_input_dropna import PD_Input_DropNA
+from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_dropna.processor import PD_DropNA
+from bspec.processors.pd_read_csv import processor as read_csv_module
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV, same_inference
+from bspec.universe.world import World
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "stores.csv"
+    pd.DataFrame(
+        {
+            "id": range(20),
+            "region": ["north", "south", None, "east"] * 5,
+            "sales": [float(value) if value % 3 else None for value in range(20)],
+        }
+    ).to_csv(path, index=False)
+    return str(path)
+
+
+def read_dropna(csv_path, lazy, consumes=()):
+    """The `PD_DataFrames` after the tick, and the plan as it was executed."""
+    world = World()
+    pd_dataframes = PD_DataFrames()
+    world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(
+            filepath_or_buffer=csv_path, na_filter=True, keep_default_na=True
+        ),
+        PD_Input_DropNA(subset=["region"]),
+        pd_dataframes,
+    )
+    processors = [PD_Read_CSV(lazy=lazy), PD_DropNA(lazy=lazy, consumes=consumes)]
+    for priority, processor in enumerate(reversed(processors)):
+        world.add_processor(processor, priority=priority)
+    for processor in processors:
+        processor.process()
+    plan = [] if pd_dataframes.plan is None else pd_dataframes.plan.explain()
+    execute_plans(world)
+    return pd_dataframes, plan
+
+
+@pytest.mark.parametrize("consumes", [(), ("dataframe_1",)], ids=["kept", "consumed"])
+def test_lazy_steps_match_eager_steps(csv_path, consumes, monkeypatch):
+    monkeypatch.setattr(read_csv_module, "SCAN_CHUNK_ROWS", 3)
+    eager, _ = read_dropna(csv_path, lazy=False, consumes=consumes)
+
+    lazy, plan = read_dropna(csv_path, lazy=True, consumes=consumes)
+
+    if consumes:
+        # nothing else reads the unfiltered dataframe, so each chunk is filtered as
+        # it is read
+        assert plan == ["pd_read_csv: scan -> dataframe_1 fused=[pd_dropna]"]
+    else:
+        assert plan == [
+            "pd_read_csv: scan -> dataframe_1",
+            "pd_dropna: dataframe_1 -> dataframe_2",
+        ]
+    for slot in ("dataframe_1", "dataframe_2"):
+        pd.testing.assert_frame_equal(
+            getattr(lazy, slot), getattr(eager, slot), check_index_type=False
+        )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [["1", "2", "3", "4", "x", "6"], ["1", "2", "3", "", "5", "6"]],
+    ids=["strings-in-a-later-chunk", "missing-in-a-later-chunk"],
+)
+def test_chunked_scan_infers_the_dtypes_of_a_full_read(tmp_path, values, monkeypatch):
+    monkeypatch.setattr(read_csv_module, "SCAN_CHUNK_ROWS", 3)
+    path = tmp_path / "codes.csv"
+    path.write_text("code,region\n" + "".join(f"{value},north\n" for value in values))
+    expected = pd.read_csv(path)
+
+    lazy, plan = read_dropna(str(path), lazy=True, consumes=("dataframe_1",))
+
+    assert plan == ["pd_read_csv: scan -> dataframe_1 fused=[pd_dropna]"]
+    pd.testing.assert_frame_equal(lazy.dataframe_2, expected.dropna(subset=["region"]))
+    assert lazy.dataframe_2["code"].map(type).nunique() == 1
+
+
+def test_same_inference():
+    first = pd.DataFrame({"a": [1], "b": ["x"]}).dtypes
+
+    assert same_inference(first, pd.DataFrame({"a": [1.5], "b": ["y"]}).dtypes)
+    assert not same_inference(first, pd.DataFrame({"a": ["z"], "b": ["y"]}).dtypes)
+    assert not same_inference(first, pd.DataFrame({"a": [1]}).dtypes)
+
+
+def test_pending_slots_are_read_through_slot_frame():
+    frame = pd.DataFrame({"id": range(100)})
+    pd_dataframes = PD_DataFrames()
+    plan_of(pd_dataframes).add(
+        pd_dataframes,
+        PlanStep(name="scan", target="dataframe_1", run=lambda columns, chunk: frame),
+    )
+    assert isinstance(pd_dataframes.dataframe_1, PendingFrame)
+
+    memory = slot_memory(pd_dataframes)
+
+    assert pd_dataframes.plan is None
+    assert pd_dataframes.dataframe_1 is frame
+    assert memory["dataframe_1"] == frame.memory_usage(index=True, deep=True).sum()
+    assert slot_frame(pd_dataframes, "dataframe_1") is frame
@@ -0,0 +1,84 @@
+"""Worlds deferred by `create_galaxy` run after the worlds they depend on once
+`load_world` creates them."""
+
+import esper
+import pytest
+
+from bspec.universe import universe
+
+
+class Record(esper.Processor):
+    def __init__(self, world_name, processed):
+        super().__init__()
+        self.world_name = world_name
+        self.processed = processed
+
+    def process(self):
+        self.processed.append(self.world_name)
+
+
+def world_config(world_name, depends_on=()):
+    return {
+        "world_name": world_name,
+        "processors": [],
+        "entities": [],
+        "depends_on": list(depends_on),
+    }
+
+
+@pytest.fixture
+def scheduler(empty_galaxy):
+    scheduler = universe.create_galaxy(
+        {
+            "processor_plugins": [],
+            "starting_world": "read",
+            "galaxy": [
+                world_config("read"),
+                world_config("report", depends_on=["aggregate"]),
+                world_config("aggregate", depends_on=["read"]),
+            ],
+        }
+    )
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_load_world_registers_its_dependencies(scheduler):
+    assert scheduler.dependencies == {"read": []}
+    assert set(universe.deferred_worlds) == {"report", "aggregate"}
+
+    universe.load_world("report")
+
+    assert scheduler.dependencies == {
+        "read": [],
+        "aggregate": ["read"],
+        "report": ["aggregate"],
+    }
+    assert not universe.deferred_worlds
+    assert universe.load_world("report") is scheduler.galaxy["report"]
+
+
+def test_loaded_worlds_run_after_their_dependencies(scheduler):
+    universe.load_world("report")
+    processed = []
+    for world_name, world in scheduler.galaxy.items():
+        world.add_processor(Record(world_name, processed))
+
+    scheduler.run_tick(["report", "aggregate", "read"])
+
+    assert processed == ["read", "aggregate", "report"]
+
+
+def test_create_galaxy_rejects_circular_deferred_worlds(empty_galaxy):
+    with pytest.raises(ValueError, match="Circular dependency"):
+        universe.create_galaxy(
+            {
+                "processor_plugins": [],
+                "starting_world": "read",
+                "galaxy": [
+                    world_config("read"),
+                    world_config("aggregate", depends_on=["report"]),
+                    world_config("report", depends_on=["aggregate"]),
+                ],
+            }
+        )
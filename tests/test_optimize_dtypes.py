@@ -0,0 +1,53 @@
+"""`optimize_dtypes` converts columns in place to smaller dtypes with the same values,
+leaving the columns it can not convert as they are."""
+
+import pandas as pd
+
+from bspec.processors.pd_optimize_dtypes.dtype_optimizer import optimize_dtypes
+
+
+def stores():
+    return pd.DataFrame(
+        {
+            "id": range(100),
+            "sales": [value / 4 for value in range(100)],
+            "ratio": [value / 3 for value in range(100)],
+            "region": ["north", "south"] * 50,
+            "code": [f"code_{value}" for value in range(100)],
+        }
+    )
+
+
+def test_columns_are_converted_to_smaller_dtypes():
+    frame = stores()
+
+    savings = optimize_dtypes(frame, "dataframe_1", exclude=["code"])
+
+    assert {
+        column_savings.column: column_savings.to_dtype for column_savings in savings
+    } == {
+        "id": "int8",
+        "sales": "float32",
+        "region": "category",
+    }
+    assert all(column_savings.bytes_saved > 0 for column_savings in savings)
+    pd.testing.assert_frame_equal(
+        frame.astype({"region": object}), stores(), check_dtype=False
+    )
+    # float32 would not round trip every value
+    assert frame["ratio"].dtype == "float64"
+
+
+def test_unhashable_values_are_left_as_they_are():
+    frame = pd.DataFrame(
+        {
+            "tags": [["north"], ["south"]] * 50,
+            "meta": [{"open": True}] * 100,
+            "region": ["north", "south"] * 50,
+        }
+    )
+
+    savings = optimize_dtypes(frame, "dataframe_1", exclude=[])
+
+    assert [column_savings.column for column_savings in savings] == ["region"]
+    assert frame["tags"].dtype == object and frame["meta"].dtype == object
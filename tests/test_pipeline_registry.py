@@ -0,0 +1,86 @@
+"""The pipeline registry loads `pipeline.json` definitions without importing the pipeline
+modules, and parses each one again only once it changes."""
+
+import json
+import sys
+
+import pytest
+
+from bspec.pipelines.pipeline_registry import PipelineRegistry, read_pipeline_json
+from bspec.pipelines.recursive_pipeline_read import recursive_pipeline_read
+
+PACKAGE = "bspec_python_pipelines"
+
+
+def write_pipeline(path, world_name):
+    with open(path, "w") as file:
+        json.dump(
+            {
+                "processor_plugins": [],
+                "world": {"world_name": world_name, "processors": [], "entities": []},
+            },
+            file,
+        )
+    return str(path)
+
+
+def test_json_definitions_are_frozen_and_shared(tmp_path):
+    path = write_pipeline(tmp_path / "stores.json", "stores")
+    registry = PipelineRegistry()
+
+    definition = registry.get(path)
+
+    assert registry.get(path) is definition
+    assert definition["world"]["world_name"] == "stores"
+    with pytest.raises(TypeError):
+        definition["world"]["world_name"] = "sales"
+
+
+def test_edited_definitions_are_parsed_again(tmp_path):
+    path = write_pipeline(tmp_path / "stores.json", "stores")
+    registry = PipelineRegistry()
+    registry.get(path)
+
+    write_pipeline(path, "stores_v2")
+
+    assert registry.get(path)["world"]["world_name"] == "stores_v2"
+    returned_val = recursive_pipeline_read(
+        data={"pipelines": [{"pipeline": path}]},
+        processor_plugins=set(),
+        galaxy_config=[],
+    )
+    assert returned_val["galaxy_config"][0]["world_name"] == "stores_v2"
+
+
+def test_package_resources_are_read_without_importing_the_module(monkeypatch):
+    pipeline_module_name = "bspec.pipelines.pd_read_and_clean_csv.pipeline"
+    monkeypatch.delitem(sys.modules, pipeline_module_name, raising=False)
+
+    definition = PipelineRegistry().get(pipeline_module_name)
+
+    assert definition["world"]["world_name"] == "pd_read_and_clean_csv"
+    assert pipeline_module_name not in sys.modules
+
+
+def test_python_pipelines_are_imported(tmp_path, monkeypatch):
+    package = tmp_path / PACKAGE
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "pipeline.py").write_text(
+        "pipeline = {'processor_plugins': [], 'world': {'world_name': 'built'}}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        assert read_pipeline_json(f"{PACKAGE}.pipeline") is None
+        definition = PipelineRegistry().get(f"{PACKAGE}.pipeline")
+    finally:
+        for module_name in list(sys.modules):
+            if module_name.startswith(PACKAGE):
+                del sys.modules[module_name]
+
+    assert definition["world"]["world_name"] == "built"
+
+
+def test_missing_json_definition(tmp_path):
+    assert read_pipeline_json(str(tmp_path / "missing.json")) is None
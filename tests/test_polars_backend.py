@@ -0,0 +1,129 @@
+"""The "polars" backend returns what the "pandas" backend returns."""
+
+import os.path
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("polars")
+
+import bspec
+from bspec.components.pd_input_file_csv.pd_input_file_csv import (
+    PD_Input_File_CSV,
+    read_csv_kwargs,
+)
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_dropna.pd_input_dropna import PD_Input_DropNA
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_dropna.processor import PD_DropNA, dropna_polars
+from bspec.processors.pd_groupby_agg.polars_aggregation import aggregate_polars
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV, read_csv_file
+from bspec.universe.world import World
+
+EXAMPLE_STORES = os.path.join(
+    os.path.dirname(bspec.__file__), "demo_data", "example_stores.csv"
+)
+
+
+def read_both(**properties):
+    csv_kwargs = read_csv_kwargs(
+        PD_Input_File_CSV(filepath_or_buffer=EXAMPLE_STORES, **properties)
+    )
+    pandas_frame, _, _, _ = read_csv_file(csv_kwargs, "pandas")
+    polars_frame, engine, reason, _ = read_csv_file(csv_kwargs, "polars")
+    return pandas_frame, polars_frame, engine, reason
+
+
+def test_read_csv_component_defaults_fall_back_to_pandas():
+    pandas_frame, polars_frame, engine, reason = read_both()
+
+    assert engine != "polars"
+    assert "na_filter=False" in reason
+    pd.testing.assert_frame_equal(polars_frame, pandas_frame)
+
+
+def test_read_csv_parsing_missing_values():
+    pandas_frame, polars_frame, engine, _ = read_both(
+        na_filter=True, keep_default_na=True
+    )
+
+    assert engine == "polars"
+    pd.testing.assert_frame_equal(polars_frame, pandas_frame)
+
+
+def test_read_csv_empty_fields_not_missing_fall_back_to_pandas():
+    pandas_frame, polars_frame, engine, _ = read_both(
+        na_filter=True, keep_default_na=False, na_values=["n/a"]
+    )
+
+    assert engine != "polars"
+    pd.testing.assert_frame_equal(polars_frame, pandas_frame)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_read_and_dropna_world_with_component_defaults(lazy):
+    frames = {}
+    for backend in ("pandas", "polars"):
+        world = World()
+        pd_dataframes = PD_DataFrames(backend=backend)
+        world.create_entity(
+            RuntimeDebugPrint(),
+            PD_Input_File_CSV(filepath_or_buffer=EXAMPLE_STORES),
+            PD_Input_DropNA(),
+            pd_dataframes,
+        )
+        world.add_processor(PD_Read_CSV(lazy=lazy), priority=2)
+        world.add_processor(PD_DropNA(lazy=lazy), priority=1)
+        world.process()
+        frames[backend] = pd_dataframes.dataframe_2
+
+    assert len(frames["pandas"]) == 20
+    pd.testing.assert_frame_equal(frames["polars"], frames["pandas"])
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "store": ["a", "b", "a", None, "b", "c"],
+            "value": [1.0, None, 3.0, 4.0, 5.0, None],
+            "units": [1, 2, 3, 4, 5, 6],
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"axis": 0, "how": "any"},
+        {"axis": 0, "how": "all", "subset": ["store", "value"]},
+        {"axis": 0, "thresh": 3},
+    ],
+)
+def test_dropna(frame, kwargs):
+    pd.testing.assert_frame_equal(dropna_polars(frame, kwargs), frame.dropna(**kwargs))
+
+
+@pytest.mark.parametrize("sort", [False, True])
+@pytest.mark.parametrize(
+    "agg_columns",
+    [
+        {"value": "sum", "units": "max"},
+        {"value": ["mean", "count", "size"], "units": ["first", "last"]},
+    ],
+)
+def test_groupby_agg(frame, sort, agg_columns):
+    result, reason = aggregate_polars(frame, ["store"], agg_columns, sort=sort)
+
+    assert reason == ""
+    pd.testing.assert_frame_equal(
+        result, frame.groupby(["store"], sort=sort).agg(agg_columns)
+    )
+
+
+def test_groupby_agg_of_strings_falls_back(frame):
+    result, reason = aggregate_polars(frame, ["units"], {"store": "sum"})
+
+    assert result is None
+    assert "store" in reason
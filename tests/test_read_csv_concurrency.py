@@ -0,0 +1,192 @@
+"""`PD_Read_CSV` reads entities and files concurrently, with the same result as reading
+them one at a time."""
+
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_file_csv.pd_input_file_csv import (
+    PD_Input_File_CSV,
+    expand_filepaths,
+    has_glob_magic,
+)
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV
+from bspec.universe.executor_service import ExecutorService, pool_size
+from bspec.universe.universe import print_executor_stats
+from bspec.universe.world import World
+
+
+@pytest.fixture
+def csv_paths(tmp_path):
+    paths = []
+    for part in range(3):
+        path = tmp_path / f"stores_{part}.csv"
+        pd.DataFrame(
+            {"id": range(part * 10, part * 10 + 10), "region": ["north", "south"] * 5}
+        ).to_csv(path, index=False)
+        paths.append(str(path))
+    return paths
+
+
+def read(filepaths, **kwargs):
+    world = World()
+    all_pd_dataframes = []
+    for filepath in filepaths:
+        all_pd_dataframes.append(PD_DataFrames())
+        world.create_entity(
+            RuntimeDebugPrint(),
+            PD_Input_File_CSV(filepath_or_buffer=filepath),
+            all_pd_dataframes[-1],
+        )
+    world.add_processor(PD_Read_CSV(**kwargs))
+    world.process()
+    return [pd_dataframes.dataframe_1 for pd_dataframes in all_pd_dataframes]
+
+
+def test_entities_read_concurrently_match_a_serial_read(csv_paths):
+    for concurrent, serial in zip(read(csv_paths, max_workers=3), read(csv_paths)):
+        pd.testing.assert_frame_equal(concurrent, serial)
+
+
+def test_files_of_a_glob_are_concatenated_in_order(csv_paths, tmp_path):
+    world = World()
+    pd_dataframes = PD_DataFrames()
+    ent = world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(
+            filepath_or_buffer=str(tmp_path / "stores_*.csv"), file_workers=3
+        ),
+        pd_dataframes,
+    )
+    processor = PD_Read_CSV()
+    world.add_processor(processor)
+    world.process()
+
+    pd.testing.assert_frame_equal(
+        pd_dataframes.dataframe_1,
+        pd.concat([pd.read_csv(path) for path in csv_paths], ignore_index=True),
+    )
+    assert [filepath for filepath, _, _ in processor.file_timings[ent]] == csv_paths
+
+
+def test_expand_filepaths(csv_paths, tmp_path):
+    assert has_glob_magic("stores_[0-9].csv")
+    assert not has_glob_magic("stores.csv")
+
+    assert expand_filepaths(csv_paths[0]) is None
+    assert expand_filepaths("https://example.com/stores_*.csv") is None
+    assert expand_filepaths([str(tmp_path / "stores_?.csv"), csv_paths[0]]) == (
+        csv_paths + csv_paths[:1]
+    )
+    with pytest.raises(FileNotFoundError, match="No files match"):
+        expand_filepaths(str(tmp_path / "sales_*.csv"))
+
+
+def test_failed_read_names_the_entity(csv_paths, tmp_path):
+    world = World()
+    good, bad = PD_DataFrames(), PD_DataFrames()
+    world.create_entity(
+        RuntimeDebugPrint(), PD_Input_File_CSV(filepath_or_buffer=csv_paths[0]), good
+    )
+    missing = world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(filepath_or_buffer=str(tmp_path / "missing.csv")),
+        bad,
+    )
+    world.add_processor(PD_Read_CSV(max_workers=2))
+
+    with pytest.raises(RuntimeError, match=f"failed to read entity {missing}"):
+        world.process()
+    # the other reads run to the end
+    pd.testing.assert_frame_equal(good.dataframe_1, pd.read_csv(csv_paths[0]))
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError, match="positive integer"):
+        PD_Read_CSV(max_workers=0)
+
+
+def test_entities_read_on_a_shared_pool(csv_paths):
+    with ExecutorService({"io": {"executor": "thread", "max_workers": 2}}) as service:
+        frames = read(csv_paths, executor_service=service, pool="io")
+        stats = service.stats()["io"]
+
+    for frame, path in zip(frames, csv_paths):
+        pd.testing.assert_frame_equal(frame, pd.read_csv(path))
+    assert stats["max_workers"] == 2
+    assert stats["submitted"] == stats["completed"] == 3
+    assert stats["queued"] == stats["running"] == 0
+
+
+def test_files_read_on_the_shared_pools(csv_paths, tmp_path):
+    pattern = str(tmp_path / "stores_*.csv")
+    expected = pd.concat([pd.read_csv(path) for path in csv_paths], ignore_index=True)
+
+    with ExecutorService({"thread": {"max_workers": 1}}) as service:
+        (frame,) = read([pattern], executor_service=service)
+        pd.testing.assert_frame_equal(frame, expected)
+        assert service.stats()["thread"]["submitted"] == 3
+
+        # a single worker reading the entity reads its files itself, rather than
+        # waiting on the files queued behind it
+        (frame,) = read([pattern], executor_service=service, pool="thread")
+        pd.testing.assert_frame_equal(frame, expected)
+        assert service.stats()["thread"]["submitted"] == 3 + 1
+
+
+def test_private_file_pool_is_reused(csv_paths, tmp_path):
+    world = World()
+    world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(filepath_or_buffer=str(tmp_path / "stores_*.csv")),
+        PD_DataFrames(),
+    )
+    processor = PD_Read_CSV()
+    world.add_processor(processor)
+
+    world.process()
+    (executor,) = processor._file_executors.values()
+    world.process()
+
+    assert list(processor._file_executors.values()) == [executor]
+    executor.shutdown()
+
+
+def test_entities_can_not_be_read_on_a_process_pool():
+    with pytest.raises(ValueError, match="`thread` pool"):
+        PD_Read_CSV(executor_service=ExecutorService(), pool="process")
+
+
+@pytest.mark.parametrize("argument", ["pool", "file_pool"])
+def test_pools_need_an_executor_service(argument):
+    with pytest.raises(ValueError, match=f"`{argument}` needs the `executor_service`"):
+        PD_Read_CSV(**{argument: "thread"})
+
+
+def test_pools_are_created_on_first_use(capsys):
+    service = ExecutorService()
+
+    assert service.pools == {} and service.stats() == {}
+    print_executor_stats(service)
+    assert capsys.readouterr().out == ""
+
+    service.pool("thread").submit(sum, [1, 2]).result()
+    assert list(service.pools) == ["thread"]
+    assert list(service.stats()) == ["thread"]
+    service.shutdown()
+
+    with pytest.raises(KeyError, match="Unknown pool: `io`"):
+        service.pool("io")
+    with pytest.raises(ValueError, match="Unknown executor of pool `io`"):
+        ExecutorService({"io": {"executor": "fiber"}})
+
+
+def test_pool_size(monkeypatch):
+    monkeypatch.setattr("bspec.universe.executor_service.available_cpus", lambda: 4)
+
+    assert pool_size("thread") == 8
+    assert pool_size("thread", max_workers=16) == 16
+    assert pool_size("process") == 4
+    assert pool_size("process", max_workers=16) == 4
+    assert pool_size("process", max_workers=0) == 1
@@ -0,0 +1,51 @@
+"""`PD_Read_Parquet` reads what `pandas.read_parquet` reads."""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_file_parquet.pd_input_file_parquet import (
+    PD_Input_File_Parquet,
+)
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_read_parquet.processor import PD_Read_Parquet
+from bspec.universe.world import World
+
+
+@pytest.mark.parametrize(
+    "properties",
+    [
+        {},
+        {"columns": ["value"]},
+        {"filters": [["region", "==", "north"]], "memory_map": True},
+    ],
+)
+def test_read_parquet(tmp_path, properties):
+    path = str(tmp_path / "stores.parquet")
+    pd.DataFrame(
+        {"region": ["north", "south", "north"], "value": [1.0, None, 3.0]},
+        index=pd.Index([10, 11, 12], name="store"),
+    ).to_parquet(path)
+
+    world = World()
+    pd_dataframes = PD_DataFrames()
+    world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_Parquet(path=path, **properties),
+        pd_dataframes,
+    )
+    world.add_processor(PD_Read_Parquet())
+    world.process()
+
+    pd.testing.assert_frame_equal(
+        pd_dataframes.dataframe_1,
+        pd.read_parquet(
+            path,
+            engine="pyarrow",
+            columns=properties.get("columns"),
+            filters=[tuple(predicate) for predicate in properties.get("filters", [])]
+            or None,
+        ),
+    )
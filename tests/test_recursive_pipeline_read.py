@@ -0,0 +1,127 @@
+"""Pipelines expand once per distinct pipeline, with the overrides of each instance,
+into a new galaxy config."""
+
+import json
+
+import pytest
+
+from bspec.pipelines import recursive_pipeline_read as pipeline_module
+from bspec.pipelines.recursive_pipeline_read import recursive_pipeline_read
+
+
+def write_json(path, data):
+    with open(path, "w") as file:
+        json.dump(data, file)
+    return str(path)
+
+
+@pytest.fixture
+def pipelines(tmp_path):
+    read = write_json(
+        tmp_path / "read.json",
+        {
+            "processor_plugins": ["bspec.processors.pd_read_csv.processor"],
+            "world": {
+                "world_name": "read",
+                "processors": [{"processor_name": "pd_read_csv", "priority": 1}],
+                "entities": [
+                    {"id": "stores", "components": [{"component_name": "a"}]},
+                    {"id": "sales", "components": [{"component_name": "b"}]},
+                ],
+            },
+        },
+    )
+    clean = write_json(
+        tmp_path / "clean.json",
+        {
+            "processor_plugins": ["bspec.processors.pd_dropna.processor"],
+            "pipelines": [{"pipeline": read, "world_name": "clean_read"}],
+            "world": {
+                "world_name": "clean",
+                "processors": [{"processor_name": "pd_dropna", "priority": 1}],
+                "entities": [],
+            },
+        },
+    )
+    return {"read": read, "clean": clean}
+
+
+def test_instances_override_entities_and_world_names(pipelines):
+    returned_val = recursive_pipeline_read(
+        data={
+            "pipelines": [
+                {
+                    "pipeline": pipelines["read"],
+                    "world_name": "read_north",
+                    "entities": [
+                        {"id": "stores", "components": [{"component_name": "c"}]},
+                        {"id": "stores", "components": [{"component_name": "d"}]},
+                    ],
+                },
+                {"pipeline": pipelines["read"]},
+            ]
+        },
+        processor_plugins=set(),
+        galaxy_config=[],
+    )
+
+    north, default = returned_val["galaxy_config"]
+    assert north["world_name"] == "read_north"
+    assert default["world_name"] == "read"
+    # the first override of an id wins, and entities not overridden are shared
+    assert north["entities"][0]["components"][0]["component_name"] == "c"
+    assert north["entities"][1] is default["entities"][1]
+    assert default["entities"][0]["components"][0]["component_name"] == "a"
+    assert list(north["processor_plugins"]) == [
+        "bspec.processors.pd_read_csv.processor"
+    ]
+    assert returned_val["all_processor_plugins"] == {
+        "bspec.processors.pd_read_csv.processor"
+    }
+
+
+def test_each_pipeline_is_compiled_once_per_expansion(pipelines, monkeypatch):
+    compiled = []
+    compile_pipeline = pipeline_module.compile_pipeline
+
+    def counted(pipeline_module_name, *args):
+        compiled.append(pipeline_module_name)
+        return compile_pipeline(pipeline_module_name, *args)
+
+    monkeypatch.setattr(pipeline_module, "compile_pipeline", counted)
+    data = {
+        "pipelines": [{"pipeline": pipelines["read"]}] * 50
+        + [{"pipeline": pipelines["clean"]}] * 50
+    }
+
+    returned_val = recursive_pipeline_read(
+        data=data, processor_plugins=set(), galaxy_config=[]
+    )
+
+    assert sorted(compiled) == sorted(pipelines.values())
+    assert len(returned_val["galaxy_config"]) == 50 + 50 * 2
+    assert returned_val["all_processor_plugins"] == {
+        "bspec.processors.pd_read_csv.processor",
+        "bspec.processors.pd_dropna.processor",
+    }
+
+    recursive_pipeline_read(data=data, processor_plugins=set(), galaxy_config=[])
+    assert len(compiled) == 4
+
+
+def test_galaxy_config_is_left_unchanged(pipelines):
+    world = {"world_name": "main", "processors": [], "entities": []}
+    galaxy_config = [world]
+
+    returned_val = recursive_pipeline_read(
+        data={"pipelines": [{"pipeline": pipelines["clean"]}]},
+        processor_plugins=set(),
+        galaxy_config=galaxy_config,
+    )
+
+    assert galaxy_config == [world]
+    assert [world["world_name"] for world in returned_val["galaxy_config"]] == [
+        "main",
+        "clean_read",
+        "clean",
+    ]
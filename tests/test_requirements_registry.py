@@ -0,0 +1,99 @@
+"""The requirements registry reads each requirements file once, and installs whatever
+is missing for a set of plugins with a single pip call, without importing them."""
+
+import subprocess
+import sys
+
+import pytest
+
+from bspec.common_core import requirements_registry as registry_module
+from bspec.common_core.requirements_registry import RequirementsRegistry, import_name
+
+PACKAGE = "bspec_required_plugins"
+
+
+@pytest.fixture
+def plugins(tmp_path, monkeypatch):
+    package = tmp_path / PACKAGE
+    for plugin_name, requirements in {
+        "stores": "pandas==1.5.3\nbspec-missing-package==1.0\n",
+        "sales": "pandas\nbspec_other_missing\n",
+    }.items():
+        plugin = package / plugin_name
+        (plugin / "requirements").mkdir(parents=True)
+        (plugin / "__init__.py").write_text("")
+        (plugin / "processor.py").write_text("raise ImportError('not imported')\n")
+        (plugin / "requirements" / "module_requirements.txt").write_text(requirements)
+    (package / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield [f"{PACKAGE}.stores.processor", f"{PACKAGE}.sales.processor"]
+    for module_name in list(sys.modules):
+        if module_name.startswith(PACKAGE):
+            del sys.modules[module_name]
+
+
+@pytest.fixture
+def pip_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        registry_module.subprocess, "check_call", lambda command: calls.append(command)
+    )
+    return calls
+
+
+def test_import_name():
+    assert import_name("dash-bootstrap-components") == "dash_bootstrap_components"
+    assert import_name("PyYAML") == "yaml"
+
+
+def test_requirements_files_are_read_once(tmp_path):
+    path = tmp_path / "module_requirements.txt"
+    path.write_text("pandas==1.5.3\n")
+    registry = RequirementsRegistry()
+
+    first = registry.read(str(path))
+    path.write_text("pandas==2.0.0\n")
+
+    assert registry.read(str(path)) is first
+    assert first == {"pandas": "1.5.3"}
+
+
+def test_preflight_installs_every_missing_requirement_at_once(plugins, pip_calls):
+    registry = RequirementsRegistry()
+
+    # pinned versions win over unpinned ones of the same package
+    assert registry.plugin_requirements(plugins) == {
+        "pandas": "1.5.3",
+        "bspec-missing-package": "1.0",
+        "bspec_other_missing": None,
+    }
+    installed = registry.preflight(plugins)
+
+    assert installed == {"bspec-missing-package": "1.0", "bspec_other_missing": None}
+    assert pip_calls == [
+        [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "bspec-missing-package==1.0",
+            "bspec_other_missing",
+        ]
+    ]
+    assert not any(
+        name.endswith(".processor") for name in sys.modules if PACKAGE in name
+    )
+
+    # installed requirements are not looked up, nor installed, again
+    assert registry.preflight(plugins) == {}
+    assert len(pip_calls) == 1
+
+
+def test_failed_install_names_the_pip_command(plugins, monkeypatch):
+    def fail(command):
+        raise subprocess.CalledProcessError(1, command)
+
+    monkeypatch.setattr(registry_module.subprocess, "check_call", fail)
+
+    with pytest.raises(ImportError, match="pip install bspec-missing-package==1.0"):
+        RequirementsRegistry().preflight(plugins)
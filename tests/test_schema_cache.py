@@ -0,0 +1,74 @@
+"""A read with a cached schema returns the same dataframe as the read that inferred it."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV
+from bspec.processors.pd_read_csv.schema_cache import apply_schema, schema_cache
+from bspec.universe.world import World
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "stores.csv"
+    path.write_text(
+        "name,when,sales\n"
+        "a,2023-01-01,1.5\n"
+        ",2023-01-02,2.5\n"
+        "c,2023-01-03,\n"
+        "NA,2023-01-04,4.5\n"
+    )
+    return str(path)
+
+
+def read(csv_path, schema_cache_path, **properties):
+    world = World()
+    pd_dataframes = PD_DataFrames()
+    ent = world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(
+            filepath_or_buffer=csv_path, schema_cache=schema_cache_path, **properties
+        ),
+        pd_dataframes,
+    )
+    processor = PD_Read_CSV()
+    world.add_processor(processor)
+    world.process()
+    return pd_dataframes.dataframe_1, processor.selected_engines[ent][0]
+
+
+@pytest.mark.parametrize(
+    "properties",
+    [{"na_filter": True, "keep_default_na": True}, {}],
+    ids=["missing-values", "defaults"],
+)
+def test_cached_schema_reads_the_same_dataframe(csv_path, tmp_path, properties):
+    schema_cache_path = str(tmp_path / "schemas.json")
+    cache = schema_cache(schema_cache_path)
+
+    miss, miss_engine = read(csv_path, schema_cache_path, **properties)
+    hit, hit_engine = read(csv_path, schema_cache_path, **properties)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert hit_engine == miss_engine
+    pd.testing.assert_frame_equal(hit, miss)
+    with open(schema_cache_path) as file:
+        (entry,) = json.load(file).values()
+    assert entry["engine"] == miss_engine
+
+
+def test_apply_schema_pins_the_engine_it_supports():
+    schema = {"dtype": {"name": "object"}, "parse_dates": [], "categorical": []}
+
+    assert apply_schema({"engine": "auto"}, schema, engine="c")["engine"] == "c"
+    assert apply_schema({"engine": "python"}, schema, engine="c")["engine"] == "python"
+    # the pyarrow engine can not read in chunks
+    chunked = apply_schema({"engine": "auto", "chunksize": 2}, schema, engine="pyarrow")
+    assert chunked["engine"] == "auto"
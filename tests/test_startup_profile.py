@@ -0,0 +1,87 @@
+"""The startup profiler records the cost of every plugin import and `register()` call."""
+
+import json
+import sys
+
+import pytest
+
+from bspec.plugin_core import loader as plugins_loader
+from bspec.plugin_core.import_profiler import ImportProfiler
+from bspec.universe import universe
+
+PACKAGE = "bspec_profiled_plugins"
+
+
+@pytest.fixture
+def plugins(tmp_path, monkeypatch):
+    package = tmp_path / PACKAGE
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "helper.py").write_text("TABLE = list(range(100000))\n")
+    (package / "stores.py").write_text(
+        f"from {PACKAGE} import helper\n\ndef register():\n    pass\n"
+    )
+    (package / "sales.py").write_text("def register():\n    pass\n")
+    (package / "broken.py").write_text(
+        "def register():\n    raise RuntimeError('no factory')\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package
+    for module_name in list(sys.modules):
+        if module_name.startswith(PACKAGE):
+            del sys.modules[module_name]
+
+
+def test_profiler_records_every_stage(plugins):
+    profiler = ImportProfiler(trace_memory=True)
+    try:
+        plugins_loader.load_plugins(
+            [f"{PACKAGE}.stores", f"{PACKAGE}.broken"], profiler=profiler
+        )
+    finally:
+        profiler.stop()
+
+    records = {
+        (record["plugin_name"], record["stage"]): record for record in profiler.report()
+    }
+    assert set(records) == {
+        (f"{PACKAGE}.stores", "import"),
+        (f"{PACKAGE}.stores", "register"),
+        (f"{PACKAGE}.broken", "import"),
+        (f"{PACKAGE}.broken", "register"),
+    }
+    stores = records[(f"{PACKAGE}.stores", "import")]
+    assert f"{PACKAGE}.helper" in stores["imported_modules"]
+    assert stores["memory_bytes"] > 0
+    assert "no factory" in records[(f"{PACKAGE}.broken", "register")]["error"]
+    report = profiler.report(sort_by="peak_memory_bytes")
+    assert report[0]["plugin_name"] == f"{PACKAGE}.stores"
+
+
+def test_startup_profile_covers_the_starting_worlds(plugins, empty_galaxy, tmp_path):
+    path = str(tmp_path / "startup_profile.json")
+
+    universe.create_galaxy(
+        {
+            "processor_plugins": [],
+            "starting_world": "stores",
+            "galaxy": [
+                {
+                    "world_name": world_name,
+                    "processor_plugins": [f"{PACKAGE}.{world_name}"],
+                    "processors": [],
+                    "entities": [],
+                }
+                for world_name in ("stores", "sales")
+            ],
+            "startup_profile": {"format": "json", "path": path, "trace_memory": False},
+        }
+    )
+
+    with open(path) as file:
+        report = json.load(file)
+    # the deferred world is not created, so its plugin is not imported
+    assert {record["plugin_name"] for record in report} == {f"{PACKAGE}.stores"}
+    assert {record["stage"] for record in report} == {"import", "register"}
+    assert all(record["memory_bytes"] == 0 for record in report)
+    assert f"{PACKAGE}.sales" not in sys.modules
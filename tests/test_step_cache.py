@@ -0,0 +1,172 @@
+"""The step cache reuses a step only while everything that changes its result is
+unchanged."""
+
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_dataframe.step_cache import StepCache, run_step, step_cache
+from bspec.components.pd_input_dropna.pd_input_dropna import PD_Input_DropNA
+from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_dropna.processor import PD_DropNA
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV
+from bspec.universe.world import World
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "stores.csv"
+    pd.DataFrame(
+        {
+            "region": ["north", "south"] * 50,
+            "value": [float(value) if value % 7 else None for value in range(100)],
+        }
+    ).to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def step_cache_config(tmp_path):
+    return {"path": str(tmp_path / "step_cache")}
+
+
+def run(step_cache_config, pd_input_file_csv, dropna=False):
+    world = World()
+    pd_dataframes = PD_DataFrames()
+    components = [RuntimeDebugPrint(), pd_input_file_csv, pd_dataframes]
+    if dropna:
+        components.append(PD_Input_DropNA())
+        world.add_processor(PD_DropNA(step_cache=step_cache_config), priority=1)
+    world.create_entity(*components)
+    processor = PD_Read_CSV(step_cache=step_cache_config)
+    world.add_processor(processor, priority=2)
+    world.process()
+    return pd_dataframes, processor.step_cache
+
+
+def test_step_cache_hit_returns_the_same_dataframe(csv_path, step_cache_config):
+    first, cache = run(
+        step_cache_config, PD_Input_File_CSV(filepath_or_buffer=csv_path)
+    )
+    hits = cache.hits
+    second, _ = run(step_cache_config, PD_Input_File_CSV(filepath_or_buffer=csv_path))
+
+    assert isinstance(cache, StepCache)
+    assert cache.hits == hits + 1
+    pd.testing.assert_frame_equal(second.dataframe_1, first.dataframe_1)
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        {"usecols": ["region"]},
+        {"engine": "python"},
+        {"schema_cache": True},
+        {"schema_cache": True, "schema_categories": True},
+        {"incremental": True},
+    ],
+)
+def test_read_step_key_covers_every_result_field(csv_path, changed):
+    processor = PD_Read_CSV(step_cache={"path": "unused"})
+    unchanged = PD_Input_File_CSV(filepath_or_buffer=csv_path)
+
+    assert processor.read_step_key(
+        PD_Input_File_CSV(filepath_or_buffer=csv_path, **changed)
+    ) != processor.read_step_key(unchanged)
+    assert processor.read_step_key(unchanged, "polars") != processor.read_step_key(
+        unchanged
+    )
+
+
+def test_read_step_key_ignores_how_the_files_are_read(csv_path):
+    processor = PD_Read_CSV(step_cache={"path": "unused"})
+
+    assert processor.read_step_key(
+        PD_Input_File_CSV(
+            filepath_or_buffer=csv_path, file_workers=4, show_progress=True
+        )
+    ) == processor.read_step_key(PD_Input_File_CSV(filepath_or_buffer=csv_path))
+
+
+def test_toggling_schema_categories_reads_again(csv_path, step_cache_config, tmp_path):
+    schema_cache = str(tmp_path / "schemas.json")
+    run(
+        step_cache_config,
+        PD_Input_File_CSV(filepath_or_buffer=csv_path, schema_cache=schema_cache),
+    )
+    pd_dataframes, _ = run(
+        step_cache_config,
+        PD_Input_File_CSV(
+            filepath_or_buffer=csv_path,
+            schema_cache=schema_cache,
+            schema_categories=True,
+        ),
+    )
+
+    assert isinstance(pd_dataframes.dataframe_1["region"].dtype, pd.CategoricalDtype)
+
+
+def test_changed_file_invalidates_the_read_and_the_steps_after_it(
+    csv_path, step_cache_config
+):
+    properties = {"na_filter": True, "keep_default_na": True}
+    first, _ = run(
+        step_cache_config,
+        PD_Input_File_CSV(filepath_or_buffer=csv_path, **properties),
+        dropna=True,
+    )
+    with open(csv_path, "a") as file:
+        file.write("east,1000.0\n")
+    second, _ = run(
+        step_cache_config,
+        PD_Input_File_CSV(filepath_or_buffer=csv_path, **properties),
+        dropna=True,
+    )
+
+    assert len(second.dataframe_1) == len(first.dataframe_1) + 1
+    assert len(second.dataframe_2) == len(first.dataframe_2) + 1
+    assert second.dataframe_2["value"].iloc[-1] == 1000.0
+
+
+def test_hits_can_be_written_in_place(tmp_path, step_cache_config):
+    csv_path = str(tmp_path / "ids.csv")
+    pd.DataFrame({"id": range(10)}).to_csv(csv_path, index=False)
+    run(step_cache_config, PD_Input_File_CSV(filepath_or_buffer=csv_path))
+    second, cache = run(
+        step_cache_config, PD_Input_File_CSV(filepath_or_buffer=csv_path)
+    )
+    assert cache.hits == 1
+
+    second.dataframe_1.loc[0, "id"] = -1
+    second.dataframe_1["id"].to_numpy()[1] = -2
+
+    assert second.dataframe_1["id"].iloc[:2].tolist() == [-1, -2]
+
+
+def test_zero_copy_hits_are_read_only_views(tmp_path):
+    cache = step_cache({"path": str(tmp_path / "step_cache"), "zero_copy": True})
+    cache.put("stores", {"dataframe_1": pd.DataFrame({"id": range(10)})})
+
+    frame = cache.get("stores")["dataframe_1"]
+
+    assert not frame["id"].to_numpy().flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        frame.loc[0, "id"] = -1
+    with pytest.raises(ValueError, match="zero_copy"):
+        step_cache({"path": str(tmp_path / "step_cache")})
+
+
+def test_entry_of_other_slots_is_a_miss(tmp_path):
+    cache = StepCache(str(tmp_path / "step_cache"))
+    cache.put("stores", {"dataframe_1": pd.DataFrame({"id": range(10)})})
+    pd_dataframes = PD_DataFrames()
+
+    def compute():
+        pd_dataframes.dataframe_2 = pd.DataFrame({"id": range(5)})
+
+    assert not run_step(cache, "stores", pd_dataframes, ["dataframe_2"], compute)
+    assert (cache.hits, cache.misses) == (0, 1)
+    # the stale entry was replaced by the slots the step writes now
+    assert run_step(cache, "stores", pd_dataframes, ["dataframe_2"], compute)
+    assert cache.hits == 1
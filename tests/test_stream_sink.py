@@ -0,0 +1,59 @@
+"""`PD_Sink_Stream` keeps memory bounded by the chunk size unless asked to collect."""
+
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
+from bspec.components.pd_stream_sink.pd_stream_sink import PD_Stream_Sink
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV
+from bspec.processors.pd_stream_sink.processor import PD_Sink_Stream
+from bspec.universe.world import World
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "stores.csv"
+    pd.DataFrame({"id": range(100), "value": range(100, 200)}).to_csv(path, index=False)
+    return str(path)
+
+
+def stream(csv_path, pd_stream_sink):
+    world = World()
+    pd_dataframes = PD_DataFrames()
+    world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(filepath_or_buffer=csv_path, chunksize=30),
+        pd_stream_sink,
+        pd_dataframes,
+    )
+    world.add_processor(PD_Read_CSV(), priority=2)
+    world.add_processor(PD_Sink_Stream(), priority=1)
+    chunks_held = []
+    world.process()
+    while world.pending():
+        chunks_held.append(len(pd_stream_sink.chunks))
+        world.process()
+    return pd_dataframes, chunks_held
+
+
+def test_chunks_are_dropped_by_default(csv_path, tmp_path):
+    to_csv_path = str(tmp_path / "out.csv")
+    pd_dataframes, chunks_held = stream(
+        csv_path, PD_Stream_Sink(source="dataframe_1", to_csv_path=to_csv_path)
+    )
+
+    assert set(chunks_held) == {0}
+    assert pd_dataframes.dataframe_3.empty
+    pd.testing.assert_frame_equal(pd.read_csv(to_csv_path), pd.read_csv(csv_path))
+
+
+def test_target_collects_every_chunk(csv_path):
+    pd_dataframes, _ = stream(
+        csv_path, PD_Stream_Sink(source="dataframe_1", target="dataframe_3")
+    )
+
+    pd.testing.assert_frame_equal(
+        pd_dataframes.dataframe_3.reset_index(drop=True), pd.read_csv(csv_path)
+    )
@@ -0,0 +1,147 @@
+"""An incremental read parses only the complete lines appended since the last read, and
+reads the whole file again once it is truncated, rotated or rewritten."""
+
+import os
+
+import pandas as pd
+import pytest
+
+from bspec.components.pd_dataframe.pd_dataframes import PD_DataFrames
+from bspec.components.pd_input_file_csv.pd_input_file_csv import PD_Input_File_CSV
+from bspec.components.runtime_debug_print.runtime_debug_print import RuntimeDebugPrint
+from bspec.processors.pd_read_csv.processor import PD_Read_CSV
+from bspec.processors.pd_read_csv.tail_read import read_tail, tailable
+from bspec.universe.world import World
+
+HEADER = "id,region\n"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(HEADER + "1,north\n2,south\n")
+    return str(path)
+
+
+class Reader:
+    """Reads a file incrementally, counting the rows `read_csv` parsed."""
+
+    def __init__(self, csv_path):
+        self.read_csv_kwargs = {"filepath_or_buffer": csv_path}
+        self.state = None
+        self.parsed = 0
+
+    def read(self, read_csv_kwargs):
+        frame = pd.read_csv(**read_csv_kwargs)
+        self.parsed += len(frame)
+        return frame
+
+    def __call__(self):
+        self.state, rows, reason = read_tail(
+            self.read_csv_kwargs, self.state, self.read
+        )
+        return rows, reason
+
+
+def append(csv_path, text):
+    with open(csv_path, "a") as file:
+        file.write(text)
+
+
+def test_appended_lines_are_parsed_on_their_own(csv_path):
+    reader = Reader(csv_path)
+    assert reader() == (2, "first read")
+
+    append(csv_path, "3,east\n4,west\n")
+
+    assert reader() == (2, "")
+    assert reader.parsed == 4
+    assert reader.state.frame["id"].tolist() == [1, 2, 3, 4]
+    assert reader.state.frame["id"].dtype == "int64"
+    assert reader() == (0, "")
+
+
+def test_partial_last_line_waits_for_its_newline(csv_path):
+    reader = Reader(csv_path)
+    reader()
+
+    append(csv_path, "3,ea")
+    assert reader() == (0, "")
+
+    append(csv_path, "st\n")
+    assert reader() == (1, "")
+    assert reader.state.frame["region"].tolist() == ["north", "south", "east"]
+
+
+def test_truncated_file_is_read_again(csv_path):
+    reader = Reader(csv_path)
+    reader()
+
+    with open(csv_path, "w") as file:
+        file.write(HEADER + "9,east\n")
+
+    assert reader() == (1, "truncated")
+    assert reader.state.frame["id"].tolist() == [9]
+
+
+def test_rotated_file_is_read_again(csv_path):
+    reader = Reader(csv_path)
+    reader()
+
+    # the rotated file is kept, so the new file can not reuse its inode
+    os.rename(csv_path, csv_path + ".1")
+    with open(csv_path, "w") as file:
+        file.write(HEADER + "9,east\n10,west\n11,north\n")
+
+    assert reader() == (3, "rotated")
+    assert reader.state.frame["id"].tolist() == [9, 10, 11]
+
+
+def test_rewritten_file_is_read_again(csv_path):
+    reader = Reader(csv_path)
+    reader()
+
+    with open(csv_path, "r+") as file:
+        file.seek(len(HEADER))
+        file.write("7")
+    append(csv_path, "3,east\n")
+
+    assert reader() == (3, "rewritten")
+    assert reader.state.frame["id"].tolist() == [7, 2, 3]
+
+
+def test_incomplete_header_is_not_read(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text("id,reg")
+    reader = Reader(str(path))
+
+    assert reader() == (0, "first read")
+    assert reader.state is None
+
+
+def test_tailable(csv_path, tmp_path):
+    assert tailable({"filepath_or_buffer": csv_path})
+    assert not tailable({"filepath_or_buffer": csv_path, "skiprows": 1})
+    assert not tailable({"filepath_or_buffer": csv_path, "chunksize": 10})
+    compressed = tmp_path / "events.csv.gz"
+    compressed.write_bytes(b"")
+    assert not tailable({"filepath_or_buffer": str(compressed)})
+
+
+def test_incremental_reads_append_to_dataframe_1(csv_path):
+    world = World()
+    pd_dataframes = PD_DataFrames()
+    ent = world.create_entity(
+        RuntimeDebugPrint(),
+        PD_Input_File_CSV(filepath_or_buffer=csv_path, incremental=True),
+        pd_dataframes,
+    )
+    processor = PD_Read_CSV()
+    world.add_processor(processor)
+
+    world.process()
+    append(csv_path, "3,east\n")
+    world.process()
+
+    assert processor.tail_reads[ent] == (1, "")
+    pd.testing.assert_frame_equal(pd_dataframes.dataframe_1, pd.read_csv(csv_path))
@@ -0,0 +1,145 @@
+"""`TickLoop` runs ticks on a fixed timeline, and worlds defer their low priority
+processors once the tick budget is spent."""
+
+import time
+
+import esper
+import pytest
+
+from bspec.universe import universe
+from bspec.universe.galaxy_scheduler import GalaxyScheduler
+from bspec.universe.tick_loop import TickLoop
+from bspec.universe.world import World
+
+
+class Record(esper.Processor):
+    def __init__(self, name, processed):
+        super().__init__()
+        self.name = name
+        self.processed = processed
+
+    def process(self):
+        self.processed.append(self.name)
+
+
+class Busy(esper.Processor):
+    def __init__(self, clock, seconds):
+        super().__init__()
+        self.clock = clock
+        self.seconds = seconds
+
+    def process(self):
+        self.clock.now += self.seconds
+
+
+class FakeClock:
+    def __init__(self, oversleep=0.0):
+        self.now = 0.0
+        self.oversleep = oversleep
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds + self.oversleep
+
+
+def run(world, clock, **kwargs):
+    with GalaxyScheduler({"stores": world}, dependencies={}) as scheduler:
+        return TickLoop(
+            scheduler, ["stores"], clock=clock, sleep=clock.sleep, **kwargs
+        ).run()
+
+
+def test_processors_past_the_deadline_are_deferred_for_one_tick():
+    processed = []
+    world = World(deferrable_priority=1)
+    world.add_processor(Record("read", processed), priority=2)
+    world.add_processor(Record("report", processed), priority=1)
+    world.add_processor(Record("log", processed), priority=0)
+    world.deadline = time.perf_counter() - 1
+
+    world.process()
+    assert processed == ["read"]
+    assert [processor.name for processor in world.deferred] == ["report", "log"]
+
+    # a processor deferred on the last tick always runs, so it can not be starved
+    world.process()
+    assert processed == ["read", "read", "report", "log"]
+    assert world.deferred == []
+
+    world.deadline = None
+    world.process()
+    assert processed[4:] == ["read", "report", "log"]
+
+
+def test_tick_loop_hands_the_deadline_to_the_worlds():
+    processed = []
+    world = World(deferrable_priority=0)
+    world.add_processor(Record("read", processed), priority=1)
+    world.add_processor(Record("log", processed), priority=0)
+
+    # with no budget, the deadline has passed by the time a processor is reached
+    with GalaxyScheduler({"stores": world}, dependencies={}) as scheduler:
+        stats = TickLoop(
+            scheduler,
+            ["stores"],
+            rate=1000,
+            budget_ms=0,
+            max_ticks=2,
+            sleep=lambda seconds: None,
+        ).run()
+
+    assert world.deadline is not None
+    assert stats.ticks == 2
+    assert stats.missed_deadlines == 2
+    assert stats.deferred_processors == 1
+    assert processed == ["read", "read", "log"]
+
+
+def test_overrun_slots_are_skipped():
+    clock = FakeClock()
+    world = World()
+    world.add_processor(Busy(clock, seconds=0.25), priority=1)
+
+    stats = run(world, clock, rate=10, max_ticks=2)
+
+    # every tick takes 2.5 periods, so the next tick starts on the following slot
+    assert stats.ticks == 2
+    assert stats.skipped_ticks == 4
+    assert stats.missed_deadlines == 2
+    assert stats.max_tick_ms == pytest.approx(250)
+    assert clock.sleeps == [pytest.approx(0.05)]
+    assert stats.max_jitter_ms == pytest.approx(0)
+
+
+def test_late_wake_ups_are_recorded_as_jitter():
+    clock = FakeClock(oversleep=0.01)
+
+    stats = run(World(), clock, rate=10, max_ticks=3)
+
+    assert stats.skipped_ticks == 0
+    assert stats.missed_deadlines == 0
+    assert stats.max_jitter_ms == pytest.approx(10)
+    assert stats.mean_jitter_ms == pytest.approx(20 / 3)
+    assert clock.sleeps == [pytest.approx(0.1), pytest.approx(0.09)]
+
+
+def test_rate_has_to_be_positive():
+    with pytest.raises(ValueError, match="greater than 0"):
+        TickLoop(GalaxyScheduler({}, dependencies={}), [], rate=0)
+
+
+def test_universe_runs_the_tick_loop(empty_galaxy):
+    stats = universe.universe(
+        {
+            "processor_plugins": [],
+            "starting_world": "stores",
+            "galaxy": [{"world_name": "stores", "processors": [], "entities": []}],
+            "tick_loop": {"rate": 1000, "budget_ms": 5, "max_ticks": 3},
+        }
+    )
+
+    assert stats.ticks == 3
@@ -0,0 +1,117 @@
+"""Timed worlds record every tick to a `TimingCollector`, exported as JSON lines and in
+the Prometheus text format."""
+
+import json
+import urllib.request
+
+import esper
+import pytest
+
+from bspec.universe import universe
+from bspec.universe.timing import TimingCollector, TimingExporter, TimingHistogram
+from bspec.universe.world import World
+
+
+class Read(esper.Processor):
+    def process(self):
+        pass
+
+
+def test_histogram_quantiles_use_the_recent_window():
+    histogram = TimingHistogram(window=100)
+    for value in range(1, 201):
+        histogram.record(float(value))
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 200
+    assert summary["sum"] == sum(range(1, 201))
+    assert (summary["min"], summary["max"]) == (1.0, 200.0)
+    assert (summary["p50"], summary["p95"], summary["p99"]) == (150.0, 195.0, 199.0)
+
+
+def test_timed_world_records_every_tick():
+    collector = TimingCollector()
+    world = World(timed=True, world_name="stores")
+    world.timing_collector = collector
+    world.add_processor(Read())
+
+    for _ in range(3):
+        world.process()
+
+    rows = {row["kind"]: row for row in collector.summaries()}
+    assert rows["world"]["world"] == "stores"
+    assert rows["world"]["count"] == 3
+    assert rows["processor"]["processor"] == "Read"
+    assert rows["processor"]["count"] == 3
+
+
+def test_prometheus_export():
+    collector = TimingCollector()
+    collector.record_world("stores", 0.5)
+    collector.record_processor("stores", 'read "csv"', 0.25)
+
+    lines = collector.to_prometheus().splitlines()
+
+    assert "# TYPE bspec_world_seconds summary" in lines
+    assert 'bspec_world_seconds{world="stores",quantile="0.99"} 0.5' in lines
+    assert (
+        'bspec_processor_seconds_count{world="stores",processor="read \\"csv\\""} 1'
+        in lines
+    )
+
+
+def test_exporter_writes_every_n_ticks_and_on_close(tmp_path):
+    collector = TimingCollector()
+    collector.record_world("stores", 0.5)
+    jsonl_path = str(tmp_path / "timings.jsonl")
+    prometheus_path = str(tmp_path / "bspec.prom")
+    exporter = TimingExporter(
+        collector,
+        jsonl_path=jsonl_path,
+        prometheus_path=prometheus_path,
+        export_every_ticks=2,
+    )
+
+    exporter.on_tick(1)
+    exporter.on_tick(2)
+    exporter.close()
+
+    with open(jsonl_path) as file:
+        rows = [json.loads(line) for line in file]
+    assert len(rows) == 2
+    assert rows[0]["world"] == "stores" and rows[0]["p50"] == 0.5
+    with open(prometheus_path) as file:
+        assert file.read() == collector.to_prometheus()
+
+
+def test_metrics_endpoint():
+    collector = TimingCollector()
+    collector.record_world("stores", 0.5)
+    exporter = TimingExporter(collector, prometheus_port=0)
+    try:
+        port = exporter.server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.read().decode("utf-8") == collector.to_prometheus()
+    finally:
+        exporter.close()
+
+
+@pytest.mark.parametrize("tick_loop", [None, {"rate": 1000, "max_ticks": 3}])
+def test_timed_universe_exports_the_timings(empty_galaxy, tmp_path, tick_loop):
+    jsonl_path = str(tmp_path / "timings.jsonl")
+    config = {
+        "processor_plugins": [],
+        "starting_world": "stores",
+        "galaxy": [{"world_name": "stores", "processors": [], "entities": []}],
+        "timing": {"jsonl_path": jsonl_path},
+    }
+    if tick_loop is not None:
+        config["tick_loop"] = tick_loop
+
+    universe.universe(config, timed=True)
+
+    with open(jsonl_path) as file:
+        rows = [json.loads(line) for line in file]
+    assert rows[-1]["world"] == "stores"
+    assert rows[-1]["count"] == (1 if tick_loop is None else 3)
@@ -0,0 +1,85 @@
+"""`World` runs processors that do not conflict in parallel, following the components
+each of them reads and writes."""
+
+import threading
+
+import esper
+
+from bspec.universe.processor_graph import (
+    build_processor_dependencies,
+    processors_conflict,
+)
+from bspec.universe.world import World
+
+
+class Stores:
+    pass
+
+
+class Sales:
+    pass
+
+
+class Record(esper.Processor):
+    def __init__(self, name, processed, reads=None, writes=None, barrier=None):
+        super().__init__()
+        self.name = name
+        self.processed = processed
+        self.reads = reads
+        self.writes = writes
+        self.barrier = barrier
+
+    def process(self):
+        if self.barrier is not None:
+            self.barrier.wait()
+        self.processed.append(self.name)
+
+
+def test_non_conflicting_processors_run_in_parallel():
+    barrier = threading.Barrier(2, timeout=5)
+    processed = []
+    world = World(parallel_processors=True, max_workers=2)
+    world.add_processor(
+        Record("stores", processed, writes=[Stores], barrier=barrier), priority=3
+    )
+    world.add_processor(
+        Record("sales", processed, writes=[Sales], barrier=barrier), priority=2
+    )
+    world.add_processor(
+        Record("join", processed, reads=[Stores, Sales], writes=[]), priority=1
+    )
+
+    world.process()
+
+    assert not barrier.broken
+    assert set(processed[:2]) == {"stores", "sales"}
+    assert processed[2] == "join"
+
+
+def test_undeclared_processors_keep_the_priority_order():
+    processed = []
+    world = World(parallel_processors=True, max_workers=4)
+    for priority, name in enumerate(["log", "report", "join", "read"]):
+        world.add_processor(Record(name, processed), priority=priority)
+
+    world.process()
+
+    assert processed == ["read", "join", "report", "log"]
+
+
+def test_processor_dependencies_follow_the_read_write_sets():
+    processors = [
+        Record("stores", [], writes=[Stores]),
+        Record("sales", [], writes=[Sales]),
+        Record("join", [], reads=[Stores, Sales], writes=[]),
+        Record("undeclared", []),
+    ]
+
+    assert build_processor_dependencies(processors) == {
+        0: [],
+        1: [],
+        2: [0, 1],
+        3: [0, 1, 2],
+    }
+    assert not processors_conflict((set(), set()), ({Stores}, set()))
+    assert processors_conflict(({Stores}, set()), (set(), {Stores}))